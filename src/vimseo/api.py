@@ -20,27 +20,54 @@
 #    INITIAL AUTHORS - API and implementation and/or documentation
 #        :author: Ludovic BARRIERE
 #    OTHER AUTHORS   - MACROSCOPIC CHANGES
+"""The high-level functions of VIMSEO.
+
+The factories of the models, tools, plots and metrics import many heavy packages.
+They are imported at the first call to a function using them,
+such that importing this module remains fast once GEMSEO is imported.
+Importing this module still imports GEMSEO,
+which imports the modules of its plugins, VIMSEO included,
+and configures the logger from the global configuration with :func:`.activate_logger`.
+"""
+
 from __future__ import annotations
 
 import logging
+from importlib import import_module
 from logging import _nameToLevel
 from typing import TYPE_CHECKING
+from typing import Any
 
 from gemseo import configure_logger
-from gemseo.utils.metrics.metric_factory import MetricFactory
 
 from vimseo.config.global_configuration import _configuration as configuration
-from vimseo.core.load_case_factory import LoadCaseFactory
-from vimseo.core.model_factory import ModelFactory
-from vimseo.core.model_settings import IntegratedModelSettings
-from vimseo.tools.post_tools.plot_factory import PlotFactory
-from vimseo.tools.tools_factory import ToolsFactory
 
 if TYPE_CHECKING:
     from vimseo.core.base_integrated_model import IntegratedModel
+    from vimseo.core.model_settings import IntegratedModelSettings
 
 LOGGER = logging.getLogger(__name__)
 
+_LAZY_ATTRIBUTES = {
+    "MetricFactory": "gemseo.utils.metrics.metric_factory",
+    "ModelFactory": "vimseo.core.model_factory",
+    "PlotFactory": "vimseo.tools.post_tools.plot_factory",
+    "ToolsFactory": "vimseo.tools.tools_factory",
+    "get_registry": "vimseo.core.model_registry",
+}
+"""The names of the attributes imported at first access, bound to their modules."""
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
+
 
 def activate_logger(level: int | None = None):
     if not level:
@@ -64,6 +91,8 @@ def create_model(
 
     Returns: An instance of an :class:`.IntegratedModel`.
     """
+    from vimseo.core.model_factory import ModelFactory
+
     if model_options:
         options = model_options.model_dump()
     return ModelFactory().create(model_name, load_case_name, **options)
@@ -72,38 +101,19 @@ def create_model(
 def get_available_load_cases(model_name: str) -> list[str]:
     """Find the load cases available for this model.
 
+    The compatibility between the models and the load cases is cached,
+    see :mod:`vimseo.core.model_registry`.
+
     Args:
         model_name: The model name.
 
     Returns:
         The load cases associated with the specified model.
     """
-    lc_factory = LoadCaseFactory()
-    model_class = ModelFactory().get_class(model_name)
-    domain = model_class._LOAD_CASE_DOMAIN
-    all_load_case_names = []
-    for class_name in lc_factory.class_names:
-        if domain != "" and class_name.startswith(domain):
-            class_name = class_name.removeprefix(f"{domain}_")
-        try:
-            lc = lc_factory.create(class_name, domain=domain)
-            all_load_case_names.append(lc.name)
-        except ImportError:
-            continue
-    # Remove duplicate names
-    load_case_names = list(set(all_load_case_names))
-    matching_load_case_names = []
-    for load_case_name in load_case_names:
-        try:
-            create_model(
-                model_name,
-                load_case_name,
-                IntegratedModelSettings(archive_manager="DirectoryArchive"),
-            )
-            matching_load_case_names.append(load_case_name)
-        except (ImportError, AttributeError):
-            continue
-    return sorted(matching_load_case_names)
+    from vimseo.core.model_factory import ModelFactory
+    from vimseo.core.model_registry import get_registry
+
+    return get_registry()[ModelFactory().get_class(model_name).__name__]
 
 
 def get_available_models(load_case: str = "") -> list[str]:
@@ -116,22 +126,22 @@ def get_available_models(load_case: str = "") -> list[str]:
     Returns:
         The list of names of the available models.
     """
-    mf = ModelFactory()
-    model_names = mf.class_names
+    from vimseo.core.model_factory import ModelFactory
+    from vimseo.core.model_registry import get_registry
+
     if load_case == "":
-        return model_names
-    model_to_lc = {}
-    for model_name in model_names:
-        model_to_lc[model_name] = get_available_load_cases(model_name)
-    models = []
-    for model, load_cases in model_to_lc.items():
-        if load_case in load_cases:
-            models.append(model)
-    return sorted(models)
+        return ModelFactory().class_names
+    return sorted(
+        model_name
+        for model_name, load_case_names in get_registry().items()
+        if load_case in load_case_names
+    )
 
 
 def get_available_plots():
     """The available plots, deriving from ``Plotter``."""
+    from vimseo.tools.post_tools.plot_factory import PlotFactory
+
     class_names = PlotFactory().class_names
     class_names.remove("Plotter")
     return class_names
@@ -139,12 +149,16 @@ def get_available_plots():
 
 def get_available_metrics():
     """The available comparison metrics."""
+    from gemseo.utils.metrics.metric_factory import MetricFactory
+
     return MetricFactory().class_names
     # class_names.remove("BaseMetrics")
 
 
 def get_available_tools():
     """The available tools."""
+    from vimseo.tools.tools_factory import ToolsFactory
+
     class_names = ToolsFactory().class_names
     class_names.remove("BaseTool")
     return class_names
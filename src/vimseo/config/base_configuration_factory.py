@@ -17,13 +17,58 @@
 
 from __future__ import annotations
 
+from importlib.metadata import entry_points
+from importlib.util import find_spec
+from typing import ClassVar
+
 from gemseo.core.base_factory import BaseFactory
 
 from vimseo.config.base_configuration import BaseConfiguration
 
 
 class BaseConfigurationFactory(BaseFactory):
-    """A factory of configurations."""
+    """A factory of configurations.
+
+    The configurations of the plugins are searched in their ``config`` sub-package
+    only, such that the modules of the plugins are not all imported when loading the
+    global configuration.
+    The plugins without a ``config`` sub-package,
+    e.g. the plugins of GEMSEO which are not plugins of VIMSEO,
+    are not searched.
+    """
 
     _CLASS = BaseConfiguration
-    _PACKAGE_NAMES = ("vimseo.config",)
+
+    PLUGIN_ENTRY_POINT: ClassVar[str] = "vimseo_configuration_plugins"
+    """The name of the setuptools entry point for declaring plugins.
+
+    The plugins declared with the entry point of GEMSEO are handled through
+    :attr:`._PACKAGE_NAMES`.
+    """
+
+    @property
+    def _PACKAGE_NAMES(self) -> tuple[str, ...]:  # noqa: N802
+        return (
+            "vimseo.config",
+            *(
+                package_name
+                for entry_point in entry_points(group=BaseFactory.PLUGIN_ENTRY_POINT)
+                if entry_point.value != "vimseo"
+                and self.__has_package(package_name := f"{entry_point.value}.config")
+            ),
+        )
+
+    @staticmethod
+    def __has_package(package_name: str) -> bool:
+        """Check whether a package exists.
+
+        Args:
+            package_name: The name of the package.
+
+        Returns:
+            Whether the package exists.
+        """
+        try:
+            return find_spec(package_name) is not None
+        except (ImportError, ValueError):
+            return False
@@ -60,6 +60,12 @@ class VimseoSettings(
         "results are exported under this path.",
     )
 
+    cache_directory: str = Field(
+        default="",
+        description="The directory of the files cached by VIMSEO between processes. "
+        "If left to empty string, the cache directory of the user is used.",
+    )
+
     archive_manager: str = Field(
         default="DirectoryArchive", description="The archive manager"
     )
@@ -0,0 +1,198 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""A factory caching on disk the classes it discovers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections import UserDict
+from importlib import import_module
+from importlib.metadata import entry_points
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+from typing import TypeVar
+from uuid import uuid4
+
+from gemseo.core.base_factory import BaseFactory
+from gemseo.core.base_factory import _ClassInfo
+
+from vimseo import __version__
+from vimseo.utilities.file_utils import get_cache_directory
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=object)
+
+DIRECTORY_NAME = "factories"
+"""The name of the directory of the discovery caches in the cache directory."""
+
+
+class _LazyClassInfos(UserDict):
+    """The class names bound to the class information.
+
+    The values are either a :class:`._ClassInfo`
+    or the names of the module and the library of a class not imported yet,
+    in which case the module is imported at first access.
+    """
+
+    def __getitem__(self, name: str) -> _ClassInfo:
+        class_info = super().__getitem__(name)
+        if isinstance(class_info, _ClassInfo):
+            return class_info
+
+        module_name, library_name = class_info
+        try:
+            cls = getattr(import_module(module_name), name)
+        except AttributeError as err:
+            msg = f"The class {name} cannot be found in the module {module_name}."
+            raise ImportError(msg) from err
+
+        class_info = self[name] = _ClassInfo(cls, library_name)
+        return class_info
+
+
+class BaseCachedFactory(BaseFactory[T]):
+    """A factory caching on disk the classes it discovers.
+
+    The first discovery imports all the modules of the searched packages,
+    then the names of the classes and of their modules are cached in a file of
+    the cache directory of VIMSEO.
+    The next processes read this file,
+    and import only the modules of the classes they use.
+
+    The cache is invalidated when a version of VIMSEO or of a plugin changes,
+    or when a module of the searched packages is added, removed or modified.
+    The cache is not used when the search paths are defined by the environment
+    variable ``GEMSEO_PATH``.
+    """
+
+    def update(self) -> None:  # noqa: D102
+        key = self.cache_key
+        if key is None:
+            super().update()
+            return
+
+        file_path = self.cache_file_path
+        try:
+            data = json.loads(file_path.read_text())
+        except (OSError, ValueError):
+            data = {}
+
+        if data.get("key") == key:
+            self._names_to_class_info = _LazyClassInfos(data["classes"])
+            return
+
+        super().update()
+        self.__write_cache(
+            file_path,
+            {
+                "key": key,
+                "classes": {
+                    name: (class_info.class_.__module__, class_info.library_name)
+                    for name, class_info in self._names_to_class_info.items()
+                },
+            },
+        )
+
+    @property
+    def cache_file_path(self) -> Path:
+        """The path to the file caching the discovered classes."""
+        cls = self.__class__
+        return (
+            get_cache_directory()
+            / DIRECTORY_NAME
+            / f"{cls.__module__}.{cls.__name__}.json"
+        )
+
+    @property
+    def cache_key(self) -> dict[str, Any] | None:
+        """The key identifying the state of the searched packages.
+
+        This key gathers the versions of VIMSEO and of the plugins,
+        and a hash of the paths, sizes and modification times of the modules.
+        It is ``None`` when the search paths are defined by the environment
+        variable ``GEMSEO_PATH``.
+        """
+        if os.environ.get(self._ENV_VAR_WITH_SEARCH_PATHS) is not None:
+            return None
+
+        package_names = list(self._PACKAGE_NAMES)
+        versions = {}
+        for entry_point in entry_points(group=self.PLUGIN_ENTRY_POINT):
+            package_names.append(entry_point.value)
+            if entry_point.dist is not None:
+                versions[entry_point.dist.name] = entry_point.dist.version
+        versions["vimseo"] = __version__
+
+        file_hash = hashlib.sha256()
+        for package_name in package_names:
+            for file_path in sorted(self.__get_module_paths(package_name)):
+                stat = file_path.stat()
+                file_hash.update(
+                    f"{file_path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode()
+                )
+
+        return {"versions": versions, "modules": file_hash.hexdigest()}
+
+    @staticmethod
+    def __get_module_paths(package_name: str) -> list[Path]:
+        """Return the paths to the modules of a package, without importing them.
+
+        Args:
+            package_name: The name of the package.
+
+        Returns:
+            The paths to the modules.
+        """
+        try:
+            spec = find_spec(package_name)
+        except (ImportError, ValueError):
+            spec = None
+
+        if spec is None:
+            return []
+
+        if not spec.submodule_search_locations:
+            return [Path(spec.origin)] if spec.origin else []
+
+        return [
+            file_path
+            for directory in spec.submodule_search_locations
+            for file_path in Path(directory).rglob("*.py")
+        ]
+
+    @staticmethod
+    def __write_cache(file_path: Path, data: dict[str, Any]) -> None:
+        """Write the cache file atomically.
+
+        Args:
+            file_path: The path to the cache file.
+            data: The data to cache.
+        """
+        temporary_path = file_path.with_name(f"{file_path.name}.{uuid4().hex}.tmp")
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_text(json.dumps(data))
+            temporary_path.replace(file_path)
+        except OSError as err:
+            temporary_path.unlink(missing_ok=True)
+            LOGGER.debug(
+                f"The discovered classes cannot be cached in {file_path}: {err!s}"
+            )
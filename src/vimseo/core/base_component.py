@@ -27,6 +27,8 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     from pathlib import Path
 
+    from gemseo.typing import StrKeyMapping
+
     from vimseo.material.material import Material
 
 LOGGER = logging.getLogger(__name__)
@@ -48,6 +50,10 @@ class BaseComponent(GemseoDisciplineWrapper):
     """List of files produced in the scratch directory, to be copied to the archive
     directory."""
 
+    SUPPORTS_BATCH_RUN: ClassVar[bool] = False
+    """Whether the component computes the outputs of several input samples at once
+    with :meth:`._run_batch`."""
+
     def __init__(
         self,
         load_case_name: str,
@@ -88,6 +94,22 @@ class BaseComponent(GemseoDisciplineWrapper):
                 for name, value in material.get_values_as_dict().items()
             })
 
+    def _run_batch(self, input_data: Sequence[StrKeyMapping]) -> list[StrKeyMapping]:
+        """Compute the outputs of several input samples at once.
+
+        By default, the samples are computed one by one with :meth:`._run`.
+        The components whose :attr:`.SUPPORTS_BATCH_RUN` is ``True``
+        shall override this method with a vectorized computation.
+
+        Args:
+            input_data: The input data of the samples,
+                completed with the default input data.
+
+        Returns:
+            The output data of the samples.
+        """
+        return [self._run(input_data=data) for data in input_data]
+
     @property
     def job_directory(self):
         return self._job_directory
@@ -33,6 +33,10 @@ class BaseDisciplineModel(IntegratedModel):
     _DISCIPLINE: ClassVar[Discipline | None] = None
     _EXPECTED_LOAD_CASE: ClassVar[str] = ""
 
+    @classmethod
+    def is_compatible_with(cls, load_case_name: str) -> bool:  # noqa: D102
+        return load_case_name == cls._EXPECTED_LOAD_CASE
+
     def __init__(self, load_case_name: str = "Dummy", **options):
         options = IntegratedModelSettings(**options).model_dump()
         if load_case_name != self._EXPECTED_LOAD_CASE:
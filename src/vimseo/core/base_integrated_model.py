@@ -15,28 +15,27 @@
 
 from __future__ import annotations
 
-import getpass
 import logging
-import socket
-import subprocess
 import sys
 from collections import defaultdict
+from contextlib import contextmanager
 from copy import copy
 from copy import deepcopy
 from dataclasses import asdict
 from datetime import datetime
-from os import getlogin
+from functools import partial
 from pathlib import Path
 from re import match
-from subprocess import CalledProcessError
 from time import time
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import ClassVar
 
 import numpy as np
+from gemseo.caches.hdf5_cache import HDF5Cache
+from gemseo.caches.memory_full_cache import MemoryFullCache
 from gemseo.caches.simple_cache import SimpleCache
 from gemseo.core.chains.chain import MDOChain
-from gemseo.core.discipline.base_discipline import CacheType
 from gemseo.core.discipline.discipline import Discipline
 from gemseo.core.execution_status import ExecutionStatus
 from gemseo.core.grammars.json_grammar import JSONGrammar
@@ -50,6 +49,14 @@ from numpy import inf
 from pandas import DataFrame
 from strenum import StrEnum
 
+from vimseo.core.batch_execution import BatchBackend
+from vimseo.core.batch_execution import execute_samples
+from vimseo.core.caches import ModelCacheType
+from vimseo.core.caches.archive_sync import ArchiveSyncManifest
+from vimseo.core.caches.indexed_cache import IndexedCache
+from vimseo.core.caches.lru_cache import LRUCache
+from vimseo.core.caches.sharded_cache import ShardedCache
+from vimseo.core.components.component_factory import ComponentFactory
 from vimseo.core.gemseo_discipline_wrapper import GemseoDisciplineWrapper
 from vimseo.core.load_case_factory import LoadCaseFactory
 from vimseo.core.model_description import ModelDescription
@@ -57,22 +64,29 @@ from vimseo.core.model_metadata import DEFAULT_METADATA
 from vimseo.core.model_metadata import MetaData
 from vimseo.core.model_metadata import MetaDataNames
 from vimseo.core.model_settings import IntegratedModelSettings
+from vimseo.core.persistency_writer import PersistencyWriter
+from vimseo.core.provenance import get_provenance
 from vimseo.material.material import Material
-from vimseo.storage_management import NAME_TO_ARCHIVE_CLASS
+from vimseo.storage_management import ArchiveManager
+from vimseo.storage_management import get_archive_class
 from vimseo.storage_management.scratch_storage import DirectoryScratch
 from vimseo.utilities.json_grammar_utils import load_input_bounds
 from vimseo.utilities.plotting_utils import plot_curves
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Iterable
+    from collections.abc import Iterator
     from collections.abc import Mapping
     from collections.abc import Sequence
 
-    from gemseo.caches.hdf5_cache import HDF5Cache
+    from gemseo.typing import StrKeyMapping
     from plotly.graph_objs import Figure
 
     from vimseo.core.components.external_software_component import BaseComponent
     from vimseo.core.load_case import LoadCase
+    from vimseo.storage_management.base_archive_storage import BaseArchiveManager
+    from vimseo.storage_management.base_archive_storage import ModelDataType
     from vimseo.storage_management.directory_storage import DirectoryArchive
 
 LOGGER = logging.getLogger(__name__)
@@ -161,11 +175,14 @@ class IntegratedModel(GemseoDisciplineWrapper):
     __load_case: LoadCase
     """The load case."""
 
-    _archive_manager: DirectoryArchive
-    """Storage system for the archive files."""
+    _archive_manager: DirectoryArchive | None
+    """Storage system for the archive files, or ``None`` for an ephemeral model."""
 
-    _scratch_manager: DirectoryScratch
-    """Storage system for the scratch files."""
+    _scratch_manager: DirectoryScratch | None
+    """Storage system for the scratch files, or ``None`` for an ephemeral model."""
+
+    _persistency_writer: PersistencyWriter | None
+    """The writer of the results if the persistency is asynchronous."""
 
     job_description: str = ""
     """Free string description of the job to be executed, to be passed as a metadata
@@ -211,6 +228,15 @@ class IntegratedModel(GemseoDisciplineWrapper):
     ``{_LOAD_CASE_DOMAIN}_{load_case_name}`` instead of ``{load_case_name}``.
     """
 
+    _LOAD_CASE_COMPONENT_FAMILIES: ClassVar[Sequence[str]] = ()
+    """The families of the components specific to a load case.
+
+    The model is compatible with a load case ``{load_case_name}`` if
+    the components ``{family}_{load_case_name}`` exist for all these families.
+    If empty,
+    the compatibility is checked by instantiating the model.
+    """
+
     auto_detect_grammar_files = False
     default_cache_type = Discipline.CacheType.HDF5
     default_grammar_type = Discipline.GrammarType.JSON
@@ -222,6 +248,7 @@ class IntegratedModel(GemseoDisciplineWrapper):
         **options,
     ):
         options = IntegratedModelSettings(**options).model_dump()
+        self._options = options
         self.name = self.__class__.__name__
         self.__material = (
             Material.from_json(self.MATERIAL_FILE) if self.MATERIAL_FILE != "" else None
@@ -230,18 +257,21 @@ class IntegratedModel(GemseoDisciplineWrapper):
             load_case_name, domain=self._LOAD_CASE_DOMAIN
         )
 
+        self._ephemeral = options["ephemeral"]
+        self._cache_type = (
+            ModelCacheType.MEMORY if self._ephemeral else options["cache_type"]
+        )
         if options["cache_file_path"] != "":
             self._cache_file_path = options["cache_file_path"]
-            Path(self._cache_file_path).parent.mkdir(parents=True, exist_ok=True)
+            if self._cache_type != ModelCacheType.MEMORY:
+                Path(self._cache_file_path).parent.mkdir(parents=True, exist_ok=True)
+        elif self._cache_type == ModelCacheType.SHARDED:
+            self._cache_file_path = f"{self.name}_{self.__load_case.name}_cache"
         else:
             self._cache_file_path = f"{self.name}_{self.__load_case.name}_cache.hdf"
 
         super().__init__(name=self.__class__.__name__)
-        self.set_cache(
-            cache_type=Discipline.CacheType.HDF5,
-            hdf_file_path=self._cache_file_path,
-            hdf_node_path="node",
-        )
+        self._set_model_cache(self._cache_file_path)
 
         self._job_name = options["job_name"]
 
@@ -250,30 +280,19 @@ class IntegratedModel(GemseoDisciplineWrapper):
         self._datetime = datetime.today()
 
         self._chain = MDOChain(components)
+        if self._ephemeral and self._whether_use_scratch_dir():
+            msg = (
+                f"The model {self.name} cannot be ephemeral "
+                "because a component uses a job directory."
+            )
+            raise ValueError(msg)
 
-        self._scratch_manager = DirectoryScratch(
-            root_directory=Path(options["directory_scratch_root"]),
-            persistency=options["directory_scratch_persistency"],
-            job_name=self._job_name,
-            model_name=self.__class__.__name__,
-            load_case_name=self.__load_case.name,
-        )
-
-        archive_options = {
-            "persistency": options["directory_archive_persistency"],
-            "model_name": self.name,
-            "load_case_name": self.__load_case.name,
-            "root_directory": Path(options["directory_archive_root"]),
-            "job_name": self._job_name,
-            "persistent_file_names": [
-                names
-                for c in self._chain.disciplines
-                for names in c._PERSISTENT_FILE_NAMES
-            ],
-        }
-        self._archive_manager = NAME_TO_ARCHIVE_CLASS[options["archive_manager"]](
-            **archive_options
-        )
+        if self._ephemeral:
+            self._scratch_manager = None
+            self._archive_manager = None
+            self._persistency_writer = None
+        else:
+            self.__create_storage_managers(options)
 
         output_names = self._chain.disciplines[-1].output_grammar.names
         self._chain.output_grammar.restrict_to(output_names)
@@ -326,6 +345,82 @@ class IntegratedModel(GemseoDisciplineWrapper):
         # executions of the model instance.
         self._chain.exec_time = 0.0
 
+    def __create_storage_managers(self, options: Mapping[str, Any]) -> None:
+        """Create the scratch and archive managers and the persistency writer.
+
+        Args:
+            options: The options of the model.
+        """
+        self._scratch_manager = DirectoryScratch(
+            root_directory=Path(options["directory_scratch_root"]),
+            persistency=options["directory_scratch_persistency"],
+            job_name=self._job_name,
+            model_name=self.__class__.__name__,
+            load_case_name=self.__load_case.name,
+        )
+
+        archive_options = {
+            "persistency": options["directory_archive_persistency"],
+            "model_name": self.name,
+            "load_case_name": self.__load_case.name,
+            "root_directory": Path(options["directory_archive_root"]),
+            "job_name": self._job_name,
+            "persistent_file_names": [
+                names
+                for c in self._chain.disciplines
+                for names in c._PERSISTENT_FILE_NAMES
+            ],
+            "array_size_threshold": options["archive_array_size_threshold"],
+            "file_transfer_method": options["persistent_file_transfer_method"],
+        }
+        if options["archive_manager"] == ArchiveManager.Directory:
+            archive_options["deduplicate_files"] = options["archive_deduplicate_files"]
+            archive_options["index_results"] = options["archive_index_results"]
+        self._archive_manager = get_archive_class(options["archive_manager"])(
+            **archive_options
+        )
+        for storage_manager in (self._scratch_manager, self._archive_manager):
+            storage_manager.job_directory_layout = options["job_directory_layout"]
+        self._persistency_writer = (
+            PersistencyWriter(options["persistency_queue_size"])
+            if options["async_persistency"]
+            else None
+        )
+
+    @classmethod
+    def is_compatible_with(cls, load_case_name: str) -> bool | None:
+        """Check from the class attributes whether the model supports a load case.
+
+        Args:
+            load_case_name: The name of the load case, without the domain.
+
+        Returns:
+            Whether the model supports the load case,
+            or ``None`` if it cannot be determined without instantiating the model.
+        """
+        if not cls._LOAD_CASE_COMPONENT_FAMILIES:
+            return None
+        return cls._has_load_case_components(
+            cls._LOAD_CASE_COMPONENT_FAMILIES, load_case_name
+        )
+
+    @staticmethod
+    def _has_load_case_components(families: Iterable[str], load_case_name: str) -> bool:
+        """Check whether components of given families exist for a load case.
+
+        Args:
+            families: The families of the components.
+            load_case_name: The name of the load case.
+
+        Returns:
+            Whether the components ``{family}_{load_case_name}`` exist.
+        """
+        class_names = ComponentFactory().class_names
+        return all(
+            f"{family}{ComponentFactory.SEP}{load_case_name}" in class_names
+            for family in families
+        )
+
     def _set_differentiated_names(self, component_with_jacobian):
         self._differentiated_input_names = (
             component_with_jacobian._differentiated_input_names
@@ -435,6 +530,17 @@ class IntegratedModel(GemseoDisciplineWrapper):
     def _run(self, input_data):
         start_time = time()
 
+        if self._ephemeral:
+            output_data = self._chain.execute(input_data)
+            self._run_time = time() - start_time
+            output_data.update(asdict(self.generate_metadata(output_data)))
+            return output_data
+
+        if self._job_name:
+            # The job directories are reused by each execution,
+            # so the results of the previous one must be written beforehand.
+            self.flush_persistency()
+
         if self._whether_use_scratch_dir():
             self._scratch_manager.create_job_directory()
             LOGGER.info(
@@ -483,6 +589,248 @@ class IntegratedModel(GemseoDisciplineWrapper):
 
         return output_data
 
+    def execute_batch(
+        self,
+        input_data: Sequence[StrKeyMapping],
+        n_processes: int = 1,
+        backend: BatchBackend = BatchBackend.PROCESS,
+        skip_failed: bool = False,
+        callback: Callable[[int, dict[str, np.ndarray]], Any] | None = None,
+    ) -> list[dict[str, np.ndarray]]:
+        """Execute the model on a batch of input samples.
+
+        The samples already in the cache are not executed again.
+        The other ones are spread over ``n_processes`` workers,
+        each worker executing its own clone of the model
+        in its own scratch and archive job directories.
+        The results are then stored in the cache of the model in submission order.
+
+        With the vectorized backend,
+        the samples are executed sequentially by the model itself,
+        but the first component supporting batch runs computes its outputs
+        for all the samples at once beforehand.
+        The results of the samples are still archived one by one,
+        but in a background thread,
+        such that the writing of a result overlaps the execution of the next sample.
+
+        Args:
+            input_data: The input data of the samples.
+                Each sample is completed with the default input data.
+            n_processes: The number of workers.
+                If ``1``, the samples are executed sequentially by the model itself.
+                Unused by the vectorized backend.
+            backend: The backend spreading the samples over the workers.
+            skip_failed: Whether to return an empty dictionary for the samples
+                whose execution failed, instead of raising the error.
+            callback: A function called with the index of a sample and its input and
+                output data as soon as its execution succeeds,
+                e.g. to store the samples of a long batch as they come.
+                If ``None``, do not call any function.
+
+        Returns:
+            The input and output data of the samples, in submission order.
+        """
+        samples = [self.io.prepare_input_data(data) for data in input_data]
+        execute_sample = self.__execute_or_skip if skip_failed else self.execute
+
+        def execute(index: int) -> dict[str, np.ndarray]:
+            """Execute the model on a sample.
+
+            Args:
+                index: The index of the sample.
+
+            Returns:
+                The input and output data of the sample.
+            """
+            data = dict(execute_sample(samples[index]))
+            if data and callback is not None:
+                callback(index, data)
+            return data
+
+        if n_processes == 1 and backend != BatchBackend.VECTORIZED:
+            return [execute(index) for index in range(len(samples))]
+
+        indices_to_execute = [
+            index
+            for index, sample in enumerate(samples)
+            if self.cache is None or not self.cache[sample].outputs
+        ]
+        if backend == BatchBackend.VECTORIZED:
+            with (
+                self._prefetch_batch_run([
+                    samples[index] for index in indices_to_execute
+                ]),
+                self.__write_results_in_background(),
+            ):
+                return [execute(index) for index in range(len(samples))]
+
+        LOGGER.info(
+            f"Executing {len(indices_to_execute)} samples out of {len(samples)} "
+            f"with {n_processes} workers ({backend} backend)."
+        )
+        executed_data = (
+            execute_samples(
+                self,
+                [samples[index] for index in indices_to_execute],
+                n_processes,
+                backend,
+                skip_failed=skip_failed,
+                callback=None
+                if callback is None
+                else lambda index, data: callback(indices_to_execute[index], data),
+            )
+            if indices_to_execute
+            else []
+        )
+
+        results = [None] * len(samples)
+        for index, data in zip(indices_to_execute, executed_data, strict=True):
+            if data is None:
+                data = {}
+            elif self.cache is not None:
+                self._cache_batch_result(samples[index], data)
+            results[index] = data
+
+        for index in range(len(samples)):
+            if results[index] is None:
+                results[index] = execute(index)
+
+        return results
+
+    def __execute_or_skip(self, input_data: StrKeyMapping) -> StrKeyMapping:
+        """Execute the model, returning empty data if the execution fails.
+
+        Args:
+            input_data: The input data.
+
+        Returns:
+            The input and output data, or empty data if the execution failed.
+        """
+        try:
+            return self.execute(input_data)
+        except Exception:
+            LOGGER.exception(f"The execution of {self.name} failed.")
+            self._reset_execution_status()
+            return {}
+
+    def _reset_execution_status(self) -> None:
+        """Set the status of the model and of its disciplines to ``DONE``.
+
+        This allows to execute the model again after a failed execution.
+        """
+        for discipline in (self, self._chain, *self._chain.disciplines):
+            discipline.execution_status.value = ExecutionStatus.Status.DONE
+
+    @contextmanager
+    def __write_results_in_background(self) -> Iterator[None]:
+        """Write the results in a background thread while the context is active.
+
+        The pending results are written at exit.
+        Nothing changes when the model is ephemeral
+        or when the persistency is already asynchronous.
+        """
+        if self._ephemeral or self._persistency_writer is not None:
+            yield
+            return
+
+        self._persistency_writer = PersistencyWriter()
+        try:
+            with self._persistency_writer:
+                yield
+        finally:
+            writer, self._persistency_writer = self._persistency_writer, None
+            writer.close()
+
+    @contextmanager
+    def _prefetch_batch_run(self, samples: Sequence[StrKeyMapping]) -> Iterator[None]:
+        """Compute the outputs of a component for several samples at once.
+
+        The first component supporting batch runs computes its outputs for all the
+        samples, whose inputs are computed by executing the upstream components.
+        These outputs are stored in a memory cache of the component,
+        which is used while the context is active,
+        as well as those of the upstream components,
+        so that the model does not execute the upstream components again.
+        Nothing is computed when no component supports batch runs,
+        or when a component uses a job directory,
+        which exists only during the execution of the model.
+
+        Args:
+            samples: The input data of the samples,
+                completed with the default input data.
+        """
+        components = self._chain.disciplines
+        batch_index = next(
+            (
+                index
+                for index, component in enumerate(components)
+                if component.SUPPORTS_BATCH_RUN
+            ),
+            None,
+        )
+        if (
+            batch_index is None
+            or not samples
+            or any(c.USE_JOB_DIRECTORY for c in components[: batch_index + 1])
+        ):
+            yield
+            return
+
+        component = components[batch_index]
+        caches = {}
+        local_data = [dict(sample) for sample in samples]
+        for upstream_component in components[:batch_index]:
+            cache = caches[upstream_component] = MemoryFullCache(
+                name=upstream_component.name
+            )
+            for data in local_data:
+                input_data = upstream_component.io.prepare_input_data(data)
+                output_data = upstream_component.execute(input_data)
+                output_data = {
+                    name: output_data[name]
+                    for name in upstream_component.io.output_grammar.names
+                }
+                cache.cache_outputs(input_data, output_data)
+                data.update(output_data)
+
+        component_input_data = [
+            component.io.prepare_input_data(data) for data in local_data
+        ]
+        cache = caches[component] = MemoryFullCache(name=component.name)
+        for input_data, output_data in zip(
+            component_input_data,
+            component._run_batch(component_input_data),
+            strict=True,
+        ):
+            cache.cache_outputs(input_data, output_data)
+
+        LOGGER.info(f"Outputs of {component.name} computed for {len(samples)} samples.")
+        initial_caches = {c: c.cache for c in caches}
+        for c, cache in caches.items():
+            c.cache = cache
+        try:
+            yield
+        finally:
+            for c, initial_cache in initial_caches.items():
+                c.cache = initial_cache
+
+    def _cache_batch_result(
+        self, input_data: StrKeyMapping, data: StrKeyMapping
+    ) -> None:
+        """Store the result of a sample executed by a batch worker in the cache.
+
+        Args:
+            input_data: The input data of the sample.
+            data: The input and output data of the sample.
+        """
+        output_data = {name: data[name] for name in self.output_grammar.names}
+        if not isinstance(self.cache, SimpleCache):
+            to_array = self.input_grammar.data_converter.convert_value_to_array
+            input_data = {name: to_array(name, v) for name, v in input_data.items()}
+            to_array = self.output_grammar.data_converter.convert_value_to_array
+            output_data = {name: to_array(name, v) for name, v in output_data.items()}
+        self.cache.cache_outputs(input_data, output_data)
+
     def _compute_jacobian(
         self,
         input_names: Iterable[str] = (),
@@ -661,9 +1009,11 @@ class IntegratedModel(GemseoDisciplineWrapper):
     def scratch_job_directory(self) -> Path | str:
         """The Path to the scratch job directory, once the model is executed.
 
-        Before model execution, or if the model uses the cache, the empty string is
-        returned.
+        Before model execution, if the model uses the cache, or if the model is
+        ephemeral, the empty string is returned.
         """
+        if self._scratch_manager is None:
+            return ""
 
         return self._scratch_manager.job_directory
 
@@ -707,29 +1057,51 @@ class IntegratedModel(GemseoDisciplineWrapper):
         }
 
     def generate_metadata(self, output_data_raw) -> MetaData:
+        """Generate the metadata of the current execution.
+
+        The static facts, e.g. the git version, the user and the machine,
+        are resolved once per process by :func:`.get_provenance`.
 
+        Args:
+            output_data_raw: The output data of the chain of components.
+
+        Returns:
+            The metadata.
+        """
         if self._chain.execution_status.value != ExecutionStatus.Status.DONE:
             error = 1
         else:
             error = output_data_raw[MetaDataNames.error_code][0]
 
-        here = str(Path(__file__).parent)
-        try:
-            vims_git_version = (
-                subprocess
-                .check_output(["git", "-C", here, "rev-parse", "HEAD"])
-                .decode("utf-_8")
-                .strip()
-            )
-        except CalledProcessError:
-            LOGGER.warning(
-                "Model metadata: git is not available, git commit cannot be determined."
+        provenance = get_provenance()
+        if self._ephemeral:
+            persistent_file_names = ()
+            directories = dict.fromkeys(
+                (
+                    MetaDataNames.directory_archive_root,
+                    MetaDataNames.directory_archive_job,
+                    MetaDataNames.directory_scratch_root,
+                    MetaDataNames.directory_scratch_job,
+                ),
+                "",
             )
-            vims_git_version = ""
-        if sys.platform.startswith("win"):
-            user = getlogin()
         else:
-            user = getpass.getuser()
+            persistent_file_names = self._archive_manager.persistent_file_names
+            directories = {
+                MetaDataNames.directory_archive_root: str(
+                    self._archive_manager._root_directory.resolve()
+                ),
+                MetaDataNames.directory_archive_job: str(
+                    self._archive_manager.job_directory
+                ),
+                MetaDataNames.directory_scratch_root: str(
+                    self._scratch_manager._root_directory.resolve()
+                ),
+                MetaDataNames.directory_scratch_job: str(
+                    self._scratch_manager.job_directory
+                ),
+            }
+
         return MetaData(**{
             MetaDataNames.model: array([self.__class__.__name__]),
             MetaDataNames.load_case: array([self.__load_case.name]),
@@ -740,57 +1112,102 @@ class IntegratedModel(GemseoDisciplineWrapper):
             # this variable is not stored in the cache.
             MetaDataNames.persistent_result_files: (
                 array([""])
-                if len(self._archive_manager.persistent_file_names) == 0
-                else array(self._archive_manager.persistent_file_names)
+                if len(persistent_file_names) == 0
+                else array(persistent_file_names)
             ),
             MetaDataNames.n_cpus: array([
                 self.n_cpus if hasattr(self, "n_cpus") else 0
             ]),
             MetaDataNames.date: array([datetime.today().isoformat(" ")]),
             MetaDataNames.cpu_time: array([self._run_time]),
-            MetaDataNames.user: array([user]),
-            MetaDataNames.machine: array([str(socket.gethostname())]),
-            MetaDataNames.vims_git_version: array([vims_git_version]),
-            MetaDataNames.directory_archive_root: array([
-                str(self._archive_manager._root_directory.resolve())
-            ]),
-            MetaDataNames.directory_archive_job: array([
-                str(self._archive_manager.job_directory)
-            ]),
-            MetaDataNames.directory_scratch_root: array([
-                str(self._scratch_manager._root_directory.resolve())
-            ]),
-            MetaDataNames.directory_scratch_job: array([
-                str(self._scratch_manager.job_directory)
-            ]),
+            MetaDataNames.user: array([provenance.user]),
+            MetaDataNames.machine: array([provenance.machine]),
+            MetaDataNames.vims_git_version: array([provenance.vims_git_version]),
+            **{name: array([directory]) for name, directory in directories.items()},
         })
 
-    def create_cache_from_archive(self, run_ids: Iterable[str] = ()) -> HDF5Cache:
-        """Defines a temporary HDF5 cache file, based on results found on the current
-        archive."""
+    def create_cache_from_archive(
+        self, run_ids: Iterable[str] = (), full_rebuild: bool = False
+    ) -> IndexedCache:
+        """Defines a temporary cache, based on results found on the current archive.
+
+        The cache is of the cache type of the model,
+        e.g. an HDF5 cache file or a sharded cache directory,
+        wrapped into an :class:`.IndexedCache` finding the results within a tolerance.
+
+        A manifest of the imported runs is stored next to the cache,
+        such that a later call only lists and imports the runs created or modified
+        since the last synchronization.
+        The cache is rebuilt from scratch if one of these runs has already been
+        imported with another version, or if the archive has changed.
+        The removal of a run is detected only by a full rebuild.
+
+        Args:
+            run_ids: The IDs of the runs to import.
+                If empty, import all the runs of the current experiment.
+            full_rebuild: Whether to rebuild the cache from scratch.
+
+        Returns:
+            The cache of the model.
+
+        Raises:
+            ValueError: When the model is ephemeral.
+        """
+        if self._ephemeral:
+            msg = f"The ephemeral model {self.name} has no archive."
+            raise ValueError(msg)
 
         # cache file preparation
         cache_dir_path = Path(self._cache_file_path).parent
-        self._cache_file_path = Path(
-            cache_dir_path
-            / f"{self.__class__.__name__}_{self.__load_case.name}_from_archive.hdf"
-        )
-        self._cache_file_path.unlink(
-            missing_ok=True
-        )  # delete possible old tmp cache file
+        cache_name = f"{self.__class__.__name__}_{self.__load_case.name}_from_archive"
+        if self._cache_type == ModelCacheType.SHARDED:
+            self._cache_file_path = cache_dir_path / cache_name
+        else:
+            self._cache_file_path = cache_dir_path / f"{cache_name}.hdf"
+        manifest_path = cache_dir_path / f"{cache_name}_sync.json"
+
+        archive = f"{self._archive_manager.uri}/{self._archive_manager.experiment_name}"
+        sync_time = time()
+        manifest = ArchiveSyncManifest.from_file(manifest_path)
+        run_ids_to_import = None
+        if (
+            not full_rebuild
+            and manifest is not None
+            and manifest.archive == archive
+            and self._cache_file_path.exists()
+        ):
+            # Only the runs created or modified since the last synchronization.
+            run_versions = self._archive_manager.get_run_versions(
+                run_ids, start_time=manifest.start_time
+            )
+            run_ids_to_import = manifest.get_runs_to_import(run_versions)
+
+        if run_ids_to_import is None:
+            run_versions = self._archive_manager.get_run_versions(run_ids)
+            # delete possible old tmp cache
+            if self._cache_type == ModelCacheType.SHARDED:
+                if self._cache_file_path.is_dir():
+                    ShardedCache(directory_path=self._cache_file_path).clear()
+            else:
+                self._cache_file_path.unlink(missing_ok=True)
+            manifest = ArchiveSyncManifest(archive)
+            run_ids_to_import = list(run_versions)
+        else:
+            LOGGER.info(
+                "Importing %s new runs of %s into the cache synchronized with it.",
+                len(run_ids_to_import),
+                archive,
+            )
+
         # note that tolerance is important for now: see issue #233.
+        self._set_model_cache(self._cache_file_path, tolerance=1.0e-10)
 
-        self.set_cache(
-            cache_type=Discipline.CacheType.HDF5,
-            hdf_file_path=self._cache_file_path,
-            hdf_node_path="node",
-            tolerance=1.0e-10,
+        results = (
+            self._archive_manager.get_archived_results(run_ids=run_ids_to_import)
+            if run_ids_to_import
+            else ()
         )
 
-        results = self._archive_manager.get_archived_results(run_ids=run_ids)
-        if results is None:
-            return None
-
         for result in results:
             if not isinstance(self.cache, SimpleCache):
                 to_array = self.output_grammar.data_converter.convert_value_to_array
@@ -803,36 +1220,133 @@ class IntegratedModel(GemseoDisciplineWrapper):
             # # append a cache entry with the current result
             # self.cache[result["inputs"]] = (result["outputs"], jacobian)
 
+        manifest.runs.update({
+            run_id: run_versions[run_id] for run_id in run_ids_to_import
+        })
+        manifest.last_sync_time = sync_time
+        manifest.to_file(manifest_path)
         return self.cache
 
     def _manage_persistency(self, output_data):
-        """Write results in archive."""
+        """Write results in archive.
+
+        When the persistency is asynchronous,
+        the results are written by the persistency writer with copies of the storage
+        managers bound to the current job directories.
+        """
 
         # TODO refactor when ModelResult is implemented
         result_model = {"inputs": self.get_input_data(), "outputs": output_data}
 
-        self._archive_manager.enforce_persistency_policy(result_model)
+        if self._persistency_writer is None:
+            self._enforce_persistency(
+                result_model, self._archive_manager, self._scratch_manager
+            )
+        else:
+            self._persistency_writer.submit(
+                partial(
+                    self._enforce_persistency,
+                    {
+                        "inputs": dict(result_model["inputs"]),
+                        "outputs": dict(output_data),
+                    },
+                    self._archive_manager.copy_for_current_job(),
+                    self._scratch_manager.copy_for_current_job(),
+                )
+            )
+
+    @staticmethod
+    def _enforce_persistency(
+        result_model: ModelDataType,
+        archive_manager: BaseArchiveManager,
+        scratch_manager: DirectoryScratch,
+    ) -> None:
+        """Apply the persistency policies to the results of a job.
+
+        Args:
+            result_model: The results of the job.
+            archive_manager: The archive manager of the job.
+            scratch_manager: The scratch manager of the job.
+        """
+        archive_manager.enforce_persistency_policy(result_model)
+
+        archive_manager.copy_persistent_files(
+            scratch_manager.job_directory,
+            delete_source=scratch_manager.whether_to_delete_job_directory(result_model),
+        )
+
+        scratch_manager.enforce_persistency_policy(result_model)
 
-        self._archive_manager.copy_persistent_files(self._scratch_manager.job_directory)
+    def flush_persistency(self) -> None:
+        """Wait for the results to be written, when the persistency is asynchronous.
 
-        self._scratch_manager.enforce_persistency_policy(result_model)
+        Raises:
+            BaseException: The first error raised while writing the results since the
+                last call.
+        """
+        if self._persistency_writer is not None:
+            self._persistency_writer.flush()
+
+    @property
+    def persistency_writer(self) -> PersistencyWriter | None:
+        """The writer of the results, if the persistency is asynchronous.
+
+        It can be used as a context manager waiting for the results to be written at
+        exit.
+        """
+        return self._persistency_writer
 
     def _whether_use_scratch_dir(self):
         return any(d.USE_JOB_DIRECTORY for d in self._chain.disciplines)
 
     @property
     def archive_manager(self):
-        """The archive manager."""
+        """The archive manager, or ``None`` for an ephemeral model."""
         return self._archive_manager
 
+    @property
+    def scratch_manager(self) -> DirectoryScratch | None:
+        """The scratch manager, or ``None`` for an ephemeral model."""
+        return self._scratch_manager
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """The options passed to the model constructor."""
+        return self._options
+
     def reset_cache(self, new_cache_path: str | Path):
         """Create a new cache with another file path.
 
-        Has an effect only for ``HDF5`` cache.
+        Has an effect only for ``HDF5`` and sharded caches.
         """
         self._cache_file_path = new_cache_path
-        self.set_cache(
-            cache_type=CacheType.HDF5,
-            hdf_file_path=self._cache_file_path,
-            hdf_node_path="node",
+        self._set_model_cache(self._cache_file_path)
+
+    def _set_model_cache(self, cache_path: str | Path, tolerance: float = 0.0) -> None:
+        """Set the cache of the model, according to the cache type of the model.
+
+        With a positive tolerance,
+        the entries are stored in a cache of this type without tolerance,
+        wrapped into an :class:`.IndexedCache` finding the entries within the
+        tolerance and recording the hits and misses.
+
+        Args:
+            cache_path: The path to the cache file, or to the cache directory for a
+                sharded cache. Unused by an in-memory cache.
+            tolerance: The cache tolerance.
+        """
+        if self._cache_type == ModelCacheType.SHARDED:
+            cache = ShardedCache(name=self.name, directory_path=cache_path)
+        elif self._cache_type == ModelCacheType.MEMORY:
+            cache = LRUCache(
+                name=self.name, max_size=self._options["memory_cache_size"]
+            )
+        else:
+            cache = HDF5Cache(
+                hdf_file_path=cache_path, hdf_node_path="node", name=self.name
+            )
+        self.cache = (
+            IndexedCache(cache, tolerance=tolerance, name=self.name)
+            if tolerance > 0.0
+            else cache
         )
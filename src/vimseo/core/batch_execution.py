@@ -0,0 +1,201 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""Helpers to execute an ``IntegratedModel`` on a batch of input samples.
+
+Each worker (process or thread) owns a clone of the model, built from the model class,
+its load case and its constructor options. The clones have no cache, such that a single
+process writes to the cache of the model, and their storage managers name the job
+directories with unique identifiers, such that concurrent workers never compete for
+the same job directory.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from typing import TYPE_CHECKING
+from typing import Any
+
+from gemseo.core.discipline.discipline import Discipline
+from gemseo.utils.directory_creator import DirectoryNamingMethod
+from strenum import StrEnum
+
+from vimseo.core.caches import ModelCacheType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    from numpy import ndarray
+
+    from vimseo.core.base_integrated_model import IntegratedModel
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BatchBackend(StrEnum):
+    """The backend used to spread the samples of a batch over workers."""
+
+    PROCESS = "process"
+    """A pool of processes."""
+
+    THREAD = "thread"
+    """A pool of threads, suited to models running an external software."""
+
+    VECTORIZED = "vectorized"
+    """A sequential execution,
+    whose component supporting batch runs computes the outputs of all the samples
+    at once."""
+
+
+_WORKER_STATE = threading.local()
+"""The state of a worker, holding its model clone.
+
+Each process of a pool has its own copy of this object, and each thread of a pool
+sees its own attributes.
+"""
+
+
+def create_worker_model(
+    model_class: type[IntegratedModel],
+    load_case_name: str,
+    options: Mapping[str, Any],
+) -> IntegratedModel:
+    """Create a clone of a model suited to a batch worker.
+
+    Args:
+        model_class: The class of the model.
+        load_case_name: The name of the load case.
+        options: The options of the model constructor.
+
+    Returns:
+        A model without cache and whose job directories are uniquely named.
+    """
+    # An in-memory cache avoids opening the cache file of the model in each worker.
+    model = model_class(
+        load_case_name, **{**options, "cache_type": ModelCacheType.MEMORY}
+    )
+    model.set_cache(Discipline.CacheType.NONE)
+    for storage_manager in (model.archive_manager, model.scratch_manager):
+        if storage_manager is not None:
+            storage_manager.directory_naming_method = DirectoryNamingMethod.UUID
+    return model
+
+
+def _initialize_worker(
+    model_class: type[IntegratedModel],
+    load_case_name: str,
+    options: Mapping[str, Any],
+    default_input_data: Mapping[str, ndarray],
+) -> None:
+    """Create the model clone of the current worker.
+
+    Args:
+        model_class: The class of the model.
+        load_case_name: The name of the load case.
+        options: The options of the model constructor.
+        default_input_data: The default input data of the model.
+    """
+    model = create_worker_model(model_class, load_case_name, options)
+    model.default_input_data.update(default_input_data)
+    _WORKER_STATE.model = model
+
+
+def _execute_sample(input_data: Mapping[str, ndarray]) -> dict[str, ndarray]:
+    """Execute the model clone of the current worker on a sample.
+
+    Args:
+        input_data: The input data of the sample.
+
+    Returns:
+        The input and output data of the sample.
+    """
+    model = _WORKER_STATE.model
+    try:
+        output_data = dict(model.execute(input_data))
+    except Exception:
+        # Allow the next samples of the worker to be executed.
+        model._reset_execution_status()
+        raise
+
+    # The worker may exit right after the last sample.
+    model.flush_persistency()
+    return output_data
+
+
+def execute_samples(
+    model: IntegratedModel,
+    input_data: Sequence[Mapping[str, ndarray]],
+    n_processes: int,
+    backend: BatchBackend,
+    skip_failed: bool = False,
+    callback: Callable[[int, dict[str, ndarray]], Any] | None = None,
+) -> list[dict[str, ndarray] | None]:
+    """Execute clones of a model on samples spread over workers.
+
+    Args:
+        model: The model.
+        input_data: The input data of the samples.
+        n_processes: The number of workers.
+        backend: The backend spreading the samples over the workers.
+        skip_failed: Whether to return ``None`` for the samples whose execution
+            failed, instead of raising the error.
+        callback: A function called with the index of a sample and its input and
+            output data as soon as its execution succeeds.
+            If ``None``, do not call any function.
+
+    Returns:
+        The input and output data of the samples, in submission order.
+    """
+    initialization_args = (
+        model.__class__,
+        model.load_case.name,
+        model.options,
+        dict(model.default_input_data),
+    )
+    n_workers = min(n_processes, len(input_data))
+    executor_class = (
+        ProcessPoolExecutor if backend == BatchBackend.PROCESS else ThreadPoolExecutor
+    )
+    with executor_class(
+        max_workers=n_workers,
+        initializer=_initialize_worker,
+        initargs=initialization_args,
+    ) as executor:
+        futures = {
+            executor.submit(_execute_sample, data): index
+            for index, data in enumerate(input_data)
+        }
+        results = [None] * len(futures)
+        for future in as_completed(futures):
+            index = futures[future]
+            error = future.exception()
+            if error is None:
+                results[index] = future.result()
+                if callback is not None:
+                    callback(index, results[index])
+            elif skip_failed:
+                LOGGER.error(f"The execution of the sample {index} failed: {error!r}")
+            else:
+                # Do not wait for the execution of the samples not started yet.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise error
+
+        return results
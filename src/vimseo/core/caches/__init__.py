@@ -0,0 +1,35 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""Caches of the integrated models."""
+
+from __future__ import annotations
+
+from strenum import StrEnum
+
+
+class ModelCacheType(StrEnum):
+    """The types of cache of an ``IntegratedModel``."""
+
+    HDF5 = "HDF5Cache"
+    """A single HDF5 file, which cannot be written by several processes."""
+
+    SHARDED = "ShardedCache"
+    """A directory of content-addressed entry files, which can be shared by several
+    processes and nodes."""
+
+    MEMORY = "LRUCache"
+    """An in-memory cache keeping the most recently used entries,
+    which are lost at the end of the process."""
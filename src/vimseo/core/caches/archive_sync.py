@@ -0,0 +1,139 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""The manifest of the archived runs imported into a cache."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+LOGGER = logging.getLogger(__name__)
+
+SYNC_TIME_MARGIN = 60.0
+"""The time in seconds before the last synchronization from which the runs are
+listed again, to import the runs still being written at that time."""
+
+
+@dataclass
+class ArchiveSyncManifest:
+    """The manifest of the archived runs imported into a cache.
+
+    It allows to import only the new runs of an archive into a cache built from this
+    archive.
+    """
+
+    archive: str
+    """The identifier of the archive, e.g. its URI and experiment name."""
+
+    runs: dict[str, str] = field(default_factory=dict)
+    """The versions of the imported runs, bound to the run IDs."""
+
+    last_sync_time: float = 0.0
+    """The time of the last synchronization, in seconds since the epoch."""
+
+    @property
+    def start_time(self) -> float:
+        """The time after which the runs to synchronize have been created or modified,
+        in seconds since the epoch, or zero to consider all the runs."""
+        return max(self.last_sync_time - SYNC_TIME_MARGIN, 0.0)
+
+    @classmethod
+    def from_file(cls, file_path: str | Path) -> ArchiveSyncManifest | None:
+        """Read a manifest from a file.
+
+        Args:
+            file_path: The path to the file.
+
+        Returns:
+            The manifest, or ``None`` if the file does not exist or is not valid.
+        """
+        file_path = Path(file_path)
+        if not file_path.is_file():
+            return None
+
+        try:
+            data = json.loads(file_path.read_text())
+            return cls(
+                archive=data["archive"],
+                runs=dict(data["runs"]),
+                last_sync_time=float(data.get("last_sync_time", 0.0)),
+            )
+        except (ValueError, KeyError, TypeError):
+            LOGGER.warning("The archive sync manifest %s is not valid.", file_path)
+            return None
+
+    def to_file(self, file_path: str | Path) -> None:
+        """Write the manifest to a file atomically.
+
+        Args:
+            file_path: The path to the file.
+        """
+        file_path = Path(file_path)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            suffix=".tmp", dir=file_path.parent
+        )
+        try:
+            with os.fdopen(file_descriptor, "w") as f:
+                json.dump(
+                    {
+                        "archive": self.archive,
+                        "runs": self.runs,
+                        "last_sync_time": self.last_sync_time,
+                    },
+                    f,
+                )
+            Path(temporary_path).replace(file_path)
+        except BaseException:
+            Path(temporary_path).unlink(missing_ok=True)
+            raise
+
+    def get_runs_to_import(self, run_versions: Mapping[str, str]) -> list[str] | None:
+        """Return the runs to import to synchronize the cache with the archive.
+
+        When the runs are listed from :attr:`.start_time`,
+        a run created before is neither listed nor checked;
+        its removal is detected only by a full rebuild of the cache.
+
+        Args:
+            run_versions: The versions of the archived runs, bound to the run IDs,
+                listed from :attr:`.start_time`.
+
+        Returns:
+            The IDs of the runs which are not imported yet,
+            or ``None`` if an imported run has been modified or removed since its
+            import, in which case the cache must be rebuilt.
+        """
+        if self.start_time:
+            if any(
+                self.runs.get(run_id, version) != version
+                for run_id, version in run_versions.items()
+            ):
+                return None
+        else:
+            for run_id, version in self.runs.items():
+                if run_versions.get(run_id) != version:
+                    return None
+
+        return [run_id for run_id in run_versions if run_id not in self.runs]
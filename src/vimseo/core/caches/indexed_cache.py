@@ -0,0 +1,401 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""A cache layer indexing the input data for lookups with a tolerance."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+
+import numpy as np
+from gemseo.caches.base_cache import DATA_COMPARATOR
+from gemseo.caches.base_cache import BaseCache
+from gemseo.caches.cache_entry import CacheEntry
+from gemseo.caches.utils import hash_data
+from scipy.spatial import cKDTree
+
+from vimseo.core.caches.lru_cache import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from gemseo.typing import JacobianData
+    from gemseo.typing import StrKeyMapping
+    from gemseo.utils.string_tools import MultiLineString
+
+LOGGER = logging.getLogger(__name__)
+
+
+class InputIndex:
+    """A nearest-neighbour index of input data.
+
+    The input data are flattened into vectors,
+    whose components are normalized by ``1 + max_norm``,
+    where ``max_norm`` is the maximum norm of the corresponding input variable.
+    The vectors are stored in a KD-tree,
+    which is rebuilt when the number of vectors added since the last build
+    exceeds the square root of the number of vectors in the tree.
+    The vectors added since the last build are searched exhaustively.
+    The removed vectors are discarded from the candidates,
+    and from the KD-tree at its next build.
+
+    The input data that cannot be flattened into vectors of the same layout,
+    e.g. with other variables or with variables of other sizes,
+    are also searched exhaustively.
+    """
+
+    _MIN_PENDING_SIZE: ClassVar[int] = 64
+    """The minimum number of vectors added since the last build triggering a
+    rebuild of the KD-tree."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.__names = ()
+        self.__slices = {}
+        self.__indices = {}
+        self.__hashes = []
+        self.__input_data = []
+        self.__vectors = []
+        self.__removed_indices = set()
+        self.__max_norms = {}
+        self.__build_max_norms = {}
+        self.__scales = np.empty(0)
+        self.__tree = None
+        self.__n_tree_vectors = 0
+        self.__other_input_data = {}
+
+    def __len__(self) -> int:
+        return (
+            len(self.__input_data)
+            - len(self.__removed_indices)
+            + len(self.__other_input_data)
+        )
+
+    def _to_vector(self, input_data: StrKeyMapping) -> np.ndarray | None:
+        """Flatten input data into a vector.
+
+        Args:
+            input_data: The input data.
+
+        Returns:
+            The vector,
+            or ``None`` if the input data do not match the layout of the index.
+        """
+        try:
+            values = {
+                name: np.asarray(value, dtype=float).ravel()
+                for name, value in input_data.items()
+            }
+        except (TypeError, ValueError):
+            return None
+
+        if not self.__names:
+            self.__names = tuple(sorted(values))
+            start = 0
+            for name in self.__names:
+                self.__slices[name] = slice(start, start + values[name].size)
+                start += values[name].size
+
+        if tuple(sorted(values)) != self.__names or any(
+            values[name].size != slice_.stop - slice_.start
+            for name, slice_ in self.__slices.items()
+        ):
+            return None
+
+        return np.concatenate([values[name] for name in self.__names])
+
+    def add(self, input_data: StrKeyMapping) -> None:
+        """Add input data to the index.
+
+        Args:
+            input_data: The input data.
+        """
+        data_hash = hash_data(input_data)
+        if data_hash in self.__indices or data_hash in self.__other_input_data:
+            return
+
+        vector = self._to_vector(input_data)
+        if vector is None:
+            self.__other_input_data[data_hash] = input_data
+            return
+
+        self.__indices[data_hash] = len(self.__input_data)
+        self.__hashes.append(data_hash)
+        self.__input_data.append(input_data)
+        self.__vectors.append(vector)
+        for name, slice_ in self.__slices.items():
+            self.__max_norms[name] = max(
+                self.__max_norms.get(name, 0.0), np.linalg.norm(vector[slice_])
+            )
+
+        n_pending_vectors = len(self.__vectors) - self.__n_tree_vectors
+        if n_pending_vectors > max(
+            self._MIN_PENDING_SIZE, np.sqrt(self.__n_tree_vectors)
+        ):
+            self._build_tree()
+
+    def remove(self, input_data: StrKeyMapping) -> None:
+        """Remove input data from the index, if indexed.
+
+        Args:
+            input_data: The input data.
+        """
+        data_hash = hash_data(input_data)
+        self.__other_input_data.pop(data_hash, None)
+        index = self.__indices.pop(data_hash, None)
+        if index is not None:
+            self.__removed_indices.add(index)
+
+    def _build_tree(self) -> None:
+        """Build the KD-tree from all the vectors not removed."""
+        if self.__removed_indices:
+            kept_indices = [
+                index
+                for index in range(len(self.__vectors))
+                if index not in self.__removed_indices
+            ]
+            self.__hashes = [self.__hashes[index] for index in kept_indices]
+            self.__input_data = [self.__input_data[index] for index in kept_indices]
+            self.__vectors = [self.__vectors[index] for index in kept_indices]
+            self.__indices = {
+                data_hash: index for index, data_hash in enumerate(self.__hashes)
+            }
+            self.__removed_indices.clear()
+
+        self.__n_tree_vectors = len(self.__vectors)
+        if not self.__vectors:
+            self.__tree = None
+            return
+
+        self.__build_max_norms = dict(self.__max_norms)
+        self.__scales = np.empty(len(self.__vectors[0]))
+        for name, slice_ in self.__slices.items():
+            self.__scales[slice_] = 1.0 / (1.0 + self.__build_max_norms[name])
+        self.__tree = cKDTree(np.vstack(self.__vectors) * self.__scales)
+
+    def find(self, input_data: StrKeyMapping, tolerance: float) -> StrKeyMapping | None:
+        """Find indexed input data close to input data.
+
+        Args:
+            input_data: The input data.
+            tolerance: The tolerance of the criterion of :data:`.DATA_COMPARATOR`.
+
+        Returns:
+            The first indexed input data close to ``input_data``, if any.
+        """
+        vector = self._to_vector(input_data) if self.__input_data else None
+        if vector is not None:
+            candidate_indices = self._get_candidate_indices(vector, tolerance)
+            for index in candidate_indices:
+                if DATA_COMPARATOR(input_data, self.__input_data[index], tolerance):
+                    return self.__input_data[index]
+
+        for other_input_data in self.__other_input_data.values():
+            if DATA_COMPARATOR(input_data, other_input_data, tolerance):
+                return other_input_data
+
+        return None
+
+    def _get_candidate_indices(self, vector: np.ndarray, tolerance: float) -> list[int]:
+        """Return the indices of the vectors possibly close to a vector.
+
+        Two input data satisfying the criterion of :data:`.DATA_COMPARATOR`
+        have normalized vectors whose Chebyshev distance is smaller than
+        ``tolerance``, up to the increase of the maximum norms since the last build
+        and to the ratio of the norms of the vector to the maximum norms,
+        as the criterion is relative to the norms of the searched input data.
+
+        Args:
+            vector: The vector.
+            tolerance: The tolerance of the criterion of :data:`.DATA_COMPARATOR`.
+
+        Returns:
+            The sorted indices of the candidate vectors.
+        """
+        if self.__tree is None:
+            self._build_tree()
+            if self.__tree is None:
+                return []
+
+        radius = tolerance * max(
+            (1.0 + max(self.__max_norms[name], np.linalg.norm(vector[slice_])))
+            / (1.0 + self.__build_max_norms[name])
+            for name, slice_ in self.__slices.items()
+        )
+        vector = vector * self.__scales
+        indices = self.__tree.query_ball_point(vector, radius, p=np.inf)
+        if len(self.__vectors) > self.__n_tree_vectors:
+            pending_vectors = np.vstack(self.__vectors[self.__n_tree_vectors :])
+            distances = np.abs(pending_vectors * self.__scales - vector).max(axis=1)
+            indices.extend(
+                (np.flatnonzero(distances <= radius) + self.__n_tree_vectors).tolist()
+            )
+        return sorted(set(indices) - self.__removed_indices)
+
+
+class IndexedCache(BaseCache):
+    """A cache layer finding the entries within a tolerance with an index.
+
+    The entries are stored in a wrapped cache, whose tolerance is zero.
+    When the tolerance of this cache is zero,
+    the lookups are delegated to the wrapped cache, which uses a hash of the input
+    data.
+    Otherwise,
+    the candidate entries are found with an :class:`.InputIndex`
+    in logarithmic time, instead of scanning all the entries of the wrapped cache.
+    The index is built at the first lookup with a tolerance,
+    and then updated at each new entry,
+    and at each entry evicted from a wrapped :class:`.LRUCache`.
+
+    The numbers of hits and misses of the lookups are recorded.
+    The other public attributes are those of the wrapped cache,
+    e.g. ``hdf_file`` for an :class:`.HDF5Cache`.
+    """
+
+    n_hits: int
+    """The number of lookups finding an entry."""
+
+    n_misses: int
+    """The number of lookups finding no entry."""
+
+    def __init__(
+        self,
+        cache: BaseCache,
+        tolerance: float = 0.0,
+        name: str = "",
+    ) -> None:
+        """
+        Args:
+            cache: The wrapped cache, storing the entries.
+                Its tolerance is set to zero.
+        """  # noqa: D205, D212
+        super().__init__(tolerance, name or cache.name)
+        cache.tolerance = 0.0
+        if isinstance(cache, LRUCache):
+            cache.eviction_callback = self.__remove_from_index
+        self.__cache = cache
+        self.__index = None
+        self.n_hits = 0
+        self.n_misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            msg = f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+        return getattr(self.__cache, name)
+
+    @property
+    def wrapped_cache(self) -> BaseCache:
+        """The wrapped cache, storing the entries."""
+        return self.__cache
+
+    @property
+    def statistics(self) -> dict[str, int | float]:
+        """The numbers of hits and misses, and the hit rate, of the lookups."""
+        n_lookups = self.n_hits + self.n_misses
+        return {
+            "n_hits": self.n_hits,
+            "n_misses": self.n_misses,
+            "hit_rate": self.n_hits / n_lookups if n_lookups else 0.0,
+        }
+
+    def reset_statistics(self) -> None:
+        """Reset the numbers of hits and misses."""
+        self.n_hits = 0
+        self.n_misses = 0
+
+    def _get_string_representation(self) -> MultiLineString:
+        mls = super()._get_string_representation()
+        mls.add("Wrapped cache: {}", self.__cache.__class__.__name__)
+        mls.add("Hits: {}", self.n_hits)
+        mls.add("Misses: {}", self.n_misses)
+        return mls
+
+    def _get_index(self) -> InputIndex:
+        """Return the index of the input data, building it if needed."""
+        if self.__index is None:
+            self.__index = InputIndex()
+            for entry in self.__cache.get_all_entries():
+                self.__index.add(entry.inputs)
+            LOGGER.debug(
+                "Index of cache %s built with %s entries.", self.name, len(self.__index)
+            )
+        return self.__index
+
+    def __remove_from_index(self, input_data: StrKeyMapping) -> None:
+        """Remove the input data of an entry evicted from the wrapped cache.
+
+        Args:
+            input_data: The input data of the entry.
+        """
+        if self.__index is not None:
+            self.__index.remove(input_data)
+
+    def __getitem__(
+        self,
+        input_data: StrKeyMapping,
+    ) -> CacheEntry:
+        if self._tolerance == 0.0:
+            entry = self.__cache[input_data]
+        else:
+            indexed_input_data = self._get_index().find(input_data, self._tolerance)
+            entry = (
+                CacheEntry(input_data, {}, {})
+                if indexed_input_data is None
+                else self.__cache[indexed_input_data]
+            )
+
+        if entry.outputs or entry.jacobian:
+            self.n_hits += 1
+        else:
+            self.n_misses += 1
+
+        return CacheEntry(input_data, entry.outputs, entry.jacobian)
+
+    def cache_outputs(  # noqa: D102
+        self,
+        input_data: StrKeyMapping,
+        output_data: StrKeyMapping,
+    ) -> None:
+        self.__cache.cache_outputs(input_data, output_data)
+        if self.__index is not None:
+            self.__index.add(input_data)
+
+    def cache_jacobian(  # noqa: D102
+        self,
+        input_data: StrKeyMapping,
+        jacobian_data: JacobianData,
+    ) -> None:
+        self.__cache.cache_jacobian(input_data, jacobian_data)
+        if self.__index is not None:
+            self.__index.add(input_data)
+
+    def __len__(self) -> int:
+        return len(self.__cache)
+
+    def clear(self) -> None:  # noqa: D102
+        super().clear()
+        self.__cache.clear()
+        self.__index = None
+        self.reset_statistics()
+
+    @property
+    def last_entry(self) -> CacheEntry:  # noqa: D102
+        return self.__cache.last_entry
+
+    def get_all_entries(self) -> Iterator[CacheEntry]:  # noqa: D102
+        return self.__cache.get_all_entries()
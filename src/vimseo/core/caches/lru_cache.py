@@ -0,0 +1,171 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""An in-memory cache keeping the most recently used entries."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+from gemseo.caches.base_cache import DATA_COMPARATOR
+from gemseo.caches.base_cache import BaseCache
+from gemseo.caches.cache_entry import CacheEntry
+from gemseo.caches.utils import hash_data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+
+    from gemseo.typing import JacobianData
+    from gemseo.typing import StrKeyMapping
+    from gemseo.utils.string_tools import MultiLineString
+
+
+class LRUCache(BaseCache):
+    """An in-memory cache keeping the most recently used entries.
+
+    When the cache is full,
+    caching a new entry discards the least recently used one.
+    The entries are found from a hash of their input data when the tolerance is zero,
+    and by a linear search otherwise.
+    The entries are lost at the end of the process.
+    """
+
+    eviction_callback: Callable[[StrKeyMapping], None] | None
+    """A function called with the input data of each discarded entry, if any."""
+
+    def __init__(
+        self,
+        tolerance: float = 0.0,
+        name: str = "",
+        max_size: int = 1024,
+    ) -> None:
+        """
+        Args:
+            max_size: The maximum number of entries.
+        """  # noqa: D205, D212
+        super().__init__(tolerance, name)
+        self.__max_size = max_size
+        self.__entries = OrderedDict()
+        self.eviction_callback = None
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of entries."""
+        return self.__max_size
+
+    def _get_string_representation(self) -> MultiLineString:
+        mls = super()._get_string_representation()
+        mls.add("Maximum size: {}", self.__max_size)
+        return mls
+
+    def __find_key(self, input_data: StrKeyMapping) -> int | None:
+        """Find the key of the entry matching input data.
+
+        Args:
+            input_data: The input data.
+
+        Returns:
+            The key of the entry, if any.
+        """
+        key = hash_data(input_data)
+        entry = self.__entries.get(key)
+        if entry is not None and DATA_COMPARATOR(input_data, entry.inputs):
+            return key
+
+        if self._tolerance == 0.0:
+            return None
+
+        for key, entry in reversed(self.__entries.items()):
+            if DATA_COMPARATOR(input_data, entry.inputs, self._tolerance):
+                return key
+
+        return None
+
+    def __update_entry(
+        self,
+        input_data: StrKeyMapping,
+        output_data: StrKeyMapping | None = None,
+        jacobian_data: JacobianData | None = None,
+    ) -> None:
+        """Store the output or Jacobian data of an entry, keeping the other ones.
+
+        Args:
+            input_data: The input data.
+            output_data: The output data, if any.
+            jacobian_data: The Jacobian data, if any.
+        """
+        key = hash_data(input_data)
+        entry = self.__entries.get(key)
+        if entry is None or not DATA_COMPARATOR(input_data, entry.inputs):
+            entry = CacheEntry(deepcopy(dict(input_data)), {}, {})
+
+        self.__entries[key] = CacheEntry(
+            entry.inputs,
+            entry.outputs if output_data is None else deepcopy(dict(output_data)),
+            entry.jacobian if jacobian_data is None else deepcopy(jacobian_data),
+        )
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_size:
+            _, discarded_entry = self.__entries.popitem(last=False)
+            if self.eviction_callback is not None:
+                self.eviction_callback(discarded_entry.inputs)
+
+        if output_data is not None and not self._output_names:
+            self._output_names = sorted(output_data.keys())
+
+    def cache_outputs(  # noqa: D102
+        self,
+        input_data: StrKeyMapping,
+        output_data: StrKeyMapping,
+    ) -> None:
+        self.__update_entry(input_data, output_data=output_data)
+
+    def cache_jacobian(  # noqa: D102
+        self,
+        input_data: StrKeyMapping,
+        jacobian_data: JacobianData,
+    ) -> None:
+        self.__update_entry(input_data, jacobian_data=jacobian_data)
+
+    def __getitem__(
+        self,
+        input_data: StrKeyMapping,
+    ) -> CacheEntry:
+        key = self.__find_key(input_data)
+        if key is None:
+            return CacheEntry(input_data, {}, {})
+
+        self.__entries.move_to_end(key)
+        entry = self.__entries[key]
+        return CacheEntry(input_data, entry.outputs, entry.jacobian)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def clear(self) -> None:  # noqa: D102
+        super().clear()
+        self.__entries.clear()
+
+    @property
+    def last_entry(self) -> CacheEntry:  # noqa: D102
+        if not self.__entries:
+            return CacheEntry({}, {}, {})
+        return next(reversed(self.__entries.values()))
+
+    def get_all_entries(self) -> Iterator[CacheEntry]:  # noqa: D102
+        yield from list(self.__entries.values())
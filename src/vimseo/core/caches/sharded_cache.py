@@ -0,0 +1,288 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""A content-addressed cache sharded over directories."""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+import numpy as np
+from gemseo.caches.base_cache import DATA_COMPARATOR
+from gemseo.caches.base_cache import BaseCache
+from gemseo.caches.cache_entry import CacheEntry
+from gemseo.caches.utils import hash_data
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from gemseo.typing import JacobianData
+    from gemseo.typing import StrKeyMapping
+    from gemseo.utils.string_tools import MultiLineString
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ShardedCache(BaseCache):
+    """A cache storing each entry in its own file, named by the hash of its inputs.
+
+    The entry files are spread over sub-directories named by the first characters of
+    the hash, to keep the directories small.
+    An entry file is first written to a temporary file of its sub-directory,
+    and then atomically renamed.
+    Consequently, a reader never sees a partially written entry,
+    and several processes, possibly on several nodes sharing a filesystem,
+    can read and write the same cache at once.
+
+    The entries are ordered by modification time of their files.
+    """
+
+    _directory_path: Path
+    """The path to the root directory of the cache."""
+
+    _last_entry_path: Path | None
+    """The path to the last entry written or read by this cache instance."""
+
+    _SHARD_PREFIX_LENGTH: ClassVar[int] = 2
+    """The number of characters of the hash used to name the sub-directories."""
+
+    _ENTRY_SUFFIX: ClassVar[str] = ".npz"
+    """The suffix of the entry files."""
+
+    _JACOBIAN_SEPARATOR: ClassVar[str] = "!d$_$d!"
+    """The string separating the output and input names in a derivative name."""
+
+    def __init__(
+        self,
+        tolerance: float = 0.0,
+        name: str = "",
+        directory_path: str | Path = "cache",
+    ) -> None:
+        """
+        Args:
+            directory_path: The path to the root directory of the cache.
+                It is created if it does not exist.
+        """  # noqa: D205, D212
+        super().__init__(tolerance, name)
+        self._directory_path = Path(directory_path)
+        self._directory_path.mkdir(parents=True, exist_ok=True)
+        self._last_entry_path = None
+
+    @property
+    def directory_path(self) -> Path:
+        """The path to the root directory of the cache."""
+        return self._directory_path
+
+    def _get_string_representation(self) -> MultiLineString:
+        mls = super()._get_string_representation()
+        mls.add("Directory path: {}", self._directory_path)
+        return mls
+
+    def get_entry_path(self, input_data: StrKeyMapping) -> Path:
+        """Return the path to the file of an entry.
+
+        Args:
+            input_data: The input data of the entry.
+
+        Returns:
+            The path to the entry file.
+        """
+        key = f"{hash_data(input_data):016x}"
+        return (
+            self._directory_path
+            / key[: self._SHARD_PREFIX_LENGTH]
+            / f"{key}{self._ENTRY_SUFFIX}"
+        )
+
+    def _get_entry_paths(self) -> list[Path]:
+        """Return the paths to the entry files, ordered by modification time."""
+        paths = self._directory_path.glob(f"*/*{self._ENTRY_SUFFIX}")
+        return sorted(paths, key=lambda path: (path.stat().st_mtime_ns, path.name))
+
+    def _read_entry(self, path: Path) -> CacheEntry:
+        """Read an entry file.
+
+        Args:
+            path: The path to the entry file.
+
+        Returns:
+            The entry.
+        """
+        inputs = {}
+        outputs = {}
+        jacobian = {}
+        with np.load(path, allow_pickle=False) as data:
+            for key in data.files:
+                group, name = key.split("/", 1)
+                if group == self.Group.INPUTS:
+                    inputs[name] = data[key]
+                elif group == self.Group.OUTPUTS:
+                    outputs[name] = data[key]
+                else:
+                    output_name, input_name = name.split(self._JACOBIAN_SEPARATOR)
+                    jacobian.setdefault(output_name, {})[input_name] = data[key]
+        return CacheEntry(inputs, outputs, jacobian)
+
+    def _write_entry(self, path: Path, entry: CacheEntry) -> None:
+        """Write an entry file atomically.
+
+        Args:
+            path: The path to the entry file.
+            entry: The entry.
+        """
+        data = {f"{self.Group.INPUTS}/{k}": v for k, v in entry.inputs.items()}
+        data.update({f"{self.Group.OUTPUTS}/{k}": v for k, v in entry.outputs.items()})
+        for output_name, derivatives in entry.jacobian.items():
+            for input_name, value in derivatives.items():
+                key = f"{output_name}{self._JACOBIAN_SEPARATOR}{input_name}"
+                data[f"{self.Group.JACOBIAN}/{key}"] = value
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            suffix=".tmp", dir=path.parent
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as f:
+                np.savez(f, **data)
+                f.flush()
+                os.fsync(f.fileno())
+            Path(temporary_path).replace(path)
+        except BaseException:
+            Path(temporary_path).unlink(missing_ok=True)
+            raise
+
+        self._last_entry_path = path
+
+    def _find_entry_path(self, input_data: StrKeyMapping) -> Path | None:
+        """Find the file of the entry matching input data.
+
+        Args:
+            input_data: The input data.
+
+        Returns:
+            The path to the entry file if any.
+        """
+        path = self.get_entry_path(input_data)
+        if path.is_file():
+            return path
+
+        if self._tolerance == 0.0:
+            return None
+
+        for path in self._get_entry_paths():
+            if DATA_COMPARATOR(
+                input_data, self._read_entry(path).inputs, self._tolerance
+            ):
+                return path
+
+        return None
+
+    def __update_entry(
+        self,
+        input_data: StrKeyMapping,
+        output_data: StrKeyMapping | None = None,
+        jacobian_data: JacobianData | None = None,
+    ) -> None:
+        """Write the output or Jacobian data of an entry, keeping the other ones.
+
+        Args:
+            input_data: The input data.
+            output_data: The output data, if any.
+            jacobian_data: The Jacobian data, if any.
+        """
+        path = self.get_entry_path(input_data)
+        entry = CacheEntry(input_data, {}, {})
+        if path.is_file():
+            entry = self._read_entry(path)
+            if not DATA_COMPARATOR(input_data, entry.inputs):
+                LOGGER.warning(
+                    "Hash collision in cache %s: the entry %s is not overwritten.",
+                    self.name,
+                    path,
+                )
+                return
+            if (output_data is None or entry.outputs) and (
+                jacobian_data is None or entry.jacobian
+            ):
+                self._last_entry_path = path
+                return
+
+        self._write_entry(
+            path,
+            CacheEntry(
+                input_data,
+                entry.outputs if output_data is None else output_data,
+                entry.jacobian if jacobian_data is None else jacobian_data,
+            ),
+        )
+        if output_data is not None and not self._output_names:
+            self._output_names = sorted(output_data.keys())
+
+    def cache_outputs(  # noqa: D102
+        self,
+        input_data: StrKeyMapping,
+        output_data: StrKeyMapping,
+    ) -> None:
+        self.__update_entry(input_data, output_data=output_data)
+
+    def cache_jacobian(  # noqa: D102
+        self,
+        input_data: StrKeyMapping,
+        jacobian_data: JacobianData,
+    ) -> None:
+        self.__update_entry(input_data, jacobian_data=jacobian_data)
+
+    def __getitem__(
+        self,
+        input_data: StrKeyMapping,
+    ) -> CacheEntry:
+        path = self._find_entry_path(input_data)
+        if path is None:
+            return CacheEntry(input_data, {}, {})
+
+        entry = self._read_entry(path)
+        if self._tolerance == 0.0 and not DATA_COMPARATOR(input_data, entry.inputs):
+            return CacheEntry(input_data, {}, {})
+
+        self._last_entry_path = path
+        return CacheEntry(input_data, entry.outputs, entry.jacobian)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._directory_path.glob(f"*/*{self._ENTRY_SUFFIX}"))
+
+    def clear(self) -> None:  # noqa: D102
+        super().clear()
+        for path in self._directory_path.glob(f"*/*{self._ENTRY_SUFFIX}"):
+            path.unlink(missing_ok=True)
+        self._last_entry_path = None
+
+    @property
+    def last_entry(self) -> CacheEntry:  # noqa: D102
+        path = self._last_entry_path
+        if path is None or not path.is_file():
+            paths = self._get_entry_paths()
+            if not paths:
+                return CacheEntry({}, {}, {})
+            path = paths[-1]
+        return self._read_entry(path)
+
+    def get_all_entries(self) -> Iterator[CacheEntry]:  # noqa: D102
+        for path in self._get_entry_paths():
+            yield self._read_entry(path)
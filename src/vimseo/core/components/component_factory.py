@@ -18,14 +18,13 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.core.components.external_software_component import BaseComponent
 
 LOGGER = logging.getLogger(__name__)
 
 
-class ComponentFactory(BaseFactory):
+class ComponentFactory(BaseCachedFactory):
     """BaseComponent factory to create a component from a name or a class."""
 
     _CLASS = BaseComponent
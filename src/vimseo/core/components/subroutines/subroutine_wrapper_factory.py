@@ -15,12 +15,11 @@
 
 from __future__ import annotations
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.core.components.subroutines.subroutine_wrapper import SubroutineWrapper
 
 
-class SubroutineWrapperFactory(BaseFactory):
+class SubroutineWrapperFactory(BaseCachedFactory):
     """SubroutineWrapper factory to create a subroutine wrapper from a name or a
     class."""
 
@@ -19,20 +19,32 @@ import json
 import logging
 import pathlib
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.core.load_case import LoadCase
 from vimseo.tools.post_tools.plot_parameters import PlotParameters
 
 LOGGER = logging.getLogger(__name__)
 
 
-class LoadCaseFactory(BaseFactory):
+class LoadCaseFactory(BaseCachedFactory):
     """Model factory to create the Model from a name or a class."""
 
     _CLASS = LoadCase
     _PACKAGE_NAMES = ("vimseo.problems.load_cases",)
 
+    @staticmethod
+    def get_class_name(load_case_name: str, domain: str = "") -> str:
+        """Return the name of the class of a load case.
+
+        Args:
+            load_case_name: The name of the load case.
+            domain: The domain of the load case.
+
+        Returns:
+            The name of the class of the load case.
+        """
+        return f"{domain}_{load_case_name}" if domain != "" else load_case_name
+
     def create(
         self,
         load_case_name: str,
@@ -46,7 +58,7 @@ class LoadCaseFactory(BaseFactory):
             domain: The domain of the load case.
             **options: The options of the load case.
         """
-        class_name = f"{domain}_{load_case_name}" if domain != "" else load_case_name
+        class_name = self.get_class_name(load_case_name, domain)
         dummy_lc = super().create(class_name)
         json_path = dummy_lc.auto_get_file(".json", raise_error=False)
 
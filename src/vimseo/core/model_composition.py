@@ -23,6 +23,12 @@ from vimseo.core.components.discipline_wrapper_component import (
 
 
 class ModelComposition(IntegratedModel):
+    @classmethod
+    def is_compatible_with(cls, load_case_name: str) -> bool:  # noqa: D102
+        # A composition cannot be created from a load case alone,
+        # as it requires a base model.
+        return False
+
     def __init__(self, load_case_name: str, **options):
         if "base_model" not in options:
             msg = "A base_model must be provided to create a ModelComposition."
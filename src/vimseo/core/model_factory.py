@@ -17,14 +17,13 @@ from __future__ import annotations
 
 import logging
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.core.base_integrated_model import IntegratedModel
 
 LOGGER = logging.getLogger(__name__)
 
 
-class ModelFactory(BaseFactory):
+class ModelFactory(BaseCachedFactory):
     """Model factory to create the Model from a name or a class."""
 
     _CLASS = IntegratedModel
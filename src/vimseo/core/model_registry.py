@@ -0,0 +1,190 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""The registry of the load cases supported by the models.
+
+The compatibility between a model and a load case is determined from the class
+attributes of the model, see :meth:`.IntegratedModel.is_compatible_with`,
+and by instantiating the model only when they are not sufficient.
+
+The registry is computed once,
+then cached in the file :data:`.COMPATIBILITY_FILE_NAME` of the cache directory
+of VIMSEO, see :func:`.get_cache_directory`.
+The cached registry is invalidated when the names of the models or the names of
+the load cases change,
+or when the packages searched by the factories of the models, the load cases and
+the components change, see :attr:`.BaseCachedFactory.cache_key`.
+The registry is not cached when the search paths are defined by the environment
+variable ``GEMSEO_PATH``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from functools import cache
+
+from vimseo.core.components.component_factory import ComponentFactory
+from vimseo.core.load_case_factory import LoadCaseFactory
+from vimseo.core.model_factory import ModelFactory
+from vimseo.core.model_settings import IntegratedModelSettings
+from vimseo.utilities.file_utils import get_cache_directory
+
+LOGGER = logging.getLogger(__name__)
+
+COMPATIBILITY_FILE_NAME = "model_compatibility.json"
+"""The name of the file caching the registry."""
+
+
+def _get_load_case_names(domain: str, load_case_class_names: list[str]) -> list[str]:
+    """Return the names of the load cases of a domain.
+
+    These are the names of the load cases created by :meth:`.LoadCaseFactory.create`
+    from these names and the domain.
+
+    Args:
+        domain: The domain of the load cases.
+        load_case_class_names: The names of the load case classes.
+
+    Returns:
+        The names of the load cases, without the domain.
+    """
+    prefix = f"{domain}_" if domain else ""
+    return [
+        load_case_name
+        for class_name in load_case_class_names
+        if LoadCaseFactory.get_class_name(
+            load_case_name := class_name.removeprefix(prefix), domain
+        )
+        == class_name
+    ]
+
+
+def _is_compatible(model_name: str, load_case_name: str) -> bool:
+    """Check whether a model supports a load case.
+
+    Args:
+        model_name: The name of the model.
+        load_case_name: The name of the load case, without the domain.
+
+    Returns:
+        Whether the model supports the load case.
+    """
+    is_compatible = (
+        ModelFactory().get_class(model_name).is_compatible_with(load_case_name)
+    )
+    if is_compatible is not None:
+        return is_compatible
+
+    try:
+        ModelFactory().create(
+            model_name,
+            load_case_name,
+            **IntegratedModelSettings(archive_manager="DirectoryArchive").model_dump(),
+        )
+    except (ImportError, AttributeError):
+        return False
+    return True
+
+
+def _compute_registry(
+    model_names: list[str], load_case_class_names: list[str]
+) -> dict[str, list[str]]:
+    """Compute the registry.
+
+    Args:
+        model_names: The names of the models.
+        load_case_class_names: The names of the load case classes.
+
+    Returns:
+        The sorted names of the load cases supported by the models.
+    """
+    model_factory = ModelFactory()
+    registry = {}
+    for model_name in model_names:
+        domain = model_factory.get_class(model_name)._LOAD_CASE_DOMAIN
+        registry[model_name] = sorted(
+            load_case_name
+            for load_case_name in set(
+                _get_load_case_names(domain, load_case_class_names)
+            )
+            if _is_compatible(model_name, load_case_name)
+        )
+    return registry
+
+
+@cache
+def _load_registry(
+    model_names: tuple[str, ...], load_case_class_names: tuple[str, ...]
+) -> dict[str, list[str]]:
+    """Load the registry from the cache file, computing it if it is outdated.
+
+    Args:
+        model_names: The names of the models.
+        load_case_class_names: The names of the load case classes.
+
+    Returns:
+        The sorted names of the load cases supported by the models.
+    """
+    factory_keys = [
+        factory.cache_key
+        for factory in (ModelFactory(), LoadCaseFactory(), ComponentFactory())
+    ]
+    if None in factory_keys:
+        return _compute_registry(list(model_names), list(load_case_class_names))
+
+    key = {
+        "factories": factory_keys,
+        "model_names": list(model_names),
+        "load_case_class_names": list(load_case_class_names),
+    }
+    file_path = get_cache_directory() / COMPATIBILITY_FILE_NAME
+    try:
+        data = json.loads(file_path.read_text())
+    except (OSError, ValueError):
+        data = {}
+
+    if data.get("key") == key:
+        return data["registry"]
+
+    registry = _compute_registry(list(model_names), list(load_case_class_names))
+    try:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(json.dumps({"key": key, "registry": registry}))
+    except OSError as err:
+        LOGGER.debug(f"The model registry cannot be cached in {file_path}: {err!s}")
+    return registry
+
+
+def get_registry() -> dict[str, list[str]]:
+    """Return the load cases supported by the models.
+
+    Returns:
+        The sorted names of the load cases supported by the models.
+    """
+    registry = _load_registry(
+        tuple(sorted(ModelFactory().class_names)),
+        tuple(sorted(LoadCaseFactory().class_names)),
+    )
+    return {
+        model_name: list(load_case_names)
+        for model_name, load_case_names in registry.items()
+    }
+
+
+def clear_registry() -> None:
+    """Clear the registry cached in memory and on disk."""
+    _load_registry.cache_clear()
+    (get_cache_directory() / COMPATIBILITY_FILE_NAME).unlink(missing_ok=True)
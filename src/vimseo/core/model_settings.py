@@ -21,6 +21,7 @@ from pydantic import ConfigDict
 from pydantic import Field
 
 from vimseo.config.global_configuration import _configuration as config
+from vimseo.core.caches import ModelCacheType
 from vimseo.storage_management.archive_settings import BaseArchiveSettings
 from vimseo.storage_management.scratch_settings import DirectoryScratchSettings
 
@@ -36,6 +37,50 @@ class IntegratedModelSettings(BaseArchiveSettings, DirectoryScratchSettings):
         "fails",
     )
 
-    cache_file_path: str | Path = ""
+    cache_file_path: str | Path = Field(
+        default="",
+        description="The path to the cache file, or to the cache directory for a "
+        "sharded cache. By default, it is named from the model and the load case.",
+    )
+
+    cache_type: ModelCacheType = Field(
+        default=ModelCacheType.HDF5,
+        description="The type of cache. Use a sharded cache to share the cache between "
+        "several processes or nodes.",
+    )
+
+    memory_cache_size: int = Field(
+        default=1024,
+        gt=0,
+        description="The maximum number of entries of an in-memory cache.",
+    )
+
+    ephemeral: bool = Field(
+        default=False,
+        description="Whether to execute the model without scratch and archive "
+        "managers, hence without job directories, "
+        "and without writing anything to the disk. "
+        "The results are only stored in an in-memory cache, "
+        "whatever the cache type. "
+        "Suited to cheap models whose components do not use a job directory, "
+        "executed many times, e.g. by an optimizer.",
+    )
 
     archive_manager: str = config.archive_manager
+
+    async_persistency: bool = Field(
+        default=False,
+        description="Whether to write the results to the archive and to apply the "
+        "persistency policies in a background thread, such that an execution returns "
+        "as soon as the outputs are computed. "
+        "With a job name, an execution first waits for the results of the previous "
+        "one to be written, as it reuses the same job directories. "
+        "Use ``IntegratedModel.flush_persistency()`` to wait for the pending writes.",
+    )
+
+    persistency_queue_size: int = Field(
+        default=8,
+        gt=0,
+        description="The maximum number of results waiting to be written by the "
+        "background thread, when the persistency is asynchronous.",
+    )
@@ -0,0 +1,171 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""A background writer managing the persistency of the model results."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from queue import Queue
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _Errors:
+    """The errors raised by the tasks of a writer, shared with its thread."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.lock = threading.Lock()
+        self.first_error = None
+
+
+def _process_tasks(queue: Queue, errors: _Errors) -> None:
+    """Execute the queued tasks until receiving ``None``.
+
+    This function does not reference the writer,
+    such that the writer can be garbage-collected while its thread runs.
+
+    Args:
+        queue: The queue of the tasks.
+        errors: The errors raised by the tasks.
+    """
+    while True:
+        task = queue.get()
+        try:
+            if task is None:
+                return
+            task()
+        except BaseException as error:  # noqa: BLE001
+            LOGGER.exception("A persistency task failed.")
+            with errors.lock:
+                if errors.first_error is None:
+                    errors.first_error = error
+        finally:
+            queue.task_done()
+
+
+def _stop(queue: Queue, thread: threading.Thread) -> None:
+    """Execute the queued tasks and stop the thread of a writer.
+
+    Args:
+        queue: The queue of the tasks.
+        thread: The thread of the writer.
+    """
+    if thread.is_alive():
+        queue.put(None)
+        thread.join()
+
+
+class PersistencyWriter:
+    """A background thread executing persistency tasks in submission order.
+
+    The tasks are queued in a bounded queue,
+    such that the submission blocks when the writer lags too far behind.
+    The first error raised by a task is raised again by the next call to
+    :meth:`.submit` or :meth:`.flush`; the tasks submitted after a failed task are
+    still executed.
+
+    The writer can be used as a context manager, flushed at exit.
+    It is closed when it is garbage-collected, e.g. with its model,
+    or at interpreter exit.
+
+    Examples:
+        >>> with PersistencyWriter() as writer:
+        >>>     writer.submit(task)
+    """
+
+    def __init__(self, max_size: int = 8) -> None:
+        """
+        Args:
+            max_size: The maximum number of pending tasks.
+        """  # noqa: D205, D212
+        self.__queue = Queue(maxsize=max_size)
+        self.__errors = _Errors()
+        self.__thread = threading.Thread(
+            target=_process_tasks,
+            args=(self.__queue, self.__errors),
+            name="PersistencyWriter",
+            daemon=True,
+        )
+        self.__thread.start()
+        # Unlike atexit.register(self.close), keeps no reference to the writer.
+        self.__finalizer = weakref.finalize(self, _stop, self.__queue, self.__thread)
+
+    def __raise_error(self) -> None:
+        """Raise the first error raised by a task since the last call, if any."""
+        with self.__errors.lock:
+            error, self.__errors.first_error = self.__errors.first_error, None
+        if error is not None:
+            raise error
+
+    @property
+    def n_pending_tasks(self) -> int:
+        """The approximate number of tasks not executed yet."""
+        return self.__queue.unfinished_tasks
+
+    def submit(self, task: Callable[[], None]) -> None:
+        """Queue a task, blocking while the queue is full.
+
+        Args:
+            task: The task.
+
+        Raises:
+            RuntimeError: When the writer is closed.
+        """
+        if not self.__thread.is_alive():
+            msg = "The persistency writer is closed."
+            raise RuntimeError(msg)
+
+        self.__raise_error()
+        self.__queue.put(task)
+
+    def flush(self) -> None:
+        """Wait for the execution of the queued tasks.
+
+        Raises:
+            BaseException: The first error raised by a task since the last call.
+        """
+        self.__queue.join()
+        self.__raise_error()
+
+    def close(self) -> None:
+        """Execute the queued tasks and stop the background thread.
+
+        The errors raised by the tasks are logged but not raised.
+        """
+        self.__finalizer()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self.__queue.join()
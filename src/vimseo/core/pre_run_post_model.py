@@ -80,6 +80,15 @@ class PreRunPostModel(IntegratedModel):
     N_CPUS = 1
     """The default number of cpus used to run the model."""
 
+    @classmethod
+    def is_compatible_with(cls, load_case_name: str) -> bool:  # noqa: D102
+        families = (cls.PRE_PROC_FAMILY, cls.RUN_FAMILY, cls.POST_PROC_FAMILY)
+        if None in families:
+            return False
+        return cls._has_load_case_components(
+            (cls.PRE_PROC_FAMILY, cls.POST_PROC_FAMILY), load_case_name
+        )
+
     def __init__(self, load_case_name: str, **options):
 
         options = IntegratedModelSettings(**options).model_dump()
@@ -0,0 +1,191 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""The provenance of the model executions, resolved once per process.
+
+The provenance gathers the static facts about the process executing the models,
+namely the git version and the version of VIMSEO, the user and the machine.
+They are resolved at the first call to :func:`.get_provenance`,
+and then reused by all the executions of the process.
+
+The git version is read from the git repository of VIMSEO
+if the sources of VIMSEO are a git checkout of VIMSEO,
+so that it follows the commits checked out after the installation,
+otherwise from the provenance file shipped with the distribution if it exists,
+otherwise from the local part of the version of the installed distribution,
+e.g. ``0.1.dev1+g51cfd093d``.
+The git repository of another project,
+e.g. the one containing the virtual environment where VIMSEO is installed,
+is never used.
+The provenance file shall be written at build time,
+by running ``python -m vimseo.core.provenance`` before building the distribution;
+it is ignored by git and included in the distribution as package data.
+"""
+
+from __future__ import annotations
+
+import getpass
+import json
+import logging
+import re
+import socket
+import subprocess
+import sys
+from dataclasses import asdict
+from dataclasses import dataclass
+from functools import cache
+from os import getlogin
+from pathlib import Path
+
+from vimseo import __version__
+
+LOGGER = logging.getLogger(__name__)
+
+PROVENANCE_FILE_PATH = Path(__file__).parent.parent / "_provenance.json"
+"""The path to the provenance file written at build time."""
+
+_SOURCE_ROOT_PATH = Path(__file__).parents[3]
+"""The path to the root directory of the sources of VIMSEO in a git checkout,
+i.e. the directory containing the ``pyproject.toml`` file of VIMSEO."""
+
+_GIT_NODE_PATTERN = re.compile(r"\+g([0-9a-f]+)")
+"""The pattern of the git node in the local part of a version."""
+
+
+@dataclass(frozen=True)
+class Provenance:
+    """The static facts about the process executing the models."""
+
+    vims_git_version: str
+    """The ID of the git commit of VIMSEO, or an empty string if unknown."""
+
+    package_version: str
+    """The version of VIMSEO."""
+
+    user: str
+    """The name of the user running the process."""
+
+    machine: str
+    """The name of the machine running the process."""
+
+
+def _is_git_checkout() -> bool:
+    """Return whether the sources of VIMSEO are a git checkout of VIMSEO.
+
+    Returns:
+        Whether the root directory of the sources contains both a ``.git`` entry
+        and a ``pyproject.toml`` file.
+    """
+    return (_SOURCE_ROOT_PATH / ".git").exists() and (
+        _SOURCE_ROOT_PATH / "pyproject.toml"
+    ).is_file()
+
+
+def _get_git_version() -> str:
+    """Return the ID of the git commit checked out in the git checkout of VIMSEO.
+
+    Returns:
+        The ID of the git commit, or an empty string if git is not available.
+    """
+    try:
+        return (
+            subprocess
+            .check_output(
+                ["git", "-C", str(_SOURCE_ROOT_PATH), "rev-parse", "HEAD"],
+                stderr=subprocess.DEVNULL,
+            )
+            .decode("utf-8")
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _read_provenance_file(file_path: Path) -> dict[str, str]:
+    """Read a provenance file.
+
+    Args:
+        file_path: The path to the provenance file.
+
+    Returns:
+        The static facts of the file, or an empty dictionary if the file does not
+        exist or is not valid.
+    """
+    try:
+        return json.loads(file_path.read_text())
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        LOGGER.warning(f"The provenance file {file_path} is not valid.")
+        return {}
+
+
+@cache
+def get_provenance() -> Provenance:
+    """Return the provenance of the executions of the current process.
+
+    Returns:
+        The provenance.
+    """
+    if _is_git_checkout():
+        file_data = {}
+        vims_git_version = _get_git_version()
+    else:
+        file_data = _read_provenance_file(PROVENANCE_FILE_PATH)
+        vims_git_version = file_data.get("vims_git_version", "")
+
+    if not vims_git_version:
+        git_node = _GIT_NODE_PATTERN.search(__version__)
+        if git_node is None:
+            LOGGER.warning(
+                "Model metadata: git is not available, git commit cannot be determined."
+            )
+        else:
+            vims_git_version = git_node.group(1)
+
+    return Provenance(
+        vims_git_version=vims_git_version,
+        package_version=file_data.get("package_version", __version__),
+        user=getlogin() if sys.platform.startswith("win") else getpass.getuser(),
+        machine=socket.gethostname(),
+    )
+
+
+def write_provenance_file(file_path: str | Path = "") -> Path:
+    """Write the git version and the version of VIMSEO to a provenance file.
+
+    This function shall be called at build time, from the git checkout.
+
+    Args:
+        file_path: The path to the provenance file.
+            If empty, use :data:`.PROVENANCE_FILE_PATH`.
+
+    Returns:
+        The path to the provenance file.
+    """
+    file_path = Path(file_path) if file_path else PROVENANCE_FILE_PATH
+    provenance = get_provenance()
+    file_path.write_text(
+        json.dumps({
+            name: value
+            for name, value in asdict(provenance).items()
+            if name in {"vims_git_version", "package_version"}
+        })
+    )
+    return file_path
+
+
+if __name__ == "__main__":
+    write_provenance_file()
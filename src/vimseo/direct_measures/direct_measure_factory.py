@@ -20,12 +20,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Any
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.direct_measures.direct_measure import BaseDirectMeasure
 
 
-class DirectMeasureFactory(BaseFactory[BaseDirectMeasure[Any, Any]]):
+class DirectMeasureFactory(BaseCachedFactory[BaseDirectMeasure[Any, Any]]):
     """A factory of direct measures."""
 
     if TYPE_CHECKING:
@@ -17,14 +17,13 @@ from __future__ import annotations
 
 import logging
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.io.base_tool_io import BaseToolFileIO
 
 LOGGER = logging.getLogger(__name__)
 
 
-class IOFactory(BaseFactory):
+class IOFactory(BaseCachedFactory):
     """Analysis tool factory to create an analysis tool from a name or a class."""
 
     _CLASS = BaseToolFileIO
@@ -18,7 +18,8 @@
 from __future__ import annotations
 
 import logging
-import select
+import os
+import selectors
 import subprocess
 import sys
 import time
@@ -33,6 +34,7 @@ from vimseo.job_executor.base_job_options import BaseJobSettings
 from vimseo.job_executor.base_user_job_options import BaseUserJobSettings
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Mapping
     from collections.abc import Sequence
     from pathlib import Path
@@ -70,6 +72,12 @@ class BaseJobExecutor(metaclass=GoogleDocstringInheritanceMeta):
     _user_job_options: Mapping[str, Any]
     """The user job options."""
 
+    convergence_fetching_period: float
+    """The period, in seconds, between two fetchings of the convergence log."""
+
+    termination_detection_period: float
+    """The period, in seconds, between two checks of the termination criterion."""
+
     _COMMAND_TEMPLATE: ClassVar[str] = ""
     """The template used to generate the executed command line."""
 
@@ -79,6 +87,17 @@ class BaseJobExecutor(metaclass=GoogleDocstringInheritanceMeta):
     _IS_BLOCKING_SUBPROCESS = False
     """Whether the subprocess running the command is blocking."""
 
+    _CONVERGENCE_FETCHING_PERIOD: ClassVar[float] = 1.0
+    """The default period, in seconds, between two fetchings of the convergence log."""
+
+    _TERMINATION_DETECTION_PERIOD: ClassVar[float] = 1.0
+    """The default period, in seconds, between two checks of the termination
+    criterion."""
+
+    _PROCESS_POLLING_PERIOD: ClassVar[float] = 0.1
+    """The period, in seconds, between two checks of the subprocess exit, used only if
+    the platform cannot notify the exit of a process."""
+
     _JOB_OPTIONS_MODEL: ClassVar[BaseJobSettings] = BaseJobSettings
     """The pydantic model of the job options."""
 
@@ -97,6 +116,8 @@ class BaseJobExecutor(metaclass=GoogleDocstringInheritanceMeta):
         self._convergence_log_length = 0
         self._job_options = None
         self._user_job_options = self._USER_JOB_OPTIONS_MODEL().model_dump()
+        self.convergence_fetching_period = self._CONVERGENCE_FETCHING_PERIOD
+        self.termination_detection_period = self._TERMINATION_DETECTION_PERIOD
 
     def execute(
         self,
@@ -181,9 +202,19 @@ class BaseJobExecutor(metaclass=GoogleDocstringInheritanceMeta):
     ) -> int:
         """Execute a subprocess.
 
+        The subprocess is supervised by a selector reacting immediately to its exit
+        and to the availability of lines on its standard and error outputs.
+        The convergence fetching and the termination detection are performed
+        periodically, with periods :attr:`convergence_fetching_period`
+        and :attr:`termination_detection_period`.
+
         Args:
             cmd: The subprocess command.
             check_subprocess: Whether to check and raise an error if the subprocess fails.
+            activate_convergence_fetching: Whether to fetch periodically the log of
+                simulation convergence.
+            activate_termination_detection: Whether to stop the supervision of the
+                subprocess as soon as the termination criterion is satisfied.
 
         Returns: The error code.
         """
@@ -194,49 +225,71 @@ class BaseJobExecutor(metaclass=GoogleDocstringInheritanceMeta):
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             cwd=self._job_directory,
-            text=True,
         )
         self._convergence_log_length = 0
-        while True:
-            # wait for event on stdout and/or stderr
-            r, _, _ = select.select([proc.stdout, proc.stderr], [], [], 0.5)
-            for stream in r:
-                if stream is proc.stdout:
-                    line = stream.readline()
-                    if line:
-                        for val in line.splitlines():
-                            LOGGER.info(val)
-                elif stream is proc.stderr:
-                    line = stream.readline()
-                    if line:
-                        for val in line.splitlines():
-                            LOGGER.error(val)
-
-            if activate_convergence_fetching:
-                self._fetch_convergence()
-                time.sleep(1)
-
-            if activate_termination_detection:
-                time.sleep(1)
-                if self._is_finished():
-                    break
-
-            if proc.poll() is not None:
+        next_fetching_time = time.monotonic() + self.convergence_fetching_period
+        next_detection_time = time.monotonic() + self.termination_detection_period
+        streams = {
+            proc.stdout: _OutputStream(LOGGER.info),
+            proc.stderr: _OutputStream(LOGGER.error),
+        }
+        process_fd = _open_process_fd(proc.pid)
+        is_finished = False
+        with selectors.DefaultSelector() as selector:
+            for stream in streams:
+                selector.register(stream, selectors.EVENT_READ)
+            if process_fd is not None:
+                # The process file descriptor becomes readable when the process exits.
+                selector.register(process_fd, selectors.EVENT_READ)
+
+            while proc.poll() is None and not is_finished:
+                deadlines = []
                 if activate_convergence_fetching:
+                    deadlines.append(next_fetching_time)
+                if activate_termination_detection:
+                    deadlines.append(next_detection_time)
+                if process_fd is None:
+                    deadlines.append(time.monotonic() + self._PROCESS_POLLING_PERIOD)
+                timeout = (
+                    max(min(deadlines) - time.monotonic(), 0.0) if deadlines else None
+                )
+
+                for key, _ in selector.select(timeout):
+                    stream = streams.get(key.fileobj)
+                    if stream is not None and not stream.read(key.fd):
+                        selector.unregister(key.fileobj)
+
+                now = time.monotonic()
+                if activate_convergence_fetching and now >= next_fetching_time:
                     self._fetch_convergence()
-                break
+                    next_fetching_time = now + self.convergence_fetching_period
+                if activate_termination_detection and now >= next_detection_time:
+                    is_finished = self._is_finished()
+                    next_detection_time = now + self.termination_detection_period
+
+        if process_fd is not None:
+            os.close(process_fd)
 
         # Last bit of stuff, flushing the buffers eventually
+        for stream in streams.values():
+            stream.flush()
         remaining_stdout, remaining_stderr = proc.communicate()
         for val in (
-            remaining_stdout.splitlines() if remaining_stdout is not None else []
+            remaining_stdout.decode(errors="replace").splitlines()
+            if remaining_stdout is not None
+            else []
         ):
             LOGGER.info(val)
         for val in (
-            remaining_stderr.splitlines() if remaining_stderr is not None else []
+            remaining_stderr.decode(errors="replace").splitlines()
+            if remaining_stderr is not None
+            else []
         ):
             LOGGER.error(val)
 
+        if activate_convergence_fetching and not is_finished:
+            self._fetch_convergence()
+
         # Raise an error here if check_subprocess=True:
         if check_subprocess and proc.returncode != 0:
             raise subprocess.CalledProcessError(
@@ -247,3 +300,58 @@ class BaseJobExecutor(metaclass=GoogleDocstringInheritanceMeta):
             )
 
         return proc.returncode
+
+
+def _open_process_fd(pid: int) -> int | None:
+    """Open a file descriptor referring to a process.
+
+    Args:
+        pid: The process ID.
+
+    Returns:
+        The file descriptor,
+        or ``None`` if the platform does not support process file descriptors.
+    """
+    try:
+        return os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        return None
+
+
+class _OutputStream:
+    """An output stream of a subprocess, logged line by line."""
+
+    _READ_SIZE: ClassVar[int] = 65536
+    """The maximum number of bytes read at once."""
+
+    def __init__(self, log: Callable[[str], None]) -> None:
+        """
+        Args:
+            log: The function logging a line of the stream.
+        """  # noqa: D205, D212
+        self.__log = log
+        self.__buffer = b""
+
+    def read(self, fd: int) -> bool:
+        """Read the available bytes and log the complete lines.
+
+        Args:
+            fd: The file descriptor of the stream.
+
+        Returns:
+            Whether the end of the stream has not been reached.
+        """
+        chunk = os.read(fd, self._READ_SIZE)
+        if not chunk:
+            self.flush()
+            return False
+        *lines, self.__buffer = (self.__buffer + chunk).split(b"\n")
+        for line in lines:
+            self.__log(line.decode(errors="replace").rstrip("\r"))
+        return True
+
+    def flush(self) -> None:
+        """Log the incomplete line remaining in the buffer."""
+        if self.__buffer:
+            self.__log(self.__buffer.decode(errors="replace"))
+            self.__buffer = b""
@@ -17,12 +17,11 @@
 
 from __future__ import annotations
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.job_executor.base_executor import BaseJobExecutor
 
 
-class JobExecutorFactory(BaseFactory):
+class JobExecutorFactory(BaseCachedFactory):
     """A factory of job executors."""
 
     _CLASS = BaseJobExecutor
@@ -16,16 +16,30 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING
 from typing import ClassVar
 
 from numpy import array
+from numpy import cumsum
+from numpy import diff
+from numpy import divide
+from numpy import hstack
 from numpy import linspace
+from numpy import take_along_axis
 from numpy import vstack
 from numpy import zeros
+from numpy import zeros_like
 from scipy.interpolate import interp1d
 
 from vimseo.core.components.run.run_processor import RunProcessor
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from gemseo.typing import StrKeyMapping
+    from numpy import ndarray
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -35,6 +49,8 @@ class RunBendingTestAnalytical(RunProcessor):
 
     _X_NB_PTS: ClassVar[int] = 100
 
+    SUPPORTS_BATCH_RUN: ClassVar[bool] = True
+
     def __init__(self, **options):
         super().__init__(**options)
         self.m_func = None
@@ -54,6 +70,86 @@ class RunBendingTestAnalytical(RunProcessor):
 
         return {"dplt": displacement, "dplt_grid": displacement_grid}
 
+    def _run_batch(self, input_data: Sequence[StrKeyMapping]) -> list[StrKeyMapping]:
+        """
+        The displacement is obtained by integrating twice the piecewise-linear
+        curvature in closed form,
+        for all the samples sharing the same solver and moment grid size at once.
+        The ``IVP`` solver prescribes zero displacement and rotation at the start
+        of the grid,
+        and the ``BVP`` solver prescribes the displacements at both ends of the grid.
+        """  # noqa: D205, D212
+        sample_indices = defaultdict(list)
+        for index, data in enumerate(input_data):
+            sample_indices[data["solver"][0], data["moment_grid"].size].append(index)
+
+        output_data = [{} for _ in input_data]
+        for (solver, _), indices in sample_indices.items():
+            samples = [input_data[index] for index in indices]
+            m_grid = vstack([data["moment_grid"] for data in samples])
+            stiffness = array([
+                data["young_modulus"][0] * data["quadratic_moment"][0]
+                for data in samples
+            ])
+            curvature = (
+                -vstack([data["moment"] for data in samples]) / stiffness[:, None]
+            )
+            x = linspace(m_grid[:, 0], m_grid[:, -1], self._X_NB_PTS, axis=1)
+            w = self._integrate_twice(m_grid, curvature, x)
+            if solver == "BVP":
+                w_start = array([data["boundary"][0] for data in samples])
+                w_end = array([data["boundary"][2] for data in samples])
+                rotation = (w_end - w_start - w[:, -1]) / (x[:, -1] - x[:, 0])
+                w += w_start[:, None] + rotation[:, None] * (x - x[:, :1])
+
+            for i, index in enumerate(indices):
+                output_data[index] = {"dplt": w[i], "dplt_grid": x[i]}
+
+        return output_data
+
+    @staticmethod
+    def _integrate_twice(grid: ndarray, values: ndarray, x: ndarray) -> ndarray:
+        """Integrate twice piecewise-linear functions.
+
+        The integrals and their derivatives are zero at the start of the grids.
+
+        Args:
+            grid: The grids of the functions, shaped as ``(n_functions, n_nodes)``.
+            values: The values of the functions at the nodes,
+                shaped as ``(n_functions, n_nodes)``.
+            x: The points where to evaluate the integrals,
+                shaped as ``(n_functions, n_points)``.
+
+        Returns:
+            The values of the integrals at the points,
+            shaped as ``(n_functions, n_points)``.
+        """
+        steps = diff(grid, axis=1)
+        slopes = divide(
+            diff(values, axis=1), steps, out=zeros_like(steps), where=steps > 0
+        )
+        values = values[:, :-1]
+        first_integral = hstack((
+            zeros((grid.shape[0], 1)),
+            cumsum(values * steps + slopes * steps**2 / 2, axis=1),
+        ))[:, :-1]
+        second_integral = hstack((
+            zeros((grid.shape[0], 1)),
+            cumsum(
+                first_integral * steps + values * steps**2 / 2 + slopes * steps**3 / 6,
+                axis=1,
+            ),
+        ))[:, :-1]
+
+        segments = (x[:, :, None] >= grid[:, None, 1:-1]).sum(axis=2)
+        t = x - take_along_axis(grid, segments, axis=1)
+        return (
+            take_along_axis(second_integral, segments, axis=1)
+            + take_along_axis(first_integral, segments, axis=1) * t
+            + take_along_axis(values, segments, axis=1) * t**2 / 2
+            + take_along_axis(slopes, segments, axis=1) * t**3 / 6
+        )
+
     def solver_equations(self, input_data, m_grid, moment, solver):
         """
 
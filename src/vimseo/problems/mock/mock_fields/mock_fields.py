@@ -64,6 +64,8 @@ class MockModelFields(IntegratedModel):
 
     FIELDS_FROM_FILE: ClassVar[Mapping[str, str]] = {"pyramid": r"^Pyramid\.vtk$"}
 
+    _LOAD_CASE_COMPONENT_FAMILIES: ClassVar[Sequence[str]] = ("MockComponentField",)
+
     def __init__(self, load_case_name: str, **options):
         options = IntegratedModelSettings(**options).model_dump()
         super().__init__(
@@ -106,6 +106,10 @@ class MockModelPersistent(IntegratedModel):
         " A toy model for testing purpose of persistent data - mono-component version"
     )
 
+    _LOAD_CASE_COMPONENT_FAMILIES: ClassVar[Sequence[str]] = (
+        "MockComponentStandalonePersistent",
+    )
+
     def __init__(self, load_case_name: str, **options):
         options = IntegratedModelSettings(**options).model_dump()
         compo = ComponentFactory().create(
@@ -15,10 +15,18 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
+
 from strenum import StrEnum
 
-from vimseo.storage_management.directory_storage import DirectoryArchive
-from vimseo.storage_management.mlflow_storage import MlflowArchive
+from vimseo.storage_management.directory_storage import (
+    DirectoryArchive as DirectoryArchive,
+)
+
+if TYPE_CHECKING:
+    from vimseo.storage_management.base_archive_storage import BaseArchiveManager
 
 
 class ArchiveManager(StrEnum):
@@ -26,7 +34,35 @@ class ArchiveManager(StrEnum):
     Mlflow = "MlflowArchive"
 
 
-NAME_TO_ARCHIVE_CLASS = {
-    "DirectoryArchive": DirectoryArchive,
-    "MlflowArchive": MlflowArchive,
+_NAME_TO_ARCHIVE_MODULE = {
+    "DirectoryArchive": "vimseo.storage_management.directory_storage",
+    "MlflowArchive": "vimseo.storage_management.mlflow_storage",
 }
+"""The names of the archive classes bound to their modules.
+
+The modules are imported at first use, as MLflow is long to import.
+"""
+
+
+def get_archive_class(name: str) -> type[BaseArchiveManager]:
+    """Return an archive class.
+
+    Args:
+        name: The name of the archive class.
+
+    Returns:
+        The archive class.
+    """
+    return getattr(import_module(_NAME_TO_ARCHIVE_MODULE[name]), name)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "MlflowArchive":
+        return get_archive_class(name)
+    if name == "NAME_TO_ARCHIVE_CLASS":
+        return {
+            archive_name: get_archive_class(archive_name)
+            for archive_name in _NAME_TO_ARCHIVE_MODULE
+        }
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
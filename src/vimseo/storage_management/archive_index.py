@@ -0,0 +1,416 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""A queryable SQLite index of the results of a directory archive."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+from argparse import ArgumentParser
+from collections.abc import Mapping
+from contextlib import closing
+from numbers import Number
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+
+from vimseo.storage_management.base_storage_manager import get_experiment_directory
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from vimseo.storage_management.base_archive_storage import ArchiveResultType
+
+LOGGER = logging.getLogger(__name__)
+
+QueryConditions = Mapping[str, Number | str | tuple[Number | None, Number | None]]
+"""Conditions on variables, bound to the variable names.
+
+A condition is either a value expected for the variable,
+or a range ``(lower_bound, upper_bound)``,
+where a bound set to ``None`` is not applied.
+"""
+
+parser = ArgumentParser(
+    prog="archive_index_rebuild",
+    description="Rebuild the SQLite index of a directory archive from its result "
+    "files.",
+)
+parser.add_argument("root_directory", type=str)
+
+
+class ArchiveIndex:
+    """A SQLite index of the results of a directory archive.
+
+    The index stores the scalar inputs, the scalar outputs and the metadata of the
+    results, bound to the paths to the result files relative to the archive root.
+    It is stored in a file of the archive root directory,
+    and can be queried to find the results satisfying conditions on these variables,
+    without reading the result files.
+    The schema of the index is created with the index file.
+    """
+
+    FILE_NAME: ClassVar[str] = "archive_index.sqlite"
+    """The name of the index file."""
+
+    _TIMEOUT: ClassVar[float] = 60.0
+    """The time to wait for a lock on the index, in seconds."""
+
+    _GROUPS: ClassVar[tuple[str, ...]] = ("inputs", "outputs", "metadata")
+    """The groups of variables stored in the index."""
+
+    _SCHEMA: ClassVar[str] = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            experiment TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS variables (
+            run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+            grp TEXT NOT NULL,
+            name TEXT NOT NULL,
+            real_value REAL,
+            text_value TEXT
+        );
+        CREATE INDEX IF NOT EXISTS variables_by_real_value
+            ON variables(grp, name, real_value);
+        CREATE INDEX IF NOT EXISTS variables_by_text_value
+            ON variables(grp, name, text_value);
+        CREATE INDEX IF NOT EXISTS variables_by_run_id ON variables(run_id);
+    """
+    """The schema of the index."""
+
+    _SCHEMA_VERSION: ClassVar[int] = 1
+    """The version of the schema, stored as the user version of the index file."""
+
+    def __init__(self, root_directory: str | Path) -> None:
+        """
+        Args:
+            root_directory: The root directory of the archive.
+        """  # noqa: D205, D212
+        self._root_directory = Path(root_directory)
+        self._file_path = self._root_directory / self.FILE_NAME
+        self.__has_schema = False
+
+    @property
+    def file_path(self) -> Path:
+        """The path to the index file."""
+        return self._file_path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the index, creating it if needed.
+
+        Returns:
+            The connection.
+        """
+        self._root_directory.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._file_path, timeout=self._TIMEOUT)
+        connection.execute("PRAGMA foreign_keys = ON")
+        if not self.__has_schema:
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version < self._SCHEMA_VERSION:
+                connection.executescript(
+                    f"{self._SCHEMA}PRAGMA user_version = {self._SCHEMA_VERSION};"
+                )
+            self.__has_schema = True
+        return connection
+
+    def _get_run_id(self, result_file_path: str | Path) -> str:
+        """Return the ID of a run in the index.
+
+        Args:
+            result_file_path: The path to the result file of the run.
+
+        Returns:
+            The path to the result file relative to the archive root.
+        """
+        return Path(
+            os.path.relpath(Path(result_file_path).absolute(), self._root_directory)
+        ).as_posix()
+
+    @staticmethod
+    def _to_row_values(value: Any) -> tuple[float | None, str | None] | None:
+        """Convert the value of a variable to values of an index row.
+
+        Args:
+            value: The value of the variable.
+
+        Returns:
+            The real and text values of the row,
+            or ``None`` if the variable is not a scalar.
+        """
+        if isinstance(value, Number) and not isinstance(value, complex):
+            return float(value), None
+        if isinstance(value, str):
+            return None, str(value)
+        return None
+
+    def add(
+        self,
+        result_file_path: str | Path,
+        experiment_name: str,
+        archive_result: ArchiveResultType,
+    ) -> None:
+        """Add a result to the index, replacing the one of the same run if any.
+
+        Args:
+            result_file_path: The path to the result file.
+            experiment_name: The name of the experiment of the run.
+            archive_result: The archived result.
+        """
+        with closing(self._connect()) as connection, connection:
+            self._add(connection, result_file_path, experiment_name, archive_result)
+
+    def _add(
+        self,
+        connection: sqlite3.Connection,
+        result_file_path: str | Path,
+        experiment_name: str,
+        archive_result: ArchiveResultType,
+    ) -> None:
+        """Add a result to the index, replacing the one of the same run if any.
+
+        Args:
+            connection: The connection to the index.
+            result_file_path: The path to the result file.
+            experiment_name: The name of the experiment of the run.
+            archive_result: The archived result.
+        """
+        run_id = self._get_run_id(result_file_path)
+        connection.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+        connection.execute(
+            "INSERT INTO runs VALUES (?, ?)",
+            (run_id, Path(experiment_name).as_posix()),
+        )
+        rows = []
+        for group in self._GROUPS:
+            for name, value in archive_result.get(group, {}).items():
+                row_values = self._to_row_values(value)
+                if row_values is not None:
+                    rows.append((run_id, group, name, *row_values))
+        connection.executemany("INSERT INTO variables VALUES (?, ?, ?, ?, ?)", rows)
+
+    def rebuild(self, result_file_name: str = "results.json") -> int:
+        """Rebuild the index from the result files of the archive.
+
+        The index is replaced in a single transaction,
+        such that the index queried concurrently is either the former or the new one.
+
+        Args:
+            result_file_name: The name of the result files.
+
+        Returns:
+            The number of indexed results.
+        """
+        n_results = 0
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM runs")
+            for root, _, files in os.walk(self._root_directory):
+                if result_file_name not in files:
+                    continue
+
+                result_file_path = Path(root) / result_file_name
+                try:
+                    archive_result = json.loads(result_file_path.read_text())
+                except ValueError:
+                    LOGGER.warning("The result file %s is not valid.", result_file_path)
+                    continue
+
+                experiment_name = get_experiment_directory(
+                    Path(os.path.relpath(root, self._root_directory))
+                )
+                self._add(connection, result_file_path, experiment_name, archive_result)
+                n_results += 1
+
+        LOGGER.info(f"{n_results} results indexed in {self._file_path}.")
+        return n_results
+
+    def query(
+        self,
+        experiment_name: str | None = None,
+        inputs: QueryConditions | None = None,
+        outputs: QueryConditions | None = None,
+        metadata: QueryConditions | None = None,
+    ) -> list[Path]:
+        """Find the results satisfying conditions.
+
+        Args:
+            experiment_name: The name of the experiment of the results.
+                If ``None``, consider all the experiments.
+            inputs: The conditions on the inputs.
+                If ``None``, do not apply conditions on the inputs.
+            outputs: The conditions on the outputs.
+                If ``None``, do not apply conditions on the outputs.
+            metadata: The conditions on the metadata.
+                If ``None``, do not apply conditions on the metadata.
+
+        Returns:
+            The paths to the result files, ordered by path.
+        """
+        clauses = []
+        parameters = []
+        if experiment_name is not None:
+            clauses.append("experiment = ?")
+            parameters.append(Path(experiment_name).as_posix())
+
+        for group, conditions in zip(
+            self._GROUPS, (inputs, outputs, metadata), strict=True
+        ):
+            for name, condition in (conditions or {}).items():
+                clause, clause_parameters = self._get_clause(group, name, condition)
+                clauses.append(clause)
+                parameters.extend(clause_parameters)
+
+        statement = "SELECT run_id FROM runs"
+        if clauses:
+            statement += " WHERE " + " AND ".join(clauses)
+        statement += " ORDER BY run_id"
+
+        with closing(self._connect()) as connection:
+            run_ids = [row[0] for row in connection.execute(statement, parameters)]
+        return [self._root_directory / run_id for run_id in run_ids]
+
+    def _get_clause(
+        self, group: str, name: str, condition: Any
+    ) -> tuple[str, list[Any]]:
+        """Return the SQL clause of a condition on a variable.
+
+        Args:
+            group: The group of the variable.
+            name: The name of the variable.
+            condition: The condition.
+
+        Returns:
+            The SQL clause and its parameters.
+        """
+        clause = (
+            "EXISTS (SELECT 1 FROM variables WHERE variables.run_id = runs.run_id "
+            "AND grp = ? AND name = ?"
+        )
+        parameters = [group, name]
+        if isinstance(condition, tuple):
+            lower_bound, upper_bound = condition
+            if lower_bound is not None:
+                clause += " AND real_value >= ?"
+                parameters.append(float(lower_bound))
+            if upper_bound is not None:
+                clause += " AND real_value <= ?"
+                parameters.append(float(upper_bound))
+        else:
+            real_value, text_value = self._get_expected_row_values(
+                group, name, condition
+            )
+            if real_value is None:
+                clause += " AND text_value = ?"
+                parameters.append(text_value)
+            else:
+                clause += " AND real_value = ?"
+                parameters.append(real_value)
+
+        return f"{clause})", parameters
+
+    @classmethod
+    def _get_expected_row_values(
+        cls, group: str, name: str, condition: Any
+    ) -> tuple[float | None, str | None]:
+        """Return the values of an index row expected by a scalar condition.
+
+        Args:
+            group: The group of the variable.
+            name: The name of the variable.
+            condition: The condition.
+
+        Returns:
+            The real and text values of the row.
+
+        Raises:
+            ValueError: When the condition is not a scalar.
+        """
+        row_values = cls._to_row_values(condition)
+        if row_values is None:
+            msg = (
+                f"The condition on {group} {name} must be a scalar or a range; "
+                f"got {condition}."
+            )
+            raise ValueError(msg)
+        return row_values
+
+    @classmethod
+    def create_filter(
+        cls,
+        inputs: QueryConditions | None = None,
+        outputs: QueryConditions | None = None,
+        metadata: QueryConditions | None = None,
+    ) -> Callable[[ArchiveResultType], bool]:
+        """Create a filter of archived results, applying conditions without the index.
+
+        The conditions are interpreted as in :meth:`.query`.
+
+        Args:
+            inputs: The conditions on the inputs.
+                If ``None``, do not apply conditions on the inputs.
+            outputs: The conditions on the outputs.
+                If ``None``, do not apply conditions on the outputs.
+            metadata: The conditions on the metadata.
+                If ``None``, do not apply conditions on the metadata.
+
+        Returns:
+            A predicate checking whether an archived result satisfies the conditions.
+        """
+        conditions = []
+        for group, group_conditions in zip(
+            cls._GROUPS, (inputs, outputs, metadata), strict=True
+        ):
+            for name, condition in (group_conditions or {}).items():
+                if isinstance(condition, tuple):
+                    expected_row_values = None
+                else:
+                    expected_row_values = cls._get_expected_row_values(
+                        group, name, condition
+                    )
+                conditions.append((group, name, condition, expected_row_values))
+
+        def satisfies(archive_result: ArchiveResultType) -> bool:
+            for group, name, condition, expected_row_values in conditions:
+                row_values = cls._to_row_values(archive_result.get(group, {}).get(name))
+                if row_values is None:
+                    return False
+                if expected_row_values is not None:
+                    if row_values != expected_row_values:
+                        return False
+                    continue
+                real_value = row_values[0]
+                lower_bound, upper_bound = condition
+                if (
+                    real_value is None
+                    or (lower_bound is not None and real_value < lower_bound)
+                    or (upper_bound is not None and real_value > upper_bound)
+                ):
+                    return False
+            return True
+
+        return satisfies
+
+
+def main():
+    arguments = vars(parser.parse_args())
+    ArchiveIndex(arguments["root_directory"]).rebuild()
+
+
+if __name__ == "__main__":
+    main()
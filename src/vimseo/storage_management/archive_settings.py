@@ -22,6 +22,7 @@ from pydantic import Field
 from vimseo.config.global_configuration import _configuration as config
 from vimseo.storage_management.base_storage_manager import PersistencyPolicy
 from vimseo.tools.base_settings import BaseSettings
+from vimseo.utilities.file_utils import FileTransferMethod
 
 DEFAULT_ARCHIVE_ROOT = "default_archive/"
 
@@ -53,3 +54,36 @@ class BaseArchiveSettings(BaseSettings):
         description="Whether to delete the archive job directory after "
         "post-processing.",
     )
+
+    archive_array_size_threshold: int = Field(
+        default=0,
+        ge=0,
+        description="The size from which the numerical arrays of a result are stored "
+        "in a binary file of the archive, separately from the scalars and metadata. "
+        "By default, all the arrays are stored with the scalars and metadata.",
+    )
+
+    persistent_file_transfer_method: FileTransferMethod = Field(
+        default=FileTransferMethod.AUTO,
+        description="The method to transfer the persistent files from the scratch "
+        "job directory to the directory archive. "
+        "By default, the files are moved when the scratch job directory is deleted, "
+        "and cloned with copy-on-write otherwise, falling back to a copy "
+        "when cloning is not supported.",
+    )
+
+    archive_deduplicate_files: bool = Field(
+        default=False,
+        description="Whether to store the persistent files of the directory archive "
+        "in a content-addressed store of its root directory, "
+        "such that the byte-identical files of several jobs are stored once "
+        "and hard-linked to the job directories.",
+    )
+
+    archive_index_results: bool = Field(
+        default=True,
+        description="Whether to add each result of the directory archive "
+        "to the SQLite index of its root directory when it is published, "
+        "and to query the archive through this index. "
+        "Otherwise, the archive is queried by reading all its result files.",
+    )
@@ -26,12 +26,16 @@ from numpy import ndarray
 from vimseo.core.model_metadata import DEFAULT_METADATA
 from vimseo.core.model_metadata import MetaDataNames
 from vimseo.storage_management.base_storage_manager import BaseStorageManager
+from vimseo.utilities.file_utils import FileTransferMethod
 from vimseo.utilities.model_data import decapsulate_length_one_array
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from pathlib import Path
 
+    from typing_extensions import Self
+
+    from vimseo.storage_management.archive_index import QueryConditions
     from vimseo.storage_management.base_storage_manager import PersistencyPolicy
 
 # TODO change to dataclasses
@@ -62,13 +66,22 @@ class BaseArchiveManager(BaseStorageManager):
         persistency: PersistencyPolicy,
         job_name: str = "",
         persistent_file_names: Iterable[str] = (),
+        array_size_threshold: int = 0,
+        file_transfer_method: FileTransferMethod = FileTransferMethod.AUTO,
     ):
         super().__init__(persistency)
         self._job_name = job_name
         self._persistent_file_names = persistent_file_names
+        self._array_size_threshold = array_size_threshold
+        self._file_transfer_method = file_transfer_method
         self._experiment_name = ""
         self._current_run_id = ""
 
+    def copy_for_current_job(self) -> Self:
+        archive_manager = super().copy_for_current_job()
+        archive_manager._persistent_file_names = list(self._persistent_file_names)
+        return archive_manager
+
     def add_persistent_file_names(self, persistent_file_names: Iterable[str]):
         self._persistent_file_names += persistent_file_names
 
@@ -77,6 +90,19 @@ class BaseArchiveManager(BaseStorageManager):
         """The names of the files that will be copied to the archive directory."""
         return self._persistent_file_names
 
+    @property
+    def array_size_threshold(self) -> int:
+        """The size from which the numerical arrays are stored in a binary format.
+
+        Zero means that no array is stored in a binary format.
+        """
+        return self._array_size_threshold
+
+    @property
+    def file_transfer_method(self) -> FileTransferMethod:
+        """The method to transfer the persistent files to the archive."""
+        return self._file_transfer_method
+
     @property
     def uri(self) -> str:
         """The database root directory."""
@@ -132,6 +158,46 @@ class BaseArchiveManager(BaseStorageManager):
     def get_result(self, archive_id: str | Path) -> ModelDataType:
         """Get an archived result."""
 
+    @abstractmethod
+    def get_run_versions(
+        self, run_ids: Iterable[str] = (), start_time: float = 0.0
+    ) -> dict[str, str]:
+        """Return the versions of the archived runs.
+
+        The version of a run changes when its result is modified.
+
+        Args:
+            run_ids: The IDs of the runs, as passed to ``get_archived_results``.
+                If empty, consider all the runs of the current experiment.
+            start_time: The time, in seconds since the epoch,
+                after which the runs have been created or modified.
+                If zero, consider all the runs.
+
+        Returns:
+            The versions of the runs, bound to the run IDs.
+        """
+
+    @abstractmethod
+    def query(
+        self,
+        inputs: QueryConditions | None = None,
+        outputs: QueryConditions | None = None,
+        metadata: QueryConditions | None = None,
+    ) -> list[str] | list[Path]:
+        """Find the runs of the current experiment satisfying conditions.
+
+        Args:
+            inputs: The conditions on the scalar inputs.
+                If ``None``, do not apply conditions on the inputs.
+            outputs: The conditions on the scalar outputs.
+                If ``None``, do not apply conditions on the outputs.
+            metadata: The conditions on the metadata.
+                If ``None``, do not apply conditions on the metadata.
+
+        Returns:
+            The IDs of the runs, as passed to ``get_archived_results``.
+        """
+
     def set_experiment(self, experiment_name: str):
         """Set an experiment."""
 
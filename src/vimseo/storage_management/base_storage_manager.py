@@ -16,14 +16,21 @@
 from __future__ import annotations
 
 import logging
+import re
 from abc import abstractmethod
+from copy import copy
 from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
 
 from docstring_inheritance import GoogleDocstringInheritanceMeta
 from gemseo.utils.directory_creator import DirectoryCreator
 from gemseo.utils.directory_creator import DirectoryNamingMethod
 from strenum import StrEnum
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -43,6 +50,50 @@ class PersistencyPolicy(StrEnum):
     """Delete job directory only if job faulty."""
 
 
+class JobDirectoryLayout(StrEnum):
+    """The layout of the job directories in an experiment directory."""
+
+    FLAT = "FLAT"
+    """The job directories are created in the experiment directory,
+    and named with the directory naming method.
+
+    The numbered naming lists the experiment directory to find the next number.
+    """
+
+    SHARDED = "SHARDED"
+    """The job directories are named with a UUID,
+    and created in a sub-directory named by the first characters of the UUID.
+
+    The creation of a job directory does not list the experiment directory,
+    and is free of collisions between concurrent jobs.
+    """
+
+
+_SHARD_PREFIX_LENGTH = 2
+"""The number of characters of the UUID naming the shard of a job directory."""
+
+_SHARDED_JOB_NAME_PATTERN = re.compile(r"[0-9a-f]{32}")
+"""The pattern of the name of a job directory in a sharded layout."""
+
+
+def get_experiment_directory(job_directory: Path) -> Path:
+    """Return the experiment directory of a job directory created without job name.
+
+    Args:
+        job_directory: The job directory.
+
+    Returns:
+        The experiment directory.
+    """
+    job_directory = Path(job_directory)
+    if (
+        _SHARDED_JOB_NAME_PATTERN.fullmatch(job_directory.name)
+        and job_directory.parent.name == job_directory.name[:_SHARD_PREFIX_LENGTH]
+    ):
+        return job_directory.parent.parent
+    return job_directory.parent
+
+
 class BaseStorageManager(metaclass=GoogleDocstringInheritanceMeta):
     """File storage system for both scratch and archive."""
 
@@ -60,6 +111,7 @@ class BaseStorageManager(metaclass=GoogleDocstringInheritanceMeta):
         self._persistency = persistency
         self._job_directory = ""
         self._directory_naming_method = DirectoryNamingMethod.NUMBERED
+        self._job_directory_layout = JobDirectoryLayout.FLAT
 
     def whether_to_delete(self, job_error_code: int) -> bool:
         """Determine whether the job_directory should be deleted, depending on the
@@ -87,6 +139,34 @@ class BaseStorageManager(metaclass=GoogleDocstringInheritanceMeta):
         """The directory of the current run."""
         return self._job_directory
 
+    @property
+    def directory_naming_method(self) -> DirectoryNamingMethod:
+        """The method to name the job directories when no job name is defined."""
+        return self._directory_naming_method
+
+    @directory_naming_method.setter
+    def directory_naming_method(self, value: DirectoryNamingMethod) -> None:
+        self._directory_naming_method = value
+
+    @property
+    def job_directory_layout(self) -> JobDirectoryLayout:
+        """The layout of the job directories when no job name is defined."""
+        return self._job_directory_layout
+
+    @job_directory_layout.setter
+    def job_directory_layout(self, value: JobDirectoryLayout) -> None:
+        self._job_directory_layout = value
+
+    def copy_for_current_job(self) -> Self:
+        """Return a copy of the storage manager bound to the current job directory.
+
+        The copy is not affected by the creation of the next job directories.
+
+        Returns:
+            The copy of the storage manager.
+        """
+        return copy(self)
+
     def _create_job_directory(
         self,
         root_directory: Path,
@@ -112,6 +192,13 @@ class BaseStorageManager(metaclass=GoogleDocstringInheritanceMeta):
                 )
                 raise FileExistsError(msg) from err
 
+        elif self._job_directory_layout == JobDirectoryLayout.SHARDED:
+            name = uuid4().hex
+            job_directory = (
+                root_directory / job_dir_prefix / name[:_SHARD_PREFIX_LENGTH] / name
+            )
+            job_directory.mkdir(parents=True)
+
         else:
             job_directory = DirectoryCreator(
                 root_directory=root_directory / job_dir_prefix,
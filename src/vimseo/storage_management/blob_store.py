@@ -0,0 +1,187 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""A content-addressed store of the files of a directory archive."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import ClassVar
+from uuid import uuid4
+
+LOGGER = logging.getLogger(__name__)
+
+parser = ArgumentParser(
+    prog="archive_blob_gc",
+    description="Remove the blobs of a directory archive that are not referenced "
+    "by a job directory anymore.",
+)
+parser.add_argument("root_directory", type=str)
+
+
+class BlobStore:
+    """A store of files named by the hash of their contents.
+
+    A file added to the store is written once as a blob,
+    and the job directories reference the blob through hard links.
+    Consequently,
+    the byte-identical files of several runs use the disk space of a single file.
+    When the filesystem does not support hard links,
+    the blob is copied to the job directory.
+
+    The number of links to a blob counts the job directories referencing it,
+    such that deleting a job directory releases its references.
+    The blobs that are not referenced anymore are removed by
+    :meth:`.collect_garbage`.
+
+    Warnings:
+        The files of the job directories must not be modified in place,
+        as the modification would affect the files of the other job directories
+        sharing the same blob.
+    """
+
+    DIRECTORY_NAME: ClassVar[str] = "blobs"
+    """The name of the directory of the blobs in the archive root directory."""
+
+    _SHARD_PREFIX_LENGTH: ClassVar[int] = 2
+    """The number of characters of the hash used to name the sub-directories."""
+
+    _CHUNK_SIZE: ClassVar[int] = 1 << 20
+    """The size of the chunks of a file read to compute its hash, in bytes."""
+
+    _TEMPORARY_SUFFIX: ClassVar[str] = ".tmp"
+    """The suffix of the blobs being written."""
+
+    def __init__(self, root_directory: str | Path) -> None:
+        """
+        Args:
+            root_directory: The root directory of the archive.
+        """  # noqa: D205, D212
+        self._directory_path = Path(root_directory) / self.DIRECTORY_NAME
+
+    @property
+    def directory_path(self) -> Path:
+        """The path to the directory of the blobs."""
+        return self._directory_path
+
+    @classmethod
+    def hash_file(cls, file_path: str | Path) -> str:
+        """Compute the hash of the contents of a file.
+
+        Args:
+            file_path: The path to the file.
+
+        Returns:
+            The SHA-256 hash of the file contents.
+        """
+        file_hash = hashlib.sha256()
+        with Path(file_path).open("rb") as f:
+            while chunk := f.read(cls._CHUNK_SIZE):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    def get_blob_path(self, file_hash: str) -> Path:
+        """Return the path to a blob.
+
+        Args:
+            file_hash: The hash of the contents of the blob.
+
+        Returns:
+            The path to the blob.
+        """
+        return self._directory_path / file_hash[: self._SHARD_PREFIX_LENGTH] / file_hash
+
+    def add(
+        self, file_path: str | Path, target: str | Path, move: bool = False
+    ) -> Path:
+        """Add a file to the store and reference it from a path.
+
+        Args:
+            file_path: The path to the file.
+            target: The path referencing the blob of the file.
+                An existing file is replaced.
+            move: Whether to move the file to the store
+                when its contents are not stored yet, instead of copying it.
+
+        Returns:
+            The path to the blob.
+        """
+        file_path = Path(file_path)
+        blob_path = self.get_blob_path(self.hash_file(file_path))
+        if not blob_path.is_file():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = blob_path.with_name(
+                f"{blob_path.name}.{uuid4().hex}{self._TEMPORARY_SUFFIX}"
+            )
+            if move:
+                shutil.move(file_path, temporary_path)
+            else:
+                shutil.copyfile(file_path, temporary_path)
+            try:
+                # Linking does not replace a blob written concurrently,
+                # whose links must be kept.
+                os.link(temporary_path, blob_path)
+            except FileExistsError:
+                pass
+            except OSError:
+                temporary_path.replace(blob_path)
+            finally:
+                temporary_path.unlink(missing_ok=True)
+
+        target = Path(target)
+        target.unlink(missing_ok=True)
+        try:
+            os.link(blob_path, target)
+        except OSError as err:
+            LOGGER.debug(f"Falling back to a copy of the blob {blob_path}: {err!s}")
+            shutil.copyfile(blob_path, target)
+        return blob_path
+
+    def collect_garbage(self) -> int:
+        """Remove the blobs that are not referenced by a job directory anymore.
+
+        This method must not be called while jobs are writing to the archive.
+
+        Returns:
+            The number of removed blobs.
+        """
+        if not self._directory_path.is_dir():
+            return 0
+
+        n_removed_blobs = 0
+        for blob_path in self._directory_path.glob("*/*"):
+            if blob_path.suffix == self._TEMPORARY_SUFFIX:
+                continue
+
+            if blob_path.stat().st_nlink <= 1:
+                blob_path.unlink(missing_ok=True)
+                n_removed_blobs += 1
+
+        LOGGER.info(f"{n_removed_blobs} blobs removed from {self._directory_path}.")
+        return n_removed_blobs
+
+
+def main():
+    arguments = vars(parser.parse_args())
+    BlobStore(arguments["root_directory"]).collect_garbage()
+
+
+if __name__ == "__main__":
+    main()
@@ -19,19 +19,33 @@ import json
 import logging
 import os
 import shutil
-from copy import deepcopy
+import sqlite3
+import tempfile
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
 
 import numpy as np
 
 from vimseo.config.global_configuration import _configuration as config
+from vimseo.storage_management.archive_index import ArchiveIndex
 from vimseo.storage_management.base_archive_storage import BaseArchiveManager
+from vimseo.storage_management.blob_store import BlobStore
+from vimseo.utilities.file_utils import FileTransferMethod
+from vimseo.utilities.file_utils import transfer_file
 from vimseo.utilities.json_grammar_utils import EnhancedJSONEncoderArchive
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
     from collections.abc import Sequence
 
+    from vimseo.storage_management.archive_index import QueryConditions
     from vimseo.storage_management.base_archive_storage import ArchiveResultType
     from vimseo.storage_management.base_archive_storage import ModelDataType
     from vimseo.storage_management.base_storage_manager import PersistencyPolicy
@@ -39,11 +53,32 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 
+def _has_metadata(
+    metadata: Mapping[str, Any], expected_metadata: Mapping[str, Any]
+) -> bool:
+    """Check whether metadata have the expected values.
+
+    Args:
+        metadata: The metadata.
+        expected_metadata: The expected values, bound to metadata names.
+
+    Returns:
+        Whether the metadata have the expected values.
+    """
+    return all(metadata.get(name) == value for name, value in expected_metadata.items())
+
+
 class DirectoryArchive(BaseArchiveManager):
     """A database of model results stored in local directories."""
 
     _RESULTS_JSON_FILE = "results.json"
 
+    _BINARY_ARRAYS_FILE: ClassVar[str] = "results_arrays.bin"
+    """The name of the binary file storing the large arrays of a result."""
+
+    _BINARY_ARRAY_KEY: ClassVar[str] = "__binary_array__"
+    """The key of the JSON object describing an array stored in the binary file."""
+
     def __init__(
         self,
         persistency: PersistencyPolicy,
@@ -52,8 +87,35 @@ class DirectoryArchive(BaseArchiveManager):
         root_directory: Path | str = "",
         job_name="",
         persistent_file_names=(),
+        array_size_threshold: int = 0,
+        file_transfer_method: FileTransferMethod = FileTransferMethod.AUTO,
+        deduplicate_files: bool = False,
+        index_results: bool = True,
     ):
-        super().__init__(persistency, job_name, persistent_file_names)
+        """
+        Args:
+            array_size_threshold: The size from which the numerical arrays of the
+                inputs and outputs are stored in a binary file of the job directory,
+                which is memory-mapped when reading the result.
+                If zero, all the arrays are stored in the JSON result file.
+            file_transfer_method: The method to transfer the persistent files from
+                the scratch job directory to the archive job directory.
+            deduplicate_files: Whether to store the persistent files in a
+                :class:`.BlobStore` of the root directory,
+                referenced by the job directories through hard links.
+            index_results: Whether to add each published result to the
+                :class:`.ArchiveIndex` of the root directory,
+                which is built from the result files if it does not exist,
+                and to query the archive through this index.
+                Otherwise, the archive is queried by reading all its result files.
+        """  # noqa: D205, D212
+        super().__init__(
+            persistency,
+            job_name,
+            persistent_file_names,
+            array_size_threshold,
+            file_transfer_method,
+        )
         self._root_directory = root_directory
         self._experiment_name = (
             config.database.experiment_name
@@ -62,6 +124,9 @@ class DirectoryArchive(BaseArchiveManager):
         )
         self._job_directory = ""
         self._accept_overwrite_job_dir = False
+        self._index = ArchiveIndex(root_directory)
+        self._index_results = index_results
+        self._blob_store = BlobStore(root_directory) if deduplicate_files else None
 
     @property
     def root_directory(self) -> str:
@@ -87,74 +152,299 @@ class DirectoryArchive(BaseArchiveManager):
             shutil.rmtree(str(job_dir))
 
     def get_archived_results(self, run_ids: Sequence[str] | Sequence[Path] = ()):
+        if not self._check_root_archive():
+            return None
+
+        return list(self.iter_archived_results(run_ids))
+
+    def iter_archived_results(
+        self,
+        run_ids: Sequence[str] | Sequence[Path] = (),
+        metadata_filter: Callable[[Mapping[str, Any]], bool]
+        | Mapping[str, Any]
+        | None = None,
+        batch_size: int = 64,
+        n_threads: int = 4,
+    ) -> Iterator[ModelDataType]:
+        """Iterate over the archived results.
+
+        The result files are found lazily and parsed by batches with a pool of threads.
+        The results are yielded in the order of the result files,
+        as soon as their batch is parsed.
+
+        Args:
+            run_ids: The IDs of the runs, i.e. the paths to their result files.
+                If empty, consider all the runs of the current experiment.
+            metadata_filter: A filter on the metadata of the results,
+                applied before decoding them.
+                Either a predicate taking the metadata of a result,
+                with length-one arrays as items, e.g. ``error_code`` as an integer,
+                or a mapping from metadata names to the expected values.
+                If ``None``, yield all the results.
+            batch_size: The number of result files parsed in a batch.
+            n_threads: The number of threads parsing the result files.
+
+        Yields:
+            The results, with the path to their archive job directory
+            and their rank in the iteration.
+        """
+        if not self._check_root_archive():
+            return
+
+        if isinstance(metadata_filter, Mapping):
+            metadata_filter = partial(
+                _has_metadata, expected_metadata=dict(metadata_filter)
+            )
+
+        target_files = iter(run_ids) if len(run_ids) > 0 else self._iter_result_files()
+        result_id = 0
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            while batch := list(islice(target_files, batch_size)):
+                for file, directory_result in zip(
+                    batch, executor.map(self._read_result_file, batch), strict=True
+                ):
+                    if metadata_filter is not None and not metadata_filter(
+                        directory_result["metadata"]
+                    ):
+                        continue
 
-        root_archive = self._root_directory / self._experiment_name
-        root_archive = Path(root_archive)
+                    result_id += 1
+                    yield {
+                        **self._decode_result(directory_result),
+                        "dir_archive_job": Path(file).parent,
+                        "ID": result_id,
+                    }
 
+    def _check_root_archive(self) -> bool:
+        """Check whether the directory of the current experiment exists."""
+        root_archive = Path(self._root_directory / self._experiment_name)
         if not root_archive.is_dir():
             LOGGER.info(
                 f"root_archive to be imported is not yet a directory (empty): {root_archive}",
             )
-            return None
+            return False
+        return True
+
+    def _read_result_file(self, file: str | Path) -> ArchiveResultType:
+        """Read a result file without decoding it.
+
+        The arrays stored in the binary file of the job directory are memory-mapped.
 
-        if len(run_ids) > 0:
-            target_files = run_ids
-        else:
-            target_files = []
-            for root, _, files in os.walk(root_archive):
-                if self._RESULTS_JSON_FILE in files:
-                    target_files.append(Path(root) / self._RESULTS_JSON_FILE)
-
-        results = [{} for f in target_files]
-
-        for i, file in enumerate(target_files):
-            archive_dir = Path(file).parent
-            try:
-                archive_result = self.get_result(archive_dir)
-            except FileNotFoundError as err:  # noqa: BLE001
-                msg = f"{err!s} \nError encountered while parsing file {file}"
-                raise FileNotFoundError(msg) from err
-
-            # wrap job results in the #i item of the bundle
-            results[i] = {
-                **archive_result,
-                "dir_archive_job": archive_dir,
-                "ID": i + 1,
-            }
-
-        return results
-
-    def copy_persistent_files(self, src_dir: Path | str) -> None:
-        if src_dir == "":
+        Args:
+            file: The path to the result file.
+
+        Returns:
+            The archived result.
+        """
+        try:
+            with Path(file).open() as f:
+                directory_result = json.load(f)
+        except FileNotFoundError as err:
+            msg = f"{err!s} \nError encountered while parsing file {file}"
+            raise FileNotFoundError(msg) from err
+
+        binary_file_path = Path(file).parent / self._BINARY_ARRAYS_FILE
+        for group in ["inputs", "outputs"]:
+            data = directory_result[group]
+            for name, value in data.items():
+                if isinstance(value, dict) and self._BINARY_ARRAY_KEY in value:
+                    description = value[self._BINARY_ARRAY_KEY]
+                    data[name] = np.memmap(
+                        binary_file_path,
+                        dtype=np.dtype(description["dtype"]),
+                        mode="r",
+                        offset=description["offset"],
+                        shape=tuple(description["shape"]),
+                    )
+
+        return directory_result
+
+    def _iter_result_files(self) -> Iterator[Path]:
+        """Iterate over the paths to the result files of the current experiment."""
+        for root, _, files in os.walk(
+            Path(self._root_directory) / self._experiment_name
+        ):
+            if self._RESULTS_JSON_FILE in files:
+                yield Path(root) / self._RESULTS_JSON_FILE
+
+    def get_run_versions(
+        self, run_ids: Sequence[str] | Sequence[Path] = (), start_time: float = 0.0
+    ) -> dict[str, str]:
+        """
+        The ID of a run is the path to its result file,
+        and its version is the modification time of this file.
+        """  # noqa: D205, D212
+        target_files = run_ids if len(run_ids) > 0 else self._iter_result_files()
+        start_time_ns = int(start_time * 1e9)
+        run_versions = {}
+        for file in target_files:
+            file = Path(file)
+            if file.is_file() and (mtime_ns := file.stat().st_mtime_ns) > start_time_ns:
+                run_versions[str(file)] = str(mtime_ns)
+        return run_versions
+
+    def copy_persistent_files(
+        self, src_dir: Path | str, delete_source: bool = False
+    ) -> None:
+        """
+        Args:
+            delete_source: Whether the source directory is deleted afterwards,
+                in which case the automatic transfer method moves the files
+                instead of copying them.
+        """  # noqa: D205, D212
+        if src_dir == "" or not Path(self._job_directory).is_dir():
+            # The archive job directory has been deleted by the persistency policy.
             return
 
         for file_name in self._persistent_file_names:
             target = src_dir / file_name
-            if target.is_file():
-                shutil.copy(str(target), str(self._job_directory))
-            else:
+            if not target.is_file():
                 LOGGER.warning(
                     f"The file {target} was meant to be copied "
                     f"from the scratch directory to the archive "
                     f"but it was not found."
                 )
+            elif self._blob_store is None:
+                transfer_file(
+                    target,
+                    Path(self._job_directory),
+                    self._file_transfer_method,
+                    delete_source,
+                )
+            else:
+                self._blob_store.add(
+                    target,
+                    Path(self._job_directory) / file_name,
+                    move=self._file_transfer_method == FileTransferMethod.MOVE
+                    or (
+                        delete_source
+                        and self._file_transfer_method == FileTransferMethod.AUTO
+                    ),
+                )
 
     def publish(self, archive_result: ArchiveResultType) -> None:
-        Path(self._job_directory / self._RESULTS_JSON_FILE).write_text(
-            json.dumps(archive_result, cls=EnhancedJSONEncoderArchive)
+        result_file_path = Path(self._job_directory / self._RESULTS_JSON_FILE)
+        result_file_path.write_text(
+            json.dumps(
+                self._encode_result(archive_result), cls=EnhancedJSONEncoderArchive
+            )
+        )
+        if not self._index_results:
+            return
+
+        try:
+            if self._index.file_path.exists():
+                self._index.add(result_file_path, self._experiment_name, archive_result)
+            else:
+                self._index.rebuild(self._RESULTS_JSON_FILE)
+        except sqlite3.Error as err:
+            LOGGER.warning(
+                f"The result {result_file_path} could not be indexed: {err!s}. "
+                f"Rebuild the index with archive_index_rebuild."
+            )
+
+    @property
+    def index(self) -> ArchiveIndex:
+        """The index of the results of the archive."""
+        return self._index
+
+    @property
+    def blob_store(self) -> BlobStore | None:
+        """The store of the persistent files, if they are deduplicated."""
+        return self._blob_store
+
+    def query(
+        self,
+        inputs: QueryConditions | None = None,
+        outputs: QueryConditions | None = None,
+        metadata: QueryConditions | None = None,
+    ) -> list[Path]:
+        """
+        The IDs of the runs are the paths to their result files.
+        """  # noqa: D205, D212
+        if not self._index_results:
+            result_filter = ArchiveIndex.create_filter(inputs, outputs, metadata)
+            if not self._check_root_archive():
+                return []
+
+            return sorted(
+                result_file_path
+                for result_file_path in self._iter_result_files()
+                if result_filter(json.loads(result_file_path.read_text()))
+            )
+
+        if not self._index.file_path.exists():
+            self._index.rebuild(self._RESULTS_JSON_FILE)
+
+        return self._index.query(
+            experiment_name=self._experiment_name,
+            inputs=inputs,
+            outputs=outputs,
+            metadata=metadata,
         )
 
     def _encode_result(self, archive_result: ArchiveResultType) -> ArchiveResultType:
-        """Encode a job result, from ModelResult format to an archived format."""
-        return archive_result
+        """Encode a job result, from ModelResult format to an archived format.
+
+        The numerical arrays of the inputs and outputs whose size is at least
+        :attr:`.array_size_threshold` are written to a binary file of the job
+        directory, and replaced by their description in this file.
+        This file is written before the JSON file of the result is published.
+        """
+        if not self._array_size_threshold:
+            return archive_result
+
+        encoded_result = dict(archive_result)
+        binary_file_path = Path(self._job_directory) / self._BINARY_ARRAYS_FILE
+        # The arrays are written to a temporary file renamed at the end,
+        # such that a reader never finds a partially written file.
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            suffix=".tmp", dir=binary_file_path.parent
+        )
+        temporary_path = Path(temporary_path)
+        try:
+            with os.fdopen(file_descriptor, "wb") as f:
+                for group in ["inputs", "outputs"]:
+                    data = encoded_result[group] = dict(archive_result[group])
+                    for name, value in data.items():
+                        if (
+                            not isinstance(value, np.ndarray)
+                            or value.dtype.kind not in "biuf"
+                            or value.size < self._array_size_threshold
+                        ):
+                            continue
+
+                        value = np.ascontiguousarray(value)
+                        data[name] = {
+                            self._BINARY_ARRAY_KEY: {
+                                "dtype": value.dtype.str,
+                                "shape": list(value.shape),
+                                "offset": f.tell(),
+                            }
+                        }
+                        value.tofile(f)
+
+                is_empty = f.tell() == 0
+
+            if is_empty:
+                temporary_path.unlink()
+            else:
+                temporary_path.replace(binary_file_path)
+        except BaseException:
+            temporary_path.unlink(missing_ok=True)
+            raise
+
+        return encoded_result
 
     def _decode_result(self, directory_result: ArchiveResultType) -> ModelDataType:
         """Decode a job result, from an archived format, to a ModelResult format."""
 
-        r = deepcopy(directory_result)
-        inputs = {k: np.atleast_1d(v) for k, v in r["inputs"].items()}
-        outputs = {k: np.atleast_1d(v) for k, v in r["outputs"].items()}
-        metadata = {k: np.atleast_1d(v) for k, v in r["metadata"].items()}
+        # No copy is needed since the arrays are built from the archived values.
+        inputs = {k: np.atleast_1d(v) for k, v in directory_result["inputs"].items()}
+        outputs = {k: np.atleast_1d(v) for k, v in directory_result["outputs"].items()}
+        metadata = {
+            k: np.atleast_1d(v) for k, v in directory_result["metadata"].items()
+        }
         outputs.update(metadata)
 
         return {"inputs": inputs, "outputs": outputs}
@@ -163,6 +453,6 @@ class DirectoryArchive(BaseArchiveManager):
         archive_dir_path = (
             self._job_directory if archive_dir_path == "" else archive_dir_path
         )
-        with Path(Path(archive_dir_path) / self._RESULTS_JSON_FILE).open() as f:
-            directory_result = json.load(f)
-            return self._decode_result(directory_result)
+        return self._decode_result(
+            self._read_result_file(Path(archive_dir_path) / self._RESULTS_JSON_FILE)
+        )
@@ -20,10 +20,14 @@ import json
 import logging
 import os
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from itertools import starmap
 from numbers import Number
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
+from typing import ClassVar
 from urllib.parse import unquote
 from urllib.parse import urlparse
 
@@ -31,6 +35,14 @@ import mlflow
 import numpy as np
 import urllib3
 from mlflow import delete_run
+from mlflow.entities import Metric
+from mlflow.entities import Param
+from mlflow.entities import RunTag
+from mlflow.utils.time import get_current_time_millis
+from mlflow.utils.validation import MAX_ENTITIES_PER_BATCH
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH
+from mlflow.utils.validation import MAX_PARAM_VAL_LENGTH
+from mlflow.utils.validation import MAX_PARAMS_TAGS_PER_BATCH
 from numpy import atleast_1d
 from numpy import ndarray
 
@@ -38,11 +50,15 @@ from vimseo.config.global_configuration import _configuration as config
 from vimseo.core.model_metadata import MetaDataNames
 from vimseo.storage_management.certificates import MLFLOW_CERTIFICATES_DIR
 from vimseo.storage_management.directory_storage import BaseArchiveManager
+from vimseo.utilities.file_utils import FileTransferMethod
 from vimseo.utilities.json_grammar_utils import EnhancedJSONEncoder
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from mlflow.entities import Run
+
+    from vimseo.storage_management.archive_index import QueryConditions
     from vimseo.storage_management.base_storage_manager import PersistencyPolicy
     from vimseo.storage_management.directory_storage import ArchiveResultType
     from vimseo.storage_management.directory_storage import ModelDataType
@@ -51,6 +67,12 @@ LOGGER = logging.getLogger(__name__)
 
 INPUT_PREFIX = "inputs."
 
+_ARRAYS_ARTIFACT_PATH = "arrays"
+"""The artifact directory of the arrays stored as artifacts."""
+
+_ARRAY_ARTIFACT_KEY = "__artifact__"
+"""The key of the JSON object of the parameter referring to an array artifact."""
+
 MlflowArchiveResultType = Mapping[str, Mapping[str, ndarray | Number | str]]
 
 
@@ -61,6 +83,12 @@ class MlflowArchive(BaseArchiveManager):
 
     _RESULTS_JSON_FILE = "results.json"
 
+    _SEARCH_PAGE_SIZE: ClassVar[int] = 1000
+    """The maximum number of runs returned by a search request."""
+
+    _N_RUN_IDS_PER_SEARCH: ClassVar[int] = 100
+    """The maximum number of run IDs in the filter of a search request."""
+
     def __init__(
         self,
         persistency: PersistencyPolicy,
@@ -69,9 +97,17 @@ class MlflowArchive(BaseArchiveManager):
         model_name="",
         load_case_name="",
         persistent_file_names=(),
+        array_size_threshold: int = 0,
+        file_transfer_method: FileTransferMethod = FileTransferMethod.AUTO,
     ):
 
-        super().__init__(persistency, job_name, persistent_file_names)
+        super().__init__(
+            persistency,
+            job_name,
+            persistent_file_names,
+            array_size_threshold,
+            file_transfer_method,
+        )
         self._root_directory = root_directory
         self._model_name = model_name
         self._load_case_name = load_case_name
@@ -128,30 +164,208 @@ class MlflowArchive(BaseArchiveManager):
         self._experiment_name = experiment_name
         mlflow.set_experiment_tags(tags)
 
-    def get_archived_results(self, run_ids: Sequence[str] = ()):
-
-        run_ids = (
-            run_ids
-            if len(run_ids) > 0
-            else mlflow.search_runs(experiment_names=[self._experiment_name])["run_id"]
-        )
-
-        if len(run_ids) == 0:
+    def get_archived_results(self, run_ids: Sequence[str] = (), n_threads: int = 4):
+        """Return the archived results.
+
+        The runs are retrieved by pages of a search request,
+        including their parameters, metrics and tags,
+        such that no request per run is needed,
+        except to download the arrays stored as artifacts.
+        The runs are decoded with a pool of threads.
+
+        Args:
+            run_ids: The IDs of the runs.
+                If empty, return the results of all the runs of the current experiment.
+            n_threads: The number of threads decoding the runs.
+
+        Returns:
+            The results, with the name of the experiment and their rank.
+        """
+        runs = self._search_runs(run_ids)
+        if len(runs) == 0:
             LOGGER.info(
                 f"No results found in archive {self._experiment_name}",
             )
             return ()
 
-        return [
-            {
-                **self.get_result(run_id),
-                "dir_archive_job": self._experiment_name,
-                "ID": i + 1,
-            }
-            for i, run_id in enumerate(run_ids)
-        ]
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            return [
+                {
+                    **result,
+                    "dir_archive_job": self._experiment_name,
+                    "ID": i + 1,
+                }
+                for i, result in enumerate(executor.map(self._decode_run, runs))
+            ]
+
+    def _search_runs(self, run_ids: Sequence[str] = ()) -> list[Run]:
+        """Search the runs of the current experiment, by pages.
+
+        Args:
+            run_ids: The IDs of the runs.
+                If empty, search all the runs of the current experiment.
+
+        Returns:
+            The runs, in the order of ``run_ids`` if any,
+            otherwise from the most recent one.
+        """
+        experiment = self._mlflow_client.get_experiment_by_name(self._experiment_name)
+        if experiment is None:
+            return []
+
+        if len(run_ids) == 0:
+            filter_strings = [""]
+        else:
+            run_ids = list(run_ids)
+            filter_strings = [
+                "attributes.run_id IN ({})".format(
+                    ", ".join(
+                        f"'{run_id}'"
+                        for run_id in run_ids[i : i + self._N_RUN_IDS_PER_SEARCH]
+                    )
+                )
+                for i in range(0, len(run_ids), self._N_RUN_IDS_PER_SEARCH)
+            ]
+
+        runs = []
+        for filter_string in filter_strings:
+            page_token = None
+            while True:
+                page = self._mlflow_client.search_runs(
+                    [experiment.experiment_id],
+                    filter_string=filter_string,
+                    max_results=self._SEARCH_PAGE_SIZE,
+                    page_token=page_token,
+                )
+                runs.extend(page)
+                page_token = page.token
+                if not page_token:
+                    break
+
+        if len(run_ids) == 0:
+            return runs
+
+        id_to_run = {run.info.run_id: run for run in runs}
+        missing_run_ids = [run_id for run_id in run_ids if run_id not in id_to_run]
+        if missing_run_ids:
+            LOGGER.warning(
+                f"The runs {missing_run_ids} are not found in the experiment "
+                f"{self._experiment_name}."
+            )
+        return [id_to_run[run_id] for run_id in run_ids if run_id in id_to_run]
+
+    def get_run_versions(
+        self, run_ids: Sequence[str] = (), start_time: float = 0.0
+    ) -> dict[str, str]:
+        """
+        The version of a run is its end time.
+        Only the runs started after ``start_time`` are fetched from the server.
+        """  # noqa: D205, D212
+        runs = mlflow.search_runs(
+            experiment_names=[self._experiment_name],
+            filter_string=f"attributes.start_time > {int(start_time * 1000)}"
+            if start_time
+            else "",
+        )
+        if len(runs) == 0:
+            return {}
+
+        if len(run_ids) > 0:
+            runs = runs[runs["run_id"].isin(run_ids)]
+        return dict(zip(runs["run_id"], runs["end_time"].astype(str), strict=True))
+
+    def query(
+        self,
+        inputs: QueryConditions | None = None,
+        outputs: QueryConditions | None = None,
+        metadata: QueryConditions | None = None,
+    ) -> list[str]:
+        """
+        The scalar inputs and outputs are compared to the MLflow metrics and parameters,
+        and the metadata to the MLflow tags, except the CPU time which is a metric.
+        Only the expected values are supported as conditions on the tags.
+
+        Raises:
+            ValueError: When a range is used as a condition on a tag,
+                or when a string condition contains a single quote.
+        """  # noqa: D205, D212
+        clauses = []
+        for prefix, conditions in [(INPUT_PREFIX, inputs), ("", outputs)]:
+            for name, condition in (conditions or {}).items():
+                if isinstance(condition, str):
+                    clauses.append(
+                        f"params.`{prefix}{name}` = "
+                        f"{self._quote(json.dumps(condition))}"
+                    )
+                else:
+                    clauses.extend(
+                        self._get_metric_clauses(f"{prefix}{name}", condition)
+                    )
+
+        for name, condition in (metadata or {}).items():
+            if name == MetaDataNames.cpu_time:
+                clauses.extend(self._get_metric_clauses(name, condition))
+            elif isinstance(condition, tuple):
+                msg = f"A range cannot be used as a condition on the tag {name}."
+                raise ValueError(msg)
+            else:
+                clauses.append(f"tags.`{name}` = {self._quote(str(condition))}")
+
+        runs = mlflow.search_runs(
+            experiment_names=[self._experiment_name],
+            filter_string=" and ".join(clauses),
+        )
+        return [] if len(runs) == 0 else runs["run_id"].tolist()
 
-    def copy_persistent_files(self, src_dir):
+    @staticmethod
+    def _quote(value: str) -> str:
+        """Quote a string value of an MLflow filter string.
+
+        Args:
+            value: The value.
+
+        Returns:
+            The quoted value.
+
+        Raises:
+            ValueError: When the value contains a single quote,
+                which cannot be escaped in an MLflow filter string.
+        """
+        if "'" in value:
+            msg = f"The value {value} of a query condition cannot contain a quote."
+            raise ValueError(msg)
+        return f"'{value}'"
+
+    @staticmethod
+    def _get_metric_clauses(
+        name: str, condition: Number | tuple[Number | None, Number | None]
+    ) -> list[str]:
+        """Return the clauses of an MLflow filter string for a condition on a metric.
+
+        Args:
+            name: The name of the metric.
+            condition: The expected value or the range of the metric.
+
+        Returns:
+            The clauses.
+        """
+        if not isinstance(condition, tuple):
+            return [f"metrics.`{name}` = {condition}"]
+
+        lower_bound, upper_bound = condition
+        clauses = []
+        if lower_bound is not None:
+            clauses.append(f"metrics.`{name}` >= {lower_bound}")
+        if upper_bound is not None:
+            clauses.append(f"metrics.`{name}` <= {upper_bound}")
+        return clauses
+
+    def copy_persistent_files(self, src_dir, delete_source: bool = False):
+        """
+        Args:
+            delete_source: Whether the source directory is deleted afterwards.
+                The files are always uploaded as artifacts of the run.
+        """  # noqa: D205, D212
         if src_dir == "":
             return
 
@@ -202,41 +416,118 @@ class MlflowArchive(BaseArchiveManager):
             )
         })
 
+        def prepare_name(name: str) -> str:
+            return name if name in archive_result["outputs"] else f"inputs.{name}"
+
         def prepare_data(data: dict, jsonify: bool = False):
             return {
-                (name if name in archive_result["outputs"] else f"inputs.{name}"): (
+                prepare_name(name): (
                     json.dumps(v, cls=EnhancedJSONEncoder) if jsonify else v
                 )
                 for name, v in data.items()
+                if prepare_name(name) not in arrays_artifacts
             }
 
-        with mlflow.start_run(run_name=self._job_name) as run:
-            self._current_run_id = run.info.run_id
-            mlflow.set_tags(tags)
-            mlflow.log_params(
-                prepare_data(
-                    dict(arrays_real, **arrays_non_real, **strings_), jsonify=True
-                )
+        # The large real arrays are stored as artifacts rather than as step metrics,
+        # as well as the ones exceeding the length of a parameter value.
+        arrays_artifacts = {
+            prepare_name(name): np.asarray(value)
+            for name, value in arrays_real.items()
+            if (
+                self._array_size_threshold
+                and np.size(value) >= self._array_size_threshold
             )
-            mlflow.log_metrics(prepare_data(floats))
-            mlflow.log_metric(
+            or len(json.dumps(value, cls=EnhancedJSONEncoder)) > MAX_PARAM_VAL_LENGTH
+        }
+        params = prepare_data(
+            dict(arrays_real, **arrays_non_real, **strings_), jsonify=True
+        )
+        params.update({
+            name: json.dumps({
+                _ARRAY_ARTIFACT_KEY: f"{_ARRAYS_ARTIFACT_PATH}/{name}.npy"
+            })
+            for name in arrays_artifacts
+        })
+
+        timestamp = get_current_time_millis()
+        metrics = [
+            Metric(name, float(value), timestamp, 0)
+            for name, value in prepare_data(floats).items()
+        ]
+        metrics.append(
+            Metric(
                 MetaDataNames.cpu_time,
-                archive_result["metadata"][MetaDataNames.cpu_time],
+                float(archive_result["metadata"][MetaDataNames.cpu_time]),
+                timestamp,
+                0,
+            )
+        )
+        for name, value in arrays_real.items():
+            name = prepare_name(name)
+            if name not in arrays_artifacts:
+                metrics.extend(
+                    Metric(name, float(v), timestamp, i)
+                    for i, v in enumerate(np.ravel(value))
+                )
+
+        with mlflow.start_run(run_name=self._job_name) as run:
+            self._current_run_id = run.info.run_id
+            self._log_batch(
+                metrics,
+                list(starmap(Param, params.items())),
+                [RunTag(name, str(value)) for name, value in tags.items()],
             )
-            for name, value in arrays_real.items():
-                for i, v in enumerate(value):
-                    mlflow.log_metric(
-                        (
-                            name
-                            if name in archive_result["outputs"]
-                            else f"inputs.{name}"
-                        ),
-                        v,
-                        step=i,
+            if arrays_artifacts:
+                with TemporaryDirectory() as directory_path:
+                    for name, value in arrays_artifacts.items():
+                        np.save(Path(directory_path) / f"{name}.npy", value)
+                    mlflow.log_artifacts(
+                        directory_path, artifact_path=_ARRAYS_ARTIFACT_PATH
                     )
 
-    def _decode_result(self, results_archive: ArchiveResultType) -> ModelDataType:
-        """Decode an archived result to a ModelResult format."""
+    def _log_batch(
+        self,
+        metrics: Sequence[Metric],
+        params: Sequence[Param],
+        tags: Sequence[RunTag],
+    ) -> None:
+        """Log metrics, parameters and tags in the current run with few requests.
+
+        The data are split into batches complying with the limits of the tracking
+        backend.
+
+        Args:
+            metrics: The metrics.
+            params: The parameters.
+            tags: The tags.
+        """
+        while metrics or params or tags:
+            batch_params = params[:MAX_PARAMS_TAGS_PER_BATCH]
+            params = params[len(batch_params) :]
+            batch_tags = tags[: MAX_PARAMS_TAGS_PER_BATCH - len(batch_params)]
+            tags = tags[len(batch_tags) :]
+            n_metrics = min(
+                MAX_METRICS_PER_BATCH,
+                MAX_ENTITIES_PER_BATCH - len(batch_params) - len(batch_tags),
+            )
+            batch_metrics = metrics[:n_metrics]
+            metrics = metrics[n_metrics:]
+            self._mlflow_client.log_batch(
+                self._current_run_id,
+                metrics=batch_metrics,
+                params=batch_params,
+                tags=batch_tags,
+            )
+
+    def _decode_result(
+        self, results_archive: ArchiveResultType, run_id: str = ""
+    ) -> ModelDataType:
+        """Decode an archived result to a ModelResult format.
+
+        Args:
+            results_archive: The archived result.
+            run_id: The ID of the run, used to load the arrays stored as artifacts.
+        """
 
         inputs = {}
         outputs = {}
@@ -246,12 +537,21 @@ class MlflowArchive(BaseArchiveManager):
             else:
                 outputs.update({name: atleast_1d(value)})
         for name, value in results_archive["params"].items():
+            value = json.loads(value)
+            if isinstance(value, Mapping) and _ARRAY_ARTIFACT_KEY in value:
+                # The array is loaded in memory before the file is removed.
+                with TemporaryDirectory() as directory_path:
+                    value = np.load(
+                        mlflow.artifacts.download_artifacts(
+                            run_id=run_id,
+                            artifact_path=value[_ARRAY_ARTIFACT_KEY],
+                            dst_path=directory_path,
+                        )
+                    )
             if name.startswith(INPUT_PREFIX):
-                inputs.update({
-                    name.split(INPUT_PREFIX)[1]: atleast_1d(json.loads(value))
-                })
+                inputs.update({name.split(INPUT_PREFIX)[1]: atleast_1d(value)})
             else:
-                outputs.update({name: atleast_1d(json.loads(value))})
+                outputs.update({name: atleast_1d(value)})
 
         tags = results_archive["tags"]
         for name in [MetaDataNames.n_cpus, MetaDataNames.error_code]:
@@ -280,11 +580,33 @@ class MlflowArchive(BaseArchiveManager):
         run = self._mlflow_client.get_run(
             run_id if run_id != "" else self._current_run_id
         )
-        self._job_directory = Path(unquote(urlparse(run.info.artifact_uri).path))
+        self._job_directory = self._get_artifact_directory(run)
+        return self._decode_run(run)
+
+    @staticmethod
+    def _get_artifact_directory(run: Run) -> Path:
+        """Return the directory of the artifacts of a run.
+
+        Args:
+            run: The run.
+
+        Returns:
+            The directory of the artifacts.
+        """
+        return Path(unquote(urlparse(run.info.artifact_uri).path))
+
+    def _decode_run(self, run: Run) -> ModelDataType:
+        """Decode a run to a ModelResult format.
+
+        Args:
+            run: The run.
 
-        result = self._decode_result(run.data.to_dictionary())
+        Returns:
+            The result of the run.
+        """
+        result = self._decode_result(run.data.to_dictionary(), run.info.run_id)
         result["outputs"][MetaDataNames.directory_archive_job] = atleast_1d(
-            str(self._job_directory)
+            str(self._get_artifact_directory(run))
         )
         return result
 
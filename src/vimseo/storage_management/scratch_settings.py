@@ -20,6 +20,7 @@ from pathlib import Path
 
 from pydantic import Field
 
+from vimseo.storage_management.base_storage_manager import JobDirectoryLayout
 from vimseo.storage_management.base_storage_manager import PersistencyPolicy
 from vimseo.tools.base_settings import BaseSettings
 
@@ -44,6 +45,15 @@ class DirectoryScratchSettings(BaseSettings):
         "unique ID.",
     )
 
+    job_directory_layout: JobDirectoryLayout = Field(
+        default=JobDirectoryLayout.FLAT,
+        description="The layout of the scratch and archive job directories when no "
+        "job name is defined. "
+        "By default, the job directories are numbered in the experiment directory, "
+        "which is listed at each job. "
+        "Use a sharded layout for large campaigns or concurrent jobs.",
+    )
+
     directory_scratch_persistency: PersistencyPolicy = Field(
         default=PersistencyPolicy.DELETE_IF_SUCCESSFUL,
         description="Whether to delete the scratch job directory after "
@@ -65,6 +65,19 @@ class DirectoryScratch(BaseStorageManager):
             LOGGER.info(f"Removing job directory: {self._job_directory}")
             shutil.rmtree(str(self._job_directory))
 
+    def whether_to_delete_job_directory(self, model_result: dict) -> bool:
+        """Whether the persistency policy deletes the job directory of a result.
+
+        Args:
+            model_result: The result of the job.
+
+        Returns:
+            Whether the job directory is deleted.
+        """
+        return self._job_directory != "" and self.whether_to_delete(
+            model_result["outputs"][MetaDataNames.error_code][0]
+        )
+
     def enforce_persistency_policy(self, model_result: dict):
-        if self.whether_to_delete(model_result["outputs"][MetaDataNames.error_code][0]):
+        if self.whether_to_delete_job_directory(model_result):
             self.delete_job_directory()
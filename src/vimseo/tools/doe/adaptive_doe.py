@@ -0,0 +1,454 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""An adaptive DOE, enriching a surrogate model until it is accurate enough.
+
+Starting from a small space-filling design,
+the tool fits a surrogate model of the outputs of the model,
+estimates its quality by cross-validation,
+and adds batches of samples chosen by an acquisition criterion
+until the quality reaches a threshold or the budget of samples is exhausted.
+
+The samples of a batch are chosen one after the other among random candidates,
+the surrogate model being updated after each choice with the value it predicts
+at the chosen sample (the so-called *kriging believer* strategy),
+such that the samples of a batch are spread over the parameter space.
+They are then executed at once by :meth:`.IntegratedModel.execute_batch`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from gemseo import compute_doe
+from gemseo.datasets.io_dataset import IODataset
+from gemseo.disciplines.surrogate import SurrogateDiscipline
+from gemseo.mlearning import create_regression_model
+from gemseo.mlearning.core.quality.factory import MLAlgoQualityFactory
+from gemseo.utils.directory_creator import DirectoryNamingMethod
+from numpy import argmax
+from numpy import array
+from numpy import concatenate
+from numpy import inf
+from numpy import maximum
+from numpy import vstack
+from numpy import zeros
+from pydantic import Field
+from scipy.stats import norm
+from strenum import StrEnum
+
+from vimseo.config.global_configuration import _configuration as config
+from vimseo.tools.base_analysis_tool import BaseAnalysisTool
+from vimseo.tools.base_tool import BaseTool
+from vimseo.tools.doe.doe import BatchExecutionSettings
+from vimseo.tools.doe.doe import DOEInputs
+from vimseo.tools.doe.doe import _set_output_names
+from vimseo.tools.doe.doe_execution import create_dataset
+from vimseo.tools.doe.doe_result import AdaptiveDOEResult
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from gemseo.algos.parameter_space import ParameterSpace
+    from gemseo.mlearning.regression.algos.base_regressor import BaseRegressor
+    from numpy import ndarray
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AcquisitionCriterion(StrEnum):
+    """The criterion choosing the new samples of an adaptive DOE."""
+
+    VARIANCE = "variance"
+    """The maximum of the predicted standard deviation of the outputs,
+    normalized by the standard deviation of their samples,
+    to improve the surrogate model where it is the most uncertain."""
+
+    EXPECTED_IMPROVEMENT = "expected_improvement"
+    """The maximum of the expected improvement of the minimum of the first component
+    of the first output, to refine the surrogate model around this minimum."""
+
+
+class AdaptiveDOESettings(BatchExecutionSettings):
+    output_names: list[str] = Field(
+        default=[],
+        description="The names of the output variables approximated by the surrogate "
+        "model. If empty, all the outputs of the model are considered.",
+    )
+    algo: str = Field(
+        default="OT_OPT_LHS",
+        description="The name of the DOE algo generating the initial samples.",
+    )
+    n_initial_samples: int = Field(
+        default=10, ge=2, description="The number of initial samples."
+    )
+    max_samples: int = Field(
+        default=50,
+        ge=2,
+        description="The maximum number of samples, including the initial ones.",
+    )
+    batch_size: int = Field(
+        default=4,
+        ge=1,
+        description="The number of samples added at each iteration, "
+        "executed in parallel.",
+    )
+    n_candidates: int = Field(
+        default=1000,
+        ge=1,
+        description="The number of random candidates among which the new samples "
+        "are chosen at each iteration.",
+    )
+    criterion: AcquisitionCriterion = Field(
+        default=AcquisitionCriterion.VARIANCE,
+        description="The criterion choosing the new samples.",
+    )
+    surrogate: str = Field(
+        default="GaussianProcessRegressor",
+        description="The name of the surrogate algorithm. "
+        "It must predict the standard deviation of its outputs, "
+        "e.g. ``GaussianProcessRegressor``.",
+    )
+    surrogate_options: dict = Field(
+        default={"transformer": {IODataset.INPUT_GROUP: "MinMaxScaler"}},
+        description="The options of the surrogate algorithm.",
+    )
+    quality_measure: str = Field(
+        default="R2Measure", description="The name of the quality measure."
+    )
+    quality_threshold: float = Field(
+        default=0.95,
+        description="The value of the quality measure, estimated by cross-validation, "
+        "from which the surrogate model is accurate enough. "
+        "It must be reached by all the output components.",
+    )
+    n_folds: int = Field(
+        default=5,
+        ge=2,
+        description="The number of folds of the cross-validation.",
+    )
+
+
+class AdaptiveDOETool(BaseAnalysisTool):
+    """Run an adaptive DOE executing an :class:`~.IntegratedModel` over a
+    :class:`~.gemseo.algos.parameter_space.ParameterSpace`, until a surrogate model
+    of its outputs is accurate enough."""
+
+    results: AdaptiveDOEResult
+    """The results of an :class:`~.AdaptiveDOETool`."""
+
+    _INPUTS = DOEInputs
+
+    _SETTINGS = AdaptiveDOESettings
+
+    def __init__(
+        self,
+        root_directory: str | Path = config.root_directory,
+        directory_naming_method: DirectoryNamingMethod = DirectoryNamingMethod.NUMBERED,
+        working_directory: str | Path = config.working_directory,
+        **options,
+    ):
+        super().__init__(
+            root_directory=root_directory,
+            directory_naming_method=directory_naming_method,
+            working_directory=working_directory,
+            **options,
+        )
+        self.result = AdaptiveDOEResult()
+
+    @BaseTool.validate
+    def execute(
+        self,
+        inputs: DOEInputs | None = None,
+        settings: AdaptiveDOESettings | None = None,
+        **options,
+    ) -> AdaptiveDOEResult:
+        model = options["model"]
+        parameter_space = options["parameter_space"]
+        output_names = _set_output_names(model, options["output_names"])
+        doe_name = f"AdaptiveDOE_{model.name}_{model.load_case.name}"
+        input_data = [
+            parameter_space.convert_array_to_dict(sample)
+            for sample in compute_doe(
+                parameter_space,
+                algo_name=options["algo"],
+                n_samples=min(options["n_initial_samples"], options["max_samples"]),
+            )
+        ]
+        results = model.execute_batch(
+            input_data,
+            n_processes=options["n_processes"],
+            backend=options["backend"],
+            skip_failed=options["skip_failed"],
+        )
+        self.result.quality_history = []
+        while True:
+            input_array, output_array = self.__get_learning_data(
+                parameter_space.variable_names, output_names, input_data, results
+            )
+            reference = next(data for data in results if data)
+            output_sizes = {name: reference[name].size for name in output_names}
+            surrogate = self.__fit(
+                parameter_space, output_sizes, input_array, output_array
+            )
+            is_accurate = self.__assess(surrogate, len(input_array))
+            LOGGER.info(
+                f"Adaptive DOE: {options['quality_measure']} = "
+                f"{self.result.quality_history[-1]} with {len(input_data)} samples."
+            )
+            n_new_samples = min(
+                options["batch_size"], options["max_samples"] - len(input_data)
+            )
+            if is_accurate or n_new_samples <= 0:
+                break
+
+            new_input_data = [
+                parameter_space.convert_array_to_dict(sample)
+                for sample in self.__select(
+                    parameter_space,
+                    output_sizes,
+                    surrogate,
+                    input_array,
+                    output_array,
+                    n_new_samples,
+                    len(self.result.quality_history),
+                )
+            ]
+            input_data.extend(new_input_data)
+            results.extend(
+                model.execute_batch(
+                    new_input_data,
+                    n_processes=options["n_processes"],
+                    backend=options["backend"],
+                    skip_failed=options["skip_failed"],
+                )
+            )
+
+        self.result.is_converged = is_accurate
+        if not is_accurate:
+            LOGGER.warning(
+                f"The quality threshold {options['quality_threshold']} of the "
+                f"surrogate model is not reached with {len(input_data)} samples."
+            )
+
+        self.result.dataset, self.result.failed_sample_indices = create_dataset(
+            input_data,
+            ((index, data) for index, data in enumerate(results) if data),
+            output_names,
+            doe_name,
+        )
+        self.result.surrogate = SurrogateDiscipline(
+            surrogate, disc_name=f"{model.name}.{model.load_case.name}.{doe_name}"
+        )
+        return self.result
+
+    @staticmethod
+    def __get_learning_data(
+        input_names: Sequence[str],
+        output_names: Sequence[str],
+        input_data: Sequence[Mapping[str, ndarray]],
+        results: Sequence[Mapping[str, ndarray]],
+    ) -> tuple[ndarray, ndarray]:
+        """Return the input and output data of the successful samples.
+
+        Args:
+            input_names: The names of the inputs.
+            output_names: The names of the outputs.
+            input_data: The input data of the samples.
+            results: The input and output data of the samples,
+                empty for the failed ones.
+
+        Returns:
+            The input and output data of the successful samples,
+            shaped as ``(n_samples, n_components)``.
+
+        Raises:
+            ValueError: When less than two samples are successful.
+        """
+        indices = [index for index, data in enumerate(results) if data]
+        if len(indices) < 2:
+            msg = (
+                f"The surrogate model cannot be fitted from {len(indices)} "
+                "successful sample(s)."
+            )
+            raise ValueError(msg)
+
+        return (
+            array([
+                concatenate([input_data[index][name] for name in input_names])
+                for index in indices
+            ]),
+            array([
+                concatenate([results[index][name].ravel() for name in output_names])
+                for index in indices
+            ]),
+        )
+
+    def __fit(
+        self,
+        parameter_space: ParameterSpace,
+        output_sizes: Mapping[str, int],
+        input_array: ndarray,
+        output_array: ndarray,
+    ) -> BaseRegressor:
+        """Fit the surrogate model.
+
+        Args:
+            parameter_space: The parameter space.
+            output_sizes: The sizes of the outputs.
+            input_array: The input data of the learning samples.
+            output_array: The output data of the learning samples.
+
+        Returns:
+            The surrogate model.
+
+        Raises:
+            ValueError: When the surrogate model does not predict the standard
+                deviation of its outputs.
+        """
+        dataset = IODataset()
+        dataset.add_input_group(
+            input_array,
+            variable_names=parameter_space.variable_names,
+            variable_names_to_n_components=parameter_space.variable_sizes,
+        )
+        dataset.add_output_group(
+            output_array,
+            variable_names=list(output_sizes),
+            variable_names_to_n_components=output_sizes,
+        )
+        surrogate = create_regression_model(
+            self._options["surrogate"], dataset, **self._options["surrogate_options"]
+        )
+        if not hasattr(surrogate, "predict_std"):
+            msg = (
+                f"The surrogate {self._options['surrogate']} does not predict "
+                "the standard deviation of its outputs."
+            )
+            raise ValueError(msg)
+
+        surrogate.learn()
+        return surrogate
+
+    def __assess(self, surrogate: BaseRegressor, n_samples: int) -> bool:
+        """Estimate the quality of the surrogate model by cross-validation.
+
+        The worst quality over the output components is appended to
+        :attr:`.AdaptiveDOEResult.quality_history`.
+
+        Args:
+            surrogate: The surrogate model.
+            n_samples: The number of learning samples.
+
+        Returns:
+            Whether the surrogate model is accurate enough.
+        """
+        measure = MLAlgoQualityFactory().create(
+            self._options["quality_measure"], algo=surrogate
+        )
+        qualities = measure.compute_cross_validation_measure(
+            n_folds=min(self._options["n_folds"], n_samples), seed=1
+        )
+        threshold = self._options["quality_threshold"]
+        if measure.SMALLER_IS_BETTER:
+            quality = float(qualities.max())
+            is_accurate = quality <= threshold
+        else:
+            quality = float(qualities.min())
+            is_accurate = quality >= threshold
+
+        self.result.quality_history.append(quality)
+        return is_accurate
+
+    def __select(
+        self,
+        parameter_space: ParameterSpace,
+        output_sizes: Mapping[str, int],
+        surrogate: BaseRegressor,
+        input_array: ndarray,
+        output_array: ndarray,
+        n_samples: int,
+        seed: int,
+    ) -> list[ndarray]:
+        """Choose new samples maximizing the acquisition criterion.
+
+        Args:
+            parameter_space: The parameter space.
+            output_sizes: The sizes of the outputs.
+            surrogate: The surrogate model.
+            input_array: The input data of the learning samples.
+            output_array: The output data of the learning samples.
+            n_samples: The number of samples to choose.
+            seed: The seed of the random candidates.
+
+        Returns:
+            The new samples.
+        """
+        candidates = compute_doe(
+            parameter_space,
+            algo_name="OT_MONTE_CARLO",
+            n_samples=self._options["n_candidates"],
+            seed=seed,
+        )
+        is_chosen = zeros(len(candidates), dtype=bool)
+        samples = []
+        for _ in range(n_samples):
+            criterion = self.__compute_criterion(surrogate, candidates, output_array)
+            criterion[is_chosen] = -inf
+            index = argmax(criterion)
+            is_chosen[index] = True
+            samples.append(candidates[index])
+            if len(samples) == n_samples:
+                break
+
+            input_array = vstack([input_array, candidates[index]])
+            output_array = vstack([
+                output_array,
+                surrogate.predict(candidates[index : index + 1]),
+            ])
+            surrogate = self.__fit(
+                parameter_space, output_sizes, input_array, output_array
+            )
+
+        return samples
+
+    def __compute_criterion(
+        self, surrogate: BaseRegressor, candidates: ndarray, output_array: ndarray
+    ) -> ndarray:
+        """Compute the acquisition criterion.
+
+        Args:
+            surrogate: The surrogate model.
+            candidates: The candidate samples.
+            output_array: The output data of the learning samples.
+
+        Returns:
+            The acquisition criterion at the candidates.
+        """
+        std = surrogate.predict_std(candidates)
+        if self._options["criterion"] == AcquisitionCriterion.VARIANCE:
+            scale = output_array.std(axis=0)
+            scale[scale == 0.0] = 1.0
+            return (std / scale).sum(axis=1)
+
+        std = maximum(std[:, 0], 1e-12)
+        improvement = output_array[:, 0].min() - surrogate.predict(candidates)[:, 0]
+        reduced_improvement = improvement / std
+        return improvement * norm.cdf(reduced_improvement) + std * norm.pdf(
+            reduced_improvement
+        )
@@ -34,11 +34,15 @@ from pydantic import Field
 
 from vimseo.config.global_configuration import _configuration as config
 from vimseo.core.base_integrated_model import IntegratedModel
+from vimseo.core.batch_execution import BatchBackend
 from vimseo.tools.base_analysis_tool import BaseAnalysisTool
 from vimseo.tools.base_settings import BaseInputs
-from vimseo.tools.base_settings import BaseSettings
 from vimseo.tools.base_tool import BaseTool
+from vimseo.tools.doe.doe import BatchDOESettings
 from vimseo.tools.doe.doe import _set_output_names
+from vimseo.tools.doe.doe_execution import create_checkpoint
+from vimseo.tools.doe.doe_execution import create_store
+from vimseo.tools.doe.doe_execution import execute_batch_doe
 from vimseo.tools.doe.doe_result import DOEResult
 
 if TYPE_CHECKING:
@@ -47,7 +51,7 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 
-class CustomDOESettings(BaseSettings):
+class CustomDOESettings(BatchDOESettings):
     input_names: list[str] = Field(
         default=[],
         description="The names of the variables defining the input variables on which "
@@ -124,6 +128,39 @@ class CustomDOETool(BaseAnalysisTool):
             ]
 
         output_names = _set_output_names(model, options["output_names"])
+        checkpoint = create_checkpoint(self.working_directory, options)
+        store = create_store(self.working_directory, options, doe_name)
+        if (
+            checkpoint is not None
+            or store is not None
+            or options["n_processes"] > 1
+            or options["backend"] == BatchBackend.VECTORIZED
+            or options["skip_failed"]
+        ):
+            chunk_size = options["chunk_size"]
+            input_arrays = input_dataset.get_view(
+                variable_names=input_names
+            ).to_dict_of_arrays(by_group=False)
+            self.result.dataset, self.result.failed_sample_indices = execute_batch_doe(
+                model,
+                (
+                    [
+                        {name: input_arrays[name][index] for name in input_names}
+                        for index in range(
+                            start, min(start + chunk_size, len(input_dataset))
+                        )
+                    ]
+                    for start in range(0, len(input_dataset), chunk_size)
+                ),
+                output_names,
+                options["n_processes"],
+                options["backend"],
+                doe_name,
+                skip_failed=options["skip_failed"],
+                checkpoint=checkpoint,
+                store=store,
+            )
+            return self.result
 
         design_space = DesignSpace()
         for name in input_names:
@@ -22,6 +22,7 @@
 #    OTHER AUTHORS   - MACROSCOPIC CHANGES
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -32,16 +33,25 @@ from pydantic import Field
 
 from vimseo.config.global_configuration import _configuration as config
 from vimseo.core.base_integrated_model import IntegratedModel
+from vimseo.core.batch_execution import BatchBackend
 from vimseo.tools.base_analysis_tool import BaseAnalysisTool
 from vimseo.tools.base_settings import BaseInputs
 from vimseo.tools.base_settings import BaseSettings
 from vimseo.tools.base_tool import BaseTool
+from vimseo.tools.doe.doe_execution import create_checkpoint
+from vimseo.tools.doe.doe_execution import create_store
+from vimseo.tools.doe.doe_execution import execute_batch_doe
+from vimseo.tools.doe.doe_generation import AUTO
+from vimseo.tools.doe.doe_generation import generate_samples
+from vimseo.tools.doe.doe_generation import get_doe_algo_name
 from vimseo.tools.doe.doe_result import DOEResult
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from pathlib import Path
 
+LOGGER = logging.getLogger(__name__)
+
 
 def _set_output_names(
     model: IntegratedModel, output_names: Sequence[str]
@@ -58,17 +68,86 @@ def _set_output_names(
     return list(model.output_grammar.names)
 
 
+class BatchExecutionSettings(BaseSettings):
+    """The settings of the tools executing their samples with
+    :meth:`.IntegratedModel.execute_batch`."""
+
+    n_processes: int = Field(
+        default=1,
+        ge=1,
+        description="The number of workers executing the samples. "
+        "If greater than 1, or with the vectorized backend, "
+        "the samples are executed by :meth:`.IntegratedModel.execute_batch`, "
+        "each worker executing its own clone of the model.",
+    )
+    backend: BatchBackend = Field(
+        default=BatchBackend.PROCESS,
+        description="The backend spreading the samples over the workers.",
+    )
+    skip_failed: bool = Field(
+        default=False,
+        description="Whether to report the failed samples, "
+        "whose outputs are NaN in the dataset, "
+        "instead of raising an error at the first failed sample. "
+        "The samples are then executed by :meth:`.IntegratedModel.execute_batch`.",
+    )
+
+
+class BatchDOESettings(BatchExecutionSettings):
+    """The settings of the DOE tools executing their samples chunk by chunk."""
+
+    chunk_size: int = Field(
+        default=1000,
+        ge=1,
+        description="The number of samples executed at once "
+        "by :meth:`.IntegratedModel.execute_batch`, "
+        "the samples of a chunk being executed before the next chunk. "
+        "The DOE algos generating their samples in chunks, "
+        "e.g. ``Halton``, ``Sobol`` and ``LHS``, "
+        "also generate this number of samples at once "
+        "when the samples are executed by :meth:`.IntegratedModel.execute_batch`.",
+    )
+    checkpoint: bool = Field(
+        default=False,
+        description="Whether to append each executed sample to the file "
+        "``doe_checkpoint.pickle`` of the working directory, "
+        "so that an interrupted DOE can be resumed. "
+        "The samples are then executed by :meth:`.IntegratedModel.execute_batch`.",
+    )
+    resume: bool = Field(
+        default=False,
+        description="Whether to resume an interrupted DOE from the checkpoint file "
+        "of the working directory, executing only the samples missing from it. "
+        "The working directory must be the one of the interrupted DOE. "
+        "This option implies ``checkpoint``. "
+        "The checkpoint file is a pickle file, whose loading can execute "
+        "arbitrary code; never resume from an untrusted working directory.",
+    )
+    store_dataset: bool = Field(
+        default=False,
+        description="Whether to write the samples as soon as they are executed "
+        "to the chunked HDF5 file ``doe_dataset.h5`` of the working directory, "
+        "instead of holding the dataset in memory. "
+        "The dataset of the result is then a lazy view of this file, "
+        "reading only the requested variables and samples. "
+        "The samples are then executed by :meth:`.IntegratedModel.execute_batch`.",
+    )
+
+
 # TODO update from gemseo once branch pydantic is integrated (v6)
-class DOESettings(BaseSettings):
+class DOESettings(BatchDOESettings):
     output_names: list[str] = Field(
         default=[],
         description="The names of the output variables computed by the model.",
     )
     n_samples: int = Field(default=10, description="The number of samples of the DOE.")
     algo: str = Field(
-        default="OT_OPT_LHS",
+        default=AUTO,
         description="The name of the DOE algo. "
-        "See from gemseo.api.get_available_doe_algorithms().",
+        "See from gemseo.api.get_available_doe_algorithms(). "
+        f"If ``{AUTO}``, the optimized LHS ``OT_OPT_LHS`` is used for small DOEs, "
+        "and a scrambled Halton sequence or an LHS for large DOEs, "
+        "depending on the dimension of the parameter space.",
     )
     # algo_options: dict | None = Field(
     #     default=None,
@@ -126,18 +205,51 @@ class DOETool(BaseAnalysisTool):
         **options,
     ) -> DOEResult:
         model = options["model"]
-        doe_name = (
-            f"DOE_{model.name}_{model.load_case.name}_{options['algo']}_"
-            f"{options['n_samples']}"
-        )
+        parameter_space = options["parameter_space"]
+        n_samples = options["n_samples"]
+        algo_name = options["algo"]
+        if algo_name == AUTO:
+            algo_name = get_doe_algo_name(n_samples, parameter_space.dimension)
+            LOGGER.info(f"The DOE algorithm {algo_name} is selected.")
 
+        doe_name = f"DOE_{model.name}_{model.load_case.name}_{algo_name}_{n_samples}"
         output_names = _set_output_names(model, options["output_names"])
+        checkpoint = create_checkpoint(self.working_directory, options)
+        store = create_store(self.working_directory, options, doe_name)
+        if (
+            checkpoint is not None
+            or store is not None
+            or options["n_processes"] > 1
+            or options["backend"] == BatchBackend.VECTORIZED
+            or options["skip_failed"]
+        ):
+            self.result.dataset, self.result.failed_sample_indices = execute_batch_doe(
+                model,
+                (
+                    [
+                        parameter_space.convert_array_to_dict(sample)
+                        for sample in samples[start : start + options["chunk_size"]]
+                    ]
+                    for samples in generate_samples(
+                        parameter_space, algo_name, n_samples, options["chunk_size"]
+                    )
+                    for start in range(0, len(samples), options["chunk_size"])
+                ),
+                output_names,
+                options["n_processes"],
+                options["backend"],
+                doe_name,
+                skip_failed=options["skip_failed"],
+                checkpoint=checkpoint,
+                store=store,
+            )
+            return self.result
 
         doe_scenario = create_scenario(
             disciplines=[model],
             formulation_name="DisciplinaryOpt",
             objective_name=output_names[0],
-            design_space=options["parameter_space"],
+            design_space=parameter_space,
             name=doe_name,
             scenario_type="DOE",
         )
@@ -145,10 +257,7 @@ class DOETool(BaseAnalysisTool):
             for out_name in output_names[1:]:
                 doe_scenario.add_observable(out_name)
 
-        doe_scenario.execute(
-            algo_name=options["algo"],
-            n_samples=options["n_samples"],
-        )
+        doe_scenario.execute(algo_name=algo_name, n_samples=n_samples)
 
         self.result.dataset = doe_scenario.formulation.optimization_problem.to_dataset(
             name=doe_name, categorize=True, opt_naming=False
@@ -0,0 +1,164 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""An append-only store of the executed samples of a DOE."""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from numpy import ndarray
+
+LOGGER = logging.getLogger(__name__)
+
+
+class DOECheckpoint:
+    """An append-only store of the executed samples of a DOE.
+
+    Each sample is appended to the file as a record made of its index in the DOE
+    and of its input and output data, and the file is synchronized to the disk,
+    such that a DOE interrupted by the end of its process loses at most the samples
+    being executed.
+
+    The records are read one at a time, such that the executed samples never need to
+    be held in memory all at once.
+    A last record partially written by an interrupted process is discarded,
+    while a record which cannot be read elsewhere in the file raises an error.
+
+    Warning:
+        The checkpoint file is a pickle file,
+        whose loading can execute arbitrary code.
+        Never resume a DOE from a working directory whose files are not trusted.
+    """
+
+    FILE_NAME: ClassVar[str] = "doe_checkpoint.pickle"
+    """The name of the checkpoint file in the working directory of a DOE tool."""
+
+    file_path: Path
+    """The path to the checkpoint file."""
+
+    def __init__(self, file_path: str | Path, resume: bool = False) -> None:
+        """
+        Args:
+            file_path: The path to the checkpoint file.
+            resume: Whether to keep the records of an existing checkpoint file.
+                Otherwise, the file is removed.
+        """  # noqa: D205, D212
+        self.file_path = Path(file_path)
+        if not resume:
+            self.file_path.unlink(missing_ok=True)
+            return
+
+        if not self.file_path.exists():
+            LOGGER.warning(
+                f"The checkpoint file {self.file_path} does not exist; "
+                "all the samples of the DOE are executed."
+            )
+            return
+
+        size = self.__get_complete_size()
+        if size < self.file_path.stat().st_size:
+            LOGGER.warning(
+                f"The last record of the checkpoint file {self.file_path} "
+                "is incomplete and is discarded."
+            )
+            with self.file_path.open("r+b") as f:
+                f.truncate(size)
+
+    def append(self, index: int, data: Mapping[str, ndarray]) -> None:
+        """Append an executed sample.
+
+        Args:
+            index: The index of the sample in the DOE.
+            data: The input and output data of the sample.
+        """
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.file_path.open("ab") as f:
+            pickle.dump((index, dict(data)), f)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def __iter__(self) -> Iterator[tuple[int, dict[str, ndarray]]]:
+        """Iterate over the executed samples, in execution order.
+
+        Yields:
+            The index of a sample in the DOE and its input and output data.
+
+        Raises:
+            ValueError: When a record other than the last one cannot be read.
+        """
+        if not self.file_path.exists():
+            return
+
+        for record, _ in self.__read_records():
+            yield record
+
+    def __get_complete_size(self) -> int:
+        """Return the size of the complete records of the checkpoint file.
+
+        Returns:
+            The size of the complete records in bytes.
+
+        Raises:
+            ValueError: When a record other than the last one cannot be read.
+        """
+        size = 0
+        for _, end in self.__read_records():
+            size = end
+        return size
+
+    def __read_records(
+        self,
+    ) -> Iterator[tuple[tuple[int, dict[str, ndarray]], int]]:
+        """Read the complete records of the checkpoint file.
+
+        A record whose reading reaches the end of the file is incomplete,
+        and ends the reading.
+
+        Yields:
+            A record and the position of its end in the file.
+
+        Raises:
+            ValueError: When a record other than the last one cannot be read.
+        """
+        file_size = self.file_path.stat().st_size
+        with self.file_path.open("rb") as f:
+            while True:
+                start = f.tell()
+                try:
+                    record = pickle.load(f)
+                except EOFError:
+                    return
+                except Exception as error:
+                    if f.tell() >= file_size:
+                        return
+
+                    msg = (
+                        f"The record starting at byte {start} "
+                        f"of the checkpoint file {self.file_path} is corrupted; "
+                        "remove this file or disable the resume option."
+                    )
+                    raise ValueError(msg) from error
+
+                yield record, f.tell()
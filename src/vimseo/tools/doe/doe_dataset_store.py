@@ -0,0 +1,423 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""A chunked HDF5 store of the samples of a DOE, and a lazy view of its dataset.
+
+The samples are written to the store as soon as they are executed,
+such that a DOE with large vector outputs never holds its dataset in memory.
+The HDF5 file has a group per group of variables of the dataset,
+``inputs`` and ``outputs``,
+and each variable is stored column-wise as a 2D array of shape
+``(n_samples, n_components)``, chunked by blocks of rows.
+The rows of the samples not executed yet, or whose execution failed, are NaN.
+
+The dataset is exposed as a :class:`.LazyDOEDataset`,
+which reads only the variables and the samples requested,
+e.g. a few scalar outputs, or the samples chunk by chunk.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+
+import h5py
+from gemseo.datasets.io_dataset import IODataset
+from numpy import concatenate
+from numpy import flatnonzero
+from numpy import nan
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    from numpy import ndarray
+    from typing_extensions import Self
+
+LOGGER = logging.getLogger(__name__)
+
+_NAMES = "names"
+"""The attribute of a group storing the names of its variables, in order."""
+
+_IS_EXECUTED = "is_executed"
+"""The name of the HDF5 dataset flagging the executed samples."""
+
+
+class DOEDatasetStore:
+    """A chunked HDF5 store of the samples of a DOE, written as they complete.
+
+    Used as a context manager,
+    the store keeps its file open until the end of the context,
+    instead of opening it at each write;
+    :meth:`.flush` then writes the buffered data to the disk.
+    """
+
+    FILE_NAME: ClassVar[str] = "doe_dataset.h5"
+    """The name of the store file in the working directory of a DOE tool."""
+
+    CHUNK_BYTES: ClassVar[int] = 2**20
+    """The approximate size in bytes of a HDF5 chunk of a variable."""
+
+    file_path: Path
+    """The path to the store file."""
+
+    __file: h5py.File | None
+    """The store file kept open by the context manager, if any."""
+
+    def __init__(self, file_path: str | Path, name: str = "") -> None:
+        """
+        Args:
+            file_path: The path to the store file. An existing file is overwritten.
+            name: The name of the dataset.
+        """  # noqa: D205, D212
+        self.file_path = Path(file_path).absolute()
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.__file = None
+        with h5py.File(self.file_path, "w") as f:
+            f.attrs["name"] = name
+            f.create_dataset(
+                _IS_EXECUTED, shape=(0,), maxshape=(None,), dtype=bool, chunks=True
+            )
+
+    def __enter__(self) -> Self:
+        self.__file = h5py.File(self.file_path, "a")
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.__file.close()
+        self.__file = None
+
+    def flush(self) -> None:
+        """Write the data buffered in the open store file to the disk, if any."""
+        if self.__file is not None:
+            self.__file.flush()
+
+    @contextmanager
+    def __open(self) -> Iterator[h5py.File]:
+        """Return the store file opened for writing.
+
+        Yields:
+            The store file kept open by the context manager if any,
+            otherwise the store file opened until the end of the context.
+        """
+        if self.__file is not None:
+            yield self.__file
+            return
+
+        with h5py.File(self.file_path, "a") as f:
+            yield f
+
+    def write_inputs(
+        self, start: int, input_data: Sequence[Mapping[str, ndarray]]
+    ) -> None:
+        """Write the input data of consecutive samples.
+
+        Args:
+            start: The index of the first sample.
+            input_data: The input data of the samples.
+        """
+        if not input_data:
+            return
+
+        with self.__open() as f:
+            stop = start + len(input_data)
+            self.__resize(f, stop)
+            for name in input_data[0]:
+                column = self.__get_column(
+                    f, IODataset.INPUT_GROUP, name, input_data[0][name].size, stop
+                )
+                column[start:stop] = [data[name].ravel() for data in input_data]
+
+    def write_outputs(
+        self, index: int, data: Mapping[str, ndarray], output_names: Iterable[str]
+    ) -> None:
+        """Write the output data of an executed sample.
+
+        Args:
+            index: The index of the sample.
+            data: The input and output data of the sample.
+            output_names: The names of the outputs to store.
+        """
+        with self.__open() as f:
+            n_samples = max(index + 1, len(f[_IS_EXECUTED]))
+            self.__resize(f, n_samples)
+            for name in output_names:
+                value = data[name].ravel()
+                column = self.__get_column(
+                    f, IODataset.OUTPUT_GROUP, name, value.size, n_samples
+                )
+                column[index] = value
+
+            f[_IS_EXECUTED][index] = True
+
+    @property
+    def dataset(self) -> LazyDOEDataset:
+        """The lazy view of the stored dataset.
+
+        It shall be read once the store file is closed.
+        """
+        return LazyDOEDataset(self.file_path)
+
+    @staticmethod
+    def __resize(f: h5py.File, n_samples: int) -> None:
+        """Extend the variables of the store to a number of samples.
+
+        Args:
+            f: The store file.
+            n_samples: The number of samples.
+        """
+        if len(f[_IS_EXECUTED]) >= n_samples:
+            return
+
+        f[_IS_EXECUTED].resize((n_samples,))
+        for group_name in (IODataset.INPUT_GROUP, IODataset.OUTPUT_GROUP):
+            for column in f.get(group_name, {}).values():
+                column.resize((n_samples, column.shape[1]))
+
+    def __get_column(
+        self, f: h5py.File, group_name: str, name: str, size: int, n_samples: int
+    ) -> h5py.Dataset:
+        """Return the HDF5 dataset of a variable, with at least a number of rows.
+
+        Args:
+            f: The store file.
+            group_name: The name of the group of the variable.
+            name: The name of the variable.
+            size: The number of components of the variable.
+            n_samples: The minimum number of rows.
+
+        Returns:
+            The HDF5 dataset of the variable.
+        """
+        group = f.require_group(group_name)
+        if name not in group:
+            group.create_dataset(
+                name,
+                shape=(n_samples, size),
+                maxshape=(None, size),
+                dtype=float,
+                chunks=(max(1, self.CHUNK_BYTES // (8 * size)), size),
+                fillvalue=nan,
+            )
+            group.attrs[_NAMES] = [*group.attrs.get(_NAMES, []), name]
+
+        return group[name]
+
+
+class LazyDOEDataset:
+    """A lazy view of the dataset of a DOE stored in a :class:`.DOEDatasetStore`.
+
+    The methods of this class read only the requested variables and samples.
+    The other attributes are those of the :class:`.IODataset` loaded from the
+    whole store at first access,
+    e.g. ``lazy_dataset.get_view(...)``.
+    """
+
+    file_path: Path
+    """The path to the store file."""
+
+    __dataset: IODataset | None
+    """The dataset loaded from the whole store, if any."""
+
+    def __init__(self, file_path: str | Path) -> None:
+        """
+        Args:
+            file_path: The path to the store file.
+        """  # noqa: D205, D212
+        self.file_path = Path(file_path)
+        self.__dataset = None
+
+    @property
+    def name(self) -> str:
+        """The name of the dataset."""
+        with h5py.File(self.file_path, "r") as f:
+            return str(f.attrs["name"])
+
+    @property
+    def group_names(self) -> list[str]:
+        """The names of the groups of variables."""
+        with h5py.File(self.file_path, "r") as f:
+            return [
+                group_name
+                for group_name in (IODataset.INPUT_GROUP, IODataset.OUTPUT_GROUP)
+                if group_name in f
+            ]
+
+    def get_variable_names(self, group_name: str) -> list[str]:
+        """Return the names of the variables of a group.
+
+        Args:
+            group_name: The name of the group.
+
+        Returns:
+            The names of the variables.
+        """
+        with h5py.File(self.file_path, "r") as f:
+            if group_name not in f:
+                return []
+            return [str(name) for name in f[group_name].attrs[_NAMES]]
+
+    @property
+    def variable_names(self) -> list[str]:
+        """The names of the variables."""
+        return [
+            name
+            for group_name in self.group_names
+            for name in self.get_variable_names(group_name)
+        ]
+
+    @property
+    def variable_names_to_n_components(self) -> dict[str, int]:
+        """The names of the variables bound to their numbers of components."""
+        with h5py.File(self.file_path, "r") as f:
+            return {
+                name: f[group_name][name].shape[1]
+                for group_name in self.group_names
+                for name in f[group_name].attrs[_NAMES]
+            }
+
+    @property
+    def failed_sample_indices(self) -> list[int]:
+        """The indices of the samples not executed, or whose execution failed."""
+        with h5py.File(self.file_path, "r") as f:
+            return flatnonzero(~f[_IS_EXECUTED][:]).tolist()
+
+    def __len__(self) -> int:
+        with h5py.File(self.file_path, "r") as f:
+            return len(f[_IS_EXECUTED])
+
+    def get_variable(self, name: str, indices: slice | Sequence[int] = slice(None)):
+        """Read the values of a variable.
+
+        Args:
+            name: The name of the variable.
+            indices: The indices of the samples to read, in increasing order.
+
+        Returns:
+            The values of the variable, shaped as ``(n_samples, n_components)``.
+        """
+        with h5py.File(self.file_path, "r") as f:
+            return self.__read(f, name, indices)
+
+    def to_dataset(
+        self,
+        variable_names: Iterable[str] = (),
+        indices: slice | Sequence[int] = slice(None),
+    ) -> IODataset:
+        """Load some variables and samples in memory.
+
+        Args:
+            variable_names: The names of the variables.
+                If empty, use all the variables.
+            indices: The indices of the samples to read, in increasing order.
+
+        Returns:
+            The dataset of the variables and samples.
+        """
+        variable_names = set(variable_names) or set(self.variable_names)
+        with h5py.File(self.file_path, "r") as f:
+            dataset = IODataset(dataset_name=str(f.attrs["name"]))
+            for group_name in self.group_names:
+                names = [
+                    str(name)
+                    for name in f[group_name].attrs[_NAMES]
+                    if name in variable_names
+                ]
+                if not names:
+                    continue
+
+                dataset.add_group(
+                    group_name,
+                    concatenate([self.__read(f, name, indices) for name in names], 1),
+                    variable_names=names,
+                    variable_names_to_n_components={
+                        name: f[group_name][name].shape[1] for name in names
+                    },
+                )
+
+        return dataset
+
+    def iter_chunks(
+        self, chunk_size: int, variable_names: Iterable[str] = ()
+    ) -> Iterator[IODataset]:
+        """Iterate over the samples chunk by chunk.
+
+        Args:
+            chunk_size: The number of samples of a chunk.
+            variable_names: The names of the variables.
+                If empty, use all the variables.
+
+        Yields:
+            The dataset of the variables for the samples of a chunk.
+        """
+        n_samples = len(self)
+        for start in range(0, n_samples, chunk_size):
+            yield self.to_dataset(
+                variable_names, slice(start, min(start + chunk_size, n_samples))
+            )
+
+    def __read(
+        self, f: h5py.File, name: str, indices: slice | Sequence[int]
+    ) -> ndarray:
+        """Read the values of a variable.
+
+        Args:
+            f: The store file.
+            name: The name of the variable.
+            indices: The indices of the samples to read, in increasing order.
+
+        Returns:
+            The values of the variable, shaped as ``(n_samples, n_components)``.
+
+        Raises:
+            KeyError: When the variable does not exist.
+        """
+        for group_name in (IODataset.INPUT_GROUP, IODataset.OUTPUT_GROUP):
+            if name in f.get(group_name, {}):
+                column = f[group_name][name]
+                if isinstance(indices, slice):
+                    return column[indices]
+                return column[list(indices)]
+
+        msg = f"The variable {name} does not exist in {self.file_path}."
+        raise KeyError(msg)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if self.__dataset is None:
+            LOGGER.debug(f"Loading the whole dataset from {self.file_path}.")
+            self.__dataset = self.to_dataset()
+        return getattr(self.__dataset, name)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"file_path": self.file_path}
+
+    def __setstate__(self, state: Mapping[str, Any]) -> None:
+        self.file_path = state["file_path"]
+        self.__dataset = None
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__} {self.name} of {len(self)} samples "
+            f"stored in {self.file_path}: {', '.join(self.variable_names)}"
+        )
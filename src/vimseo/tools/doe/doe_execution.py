@@ -0,0 +1,361 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""The execution of the samples of a DOE with :meth:`.IntegratedModel.execute_batch`.
+
+These functions are shared by the DOE tools,
+which execute their samples chunk by chunk in parallel,
+optionally storing the executed samples in a :class:`.DOECheckpoint`
+and the dataset in a :class:`.DOEDatasetStore`.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import nullcontext
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Any
+
+from gemseo.datasets.io_dataset import IODataset
+from numpy import array_equal
+from numpy import concatenate
+from numpy import flatnonzero
+from numpy import full
+from numpy import nan
+from numpy import zeros
+
+from vimseo.tools.doe.doe_checkpoint import DOECheckpoint
+from vimseo.tools.doe.doe_dataset_store import DOEDatasetStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from numpy import ndarray
+
+    from vimseo.core.base_integrated_model import IntegratedModel
+    from vimseo.core.batch_execution import BatchBackend
+    from vimseo.tools.doe.doe_dataset_store import LazyDOEDataset
+
+LOGGER = logging.getLogger(__name__)
+
+
+def create_checkpoint(
+    working_directory: Path, options: Mapping[str, Any]
+) -> DOECheckpoint | None:
+    """Create the store of the executed samples of a DOE tool.
+
+    Args:
+        working_directory: The working directory of the tool.
+        options: The options of the tool.
+
+    Returns:
+        The store of the executed samples,
+        or ``None`` if neither the checkpoint nor the resume option is enabled.
+    """
+    if not (options["checkpoint"] or options["resume"]):
+        return None
+
+    return DOECheckpoint(
+        working_directory / DOECheckpoint.FILE_NAME, resume=options["resume"]
+    )
+
+
+def create_store(
+    working_directory: Path, options: Mapping[str, Any], name: str
+) -> DOEDatasetStore | None:
+    """Create the on-disk store of the dataset of a DOE tool.
+
+    Args:
+        working_directory: The working directory of the tool.
+        options: The options of the tool.
+        name: The name of the dataset.
+
+    Returns:
+        The store of the dataset,
+        or ``None`` if the store_dataset option is disabled.
+    """
+    if not options["store_dataset"]:
+        return None
+
+    return DOEDatasetStore(working_directory / DOEDatasetStore.FILE_NAME, name=name)
+
+
+def execute_batch_doe(
+    model: IntegratedModel,
+    input_chunks: Iterable[Sequence[Mapping[str, ndarray]]],
+    output_names: Sequence[str],
+    n_processes: int,
+    backend: BatchBackend,
+    name: str,
+    skip_failed: bool = False,
+    checkpoint: DOECheckpoint | None = None,
+    store: DOEDatasetStore | None = None,
+) -> tuple[IODataset | LazyDOEDataset, list[int]]:
+    """Execute a model on samples with :meth:`.IntegratedModel.execute_batch`.
+
+    Args:
+        model: The model.
+        input_chunks: The input data of the samples, chunk by chunk.
+            The samples of a chunk are executed before the next chunk is requested.
+        output_names: The names of the outputs to store in the dataset.
+        n_processes: The number of workers.
+        backend: The backend spreading the samples over the workers.
+        name: The name of the dataset.
+        skip_failed: Whether to report the failed samples
+            instead of raising an error at the first failed sample.
+        checkpoint: The store of the executed samples.
+            The samples already in the store are not executed again,
+            and the other ones are appended to the store as soon as they are executed.
+            If ``None``, do not store the executed samples.
+        store: The on-disk store of the dataset,
+            to which the samples are written as soon as they are executed.
+            Its file is kept open during the execution,
+            and flushed to the disk after each chunk.
+            If ``None``, the dataset is created in memory.
+
+    Returns:
+        The dataset of the inputs and outputs, in sample order,
+        whose outputs are NaN for the failed samples,
+        and the indices of the failed samples.
+        The dataset is a lazy view of the on-disk store if any.
+
+    Raises:
+        ValueError: When a sample of the checkpoint is not a sample of the DOE.
+    """
+    executed_inputs = (
+        {} if checkpoint is None else _get_executed_inputs(checkpoint, model)
+    )
+    if executed_inputs:
+        LOGGER.info(
+            f"{len(executed_inputs)} samples are reloaded from {checkpoint.file_path}."
+        )
+
+    input_data = []
+    samples = []
+    start = 0
+    with nullcontext() if store is None else store:
+        for chunk in input_chunks:
+            indices = []
+            for index, data in enumerate(chunk, start=start):
+                if index not in executed_inputs:
+                    indices.append(index)
+                elif not _is_same_sample(executed_inputs.pop(index), data):
+                    _raise_checkpoint_error(checkpoint, index)
+
+            if store is None:
+                input_data.extend(chunk)
+            else:
+                store.write_inputs(start, chunk)
+
+            if indices:
+                model.execute_batch(
+                    [chunk[index - start] for index in indices],
+                    n_processes=n_processes,
+                    backend=backend,
+                    skip_failed=skip_failed,
+                    callback=partial(
+                        _store_sample, indices, samples, checkpoint, store, output_names
+                    ),
+                )
+
+            if store is not None:
+                store.flush()
+
+            start += len(chunk)
+
+        if executed_inputs:
+            _raise_checkpoint_error(checkpoint, min(executed_inputs))
+
+        if store is not None and checkpoint is not None:
+            for index, data in checkpoint:
+                store.write_outputs(index, data, output_names)
+
+    if store is None:
+        return create_dataset(
+            input_data,
+            samples if checkpoint is None else checkpoint,
+            output_names,
+            name,
+        )
+
+    dataset = store.dataset
+    failed_indices = dataset.failed_sample_indices
+    _log_failed_samples(failed_indices, len(dataset))
+    return dataset, failed_indices
+
+
+def _store_sample(
+    indices: Sequence[int],
+    samples: list[tuple[int, Mapping[str, ndarray]]],
+    checkpoint: DOECheckpoint | None,
+    store: DOEDatasetStore | None,
+    output_names: Sequence[str],
+    index: int,
+    data: Mapping[str, ndarray],
+) -> None:
+    """Store an executed sample of a chunk.
+
+    The sample is appended to the checkpoint if any,
+    otherwise written to the on-disk store of the dataset if any,
+    otherwise appended to the samples held in memory.
+
+    Args:
+        indices: The indices of the executed samples of the chunk in the DOE.
+        samples: The executed samples held in memory.
+        checkpoint: The store of the executed samples.
+        store: The on-disk store of the dataset.
+        output_names: The names of the outputs to store in the dataset.
+        index: The index of the executed sample in the chunk.
+        data: The input and output data of the executed sample.
+    """
+    index = indices[index]
+    if checkpoint is not None:
+        checkpoint.append(index, data)
+    elif store is not None:
+        store.write_outputs(index, data, output_names)
+    else:
+        samples.append((index, data))
+
+
+def _get_executed_inputs(
+    checkpoint: DOECheckpoint, model: IntegratedModel
+) -> dict[int, dict[str, ndarray]]:
+    """Return the input data of the samples stored in a checkpoint.
+
+    Args:
+        checkpoint: The store of the executed samples.
+        model: The model.
+
+    Returns:
+        The input data of the stored samples, bound to their indices.
+    """
+    input_names = model.input_grammar.names
+    return {
+        index: {name: value for name, value in data.items() if name in input_names}
+        for index, data in checkpoint
+    }
+
+
+def _is_same_sample(
+    stored_data: Mapping[str, ndarray], input_data: Mapping[str, ndarray]
+) -> bool:
+    """Check whether a stored sample is a sample of the DOE.
+
+    Args:
+        stored_data: The input data of the stored sample.
+        input_data: The input data of the sample of the DOE.
+
+    Returns:
+        Whether the stored sample is the sample of the DOE.
+    """
+    return all(
+        name in stored_data and array_equal(stored_data[name], value)
+        for name, value in input_data.items()
+    )
+
+
+def _raise_checkpoint_error(checkpoint: DOECheckpoint, index: int) -> None:
+    """Raise an error for a stored sample which is not a sample of the DOE.
+
+    Args:
+        checkpoint: The store of the executed samples.
+        index: The index of the stored sample.
+
+    Raises:
+        ValueError: Always.
+    """
+    msg = (
+        f"The sample {index} of the checkpoint file {checkpoint.file_path} "
+        "is not a sample of the DOE; "
+        "remove this file or disable the resume option."
+    )
+    raise ValueError(msg)
+
+
+def create_dataset(
+    input_data: Sequence[Mapping[str, ndarray]],
+    samples: Iterable[tuple[int, Mapping[str, ndarray]]],
+    output_names: Sequence[str],
+    name: str,
+) -> tuple[IODataset, list[int]]:
+    """Create the dataset of a DOE from its executed samples.
+
+    Args:
+        input_data: The input data of the samples of the DOE.
+        samples: The indices of the executed samples and their output data,
+            in any order.
+        output_names: The names of the outputs to store in the dataset.
+        name: The name of the dataset.
+
+    Returns:
+        The dataset of the inputs and outputs, in sample order,
+        whose outputs are NaN for the samples not executed,
+        and the indices of these samples.
+    """
+    n_samples = len(input_data)
+    sizes = dict.fromkeys(output_names, 1)
+    output_data = full((n_samples, len(output_names)), nan)
+    is_executed = zeros(n_samples, dtype=bool)
+    for index, data in samples:
+        if not is_executed.any():
+            sizes = {
+                output_name: data[output_name].size for output_name in output_names
+            }
+            output_data = full((n_samples, sum(sizes.values())), nan)
+
+        output_data[index] = concatenate([
+            data[output_name].ravel() for output_name in output_names
+        ])
+        is_executed[index] = True
+
+    failed_indices = flatnonzero(~is_executed).tolist()
+    _log_failed_samples(failed_indices, n_samples)
+
+    dataset = IODataset(dataset_name=name)
+    input_names = list(input_data[0])
+    dataset.add_input_group(
+        [
+            concatenate([data[input_name] for input_name in input_names])
+            for data in input_data
+        ],
+        variable_names=input_names,
+        variable_names_to_n_components={
+            input_name: input_data[0][input_name].size for input_name in input_names
+        },
+    )
+    dataset.add_output_group(
+        output_data,
+        variable_names=list(output_names),
+        variable_names_to_n_components=sizes,
+    )
+    return dataset, failed_indices
+
+
+def _log_failed_samples(failed_indices: Sequence[int], n_samples: int) -> None:
+    """Log the failed samples of a DOE, if any.
+
+    Args:
+        failed_indices: The indices of the failed samples.
+        n_samples: The number of samples of the DOE.
+    """
+    if failed_indices:
+        LOGGER.warning(
+            f"{len(failed_indices)} samples out of {n_samples} failed: "
+            f"{failed_indices}."
+        )
@@ -0,0 +1,130 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+"""The generation of the samples of a DOE, chunk by chunk.
+
+The optimized LHS of OpenTURNS, ``OT_OPT_LHS``, spreads the samples well,
+but its cost grows quadratically with the number of samples:
+for ten thousand samples in dimension ten, the generation takes about ten seconds.
+The :data:`.AUTO` algorithm uses it for small DOEs only,
+and otherwise a scrambled Halton sequence,
+or an LHS in high dimension where the Halton sequence degrades.
+
+The samples of the SciPy algorithms are generated in chunks,
+such that the first samples can be executed while the next ones are not generated yet.
+The chunks of the Halton and Sobol' sequences form the same DOE as a generation at
+once, whereas each chunk of an LHS is a LHS.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from gemseo import compute_doe
+from gemseo.utils.seeder import Seeder
+from scipy.stats.qmc import Halton
+from scipy.stats.qmc import LatinHypercube
+from scipy.stats.qmc import Sobol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from gemseo.algos.parameter_space import ParameterSpace
+    from numpy import ndarray
+
+AUTO = "auto"
+"""The name of the algorithm selecting a DOE algorithm from the size of the DOE."""
+
+OPTIMIZED_LHS_MAX_SIZE = 10_000
+"""The maximum product of the number of samples and the dimension for which
+:data:`.AUTO` selects the optimized LHS."""
+
+HALTON_MAX_DIMENSION = 20
+"""The maximum dimension for which :data:`.AUTO` selects the Halton sequence."""
+
+_NAMES_TO_ENGINES = {
+    "Halton": Halton,
+    "LHS": LatinHypercube,
+    "Sobol": Sobol,
+}
+"""The names of the DOE algorithms generating their samples in chunks, bound to the
+SciPy engines."""
+
+
+def get_doe_algo_name(n_samples: int, dimension: int) -> str:
+    """Return the name of the DOE algorithm suited to the size of a DOE.
+
+    Args:
+        n_samples: The number of samples.
+        dimension: The dimension of the parameter space.
+
+    Returns:
+        The name of the DOE algorithm.
+    """
+    if n_samples * dimension <= OPTIMIZED_LHS_MAX_SIZE:
+        return "OT_OPT_LHS"
+
+    if dimension <= HALTON_MAX_DIMENSION:
+        return "Halton"
+
+    return "LHS"
+
+
+def is_chunked(algo_name: str) -> bool:
+    """Whether a DOE algorithm generates its samples in chunks.
+
+    Args:
+        algo_name: The name of the DOE algorithm.
+
+    Returns:
+        Whether the DOE algorithm generates its samples in chunks.
+    """
+    return algo_name in _NAMES_TO_ENGINES
+
+
+def generate_samples(
+    parameter_space: ParameterSpace,
+    algo_name: str,
+    n_samples: int,
+    chunk_size: int,
+) -> Iterator[ndarray]:
+    """Generate the samples of a DOE lazily.
+
+    Args:
+        parameter_space: The parameter space.
+        algo_name: The name of the DOE algorithm.
+            If :data:`.AUTO`, use :func:`.get_doe_algo_name`.
+        n_samples: The number of samples.
+        chunk_size: The number of samples of a chunk,
+            for the algorithms generating their samples in chunks.
+            The other algorithms generate all the samples at once.
+
+    Yields:
+        The samples of a chunk, shaped as ``(n_chunk_samples, dimension)``.
+    """
+    if algo_name == AUTO:
+        algo_name = get_doe_algo_name(n_samples, parameter_space.dimension)
+
+    if not is_chunked(algo_name):
+        yield compute_doe(parameter_space, algo_name=algo_name, n_samples=n_samples)
+        return
+
+    # Use the same seed as the DOE algorithms of GEMSEO.
+    engine = _NAMES_TO_ENGINES[algo_name](
+        parameter_space.dimension, seed=Seeder().get_seed()
+    )
+    for start in range(0, n_samples, chunk_size):
+        unit_samples = engine.random(min(chunk_size, n_samples - start))
+        yield parameter_space.untransform_vect(unit_samples, no_check=True)
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import field
 from json import dumps
 from typing import TYPE_CHECKING
 
@@ -26,14 +27,27 @@ from vimseo.utilities.json_grammar_utils import EnhancedJSONEncoder
 
 if TYPE_CHECKING:
     from gemseo.datasets.dataset import Dataset
+    from gemseo.disciplines.surrogate import SurrogateDiscipline
+
+    from vimseo.tools.doe.doe_dataset_store import LazyDOEDataset
 
 
 @dataclass
 class DOEResult(BaseResult):
     """The result of a DOE."""
 
-    dataset: Dataset | None = None
-    """The dataset resulting from the DOE."""
+    dataset: Dataset | LazyDOEDataset | None = None
+    """The dataset resulting from the DOE.
+
+    With the option ``store_dataset``, a lazy view of the on-disk dataset, which
+    is not copied when the result is pickled.
+    """
+
+    failed_sample_indices: list[int] = field(default_factory=list)
+    """The indices of the samples whose execution failed.
+
+    Their outputs are NaN in :attr:`.dataset`.
+    """
 
     def __str__(self):
         msg = MultiLineString()
@@ -43,4 +57,28 @@ class DOEResult(BaseResult):
             "============================= DOE Tool Results ========================="
         )
         msg.add(str(self.dataset))
+        if self.failed_sample_indices:
+            msg.add(f"Failed samples: {self.failed_sample_indices}")
+        return str(msg)
+
+
+@dataclass
+class AdaptiveDOEResult(DOEResult):
+    """The result of an adaptive DOE."""
+
+    surrogate: SurrogateDiscipline | None = None
+    """The surrogate model fitted from the samples of the DOE."""
+
+    quality_history: list[float] = field(default_factory=list)
+    """The quality of the surrogate model estimated by cross-validation at each
+    iteration, for the worst output component."""
+
+    is_converged: bool = False
+    """Whether the quality of the surrogate model reached the threshold."""
+
+    def __str__(self):
+        msg = MultiLineString()
+        msg.add(super().__str__())
+        msg.add(f"Quality of the surrogate model: {self.quality_history}")
+        msg.add(f"Converged: {self.is_converged}")
         return str(msg)
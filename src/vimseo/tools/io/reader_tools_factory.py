@@ -17,14 +17,13 @@ from __future__ import annotations
 
 import logging
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.tools.io.base_reader_file import BaseReaderFile
 
 LOGGER = logging.getLogger(__name__)
 
 
-class ReaderToolsFactory(BaseFactory):
+class ReaderToolsFactory(BaseCachedFactory):
     """A factory to create analysis tools from a name or a class."""
 
     _CLASS = BaseReaderFile
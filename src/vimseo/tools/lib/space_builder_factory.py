@@ -22,12 +22,11 @@
 #    OTHER AUTHORS   - MACROSCOPIC CHANGES
 from __future__ import annotations
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.tools.lib.space_builders import SpaceBuilder
 
 
-class SpaceBuilderFactory(BaseFactory):
+class SpaceBuilderFactory(BaseCachedFactory):
     """Space builder factory to create a parameter space builder from a name or a
     class."""
 
@@ -17,14 +17,13 @@ from __future__ import annotations
 
 import logging
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.tools.post_tools.verification_plots import Plotter
 
 LOGGER = logging.getLogger(__name__)
 
 
-class PlotFactory(BaseFactory):
+class PlotFactory(BaseCachedFactory):
     """Plot factory to create a :class:`~.Plotter` from a name or a class."""
 
     _CLASS = Plotter
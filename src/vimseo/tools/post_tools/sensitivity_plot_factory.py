@@ -17,14 +17,13 @@ from __future__ import annotations
 
 import logging
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.tools.post_tools.sensitivity_plots import SensitivityPlot
 
 LOGGER = logging.getLogger(__name__)
 
 
-class SensitivityPlotFactory(BaseFactory):
+class SensitivityPlotFactory(BaseCachedFactory):
     """Sensitivity plot factory to create a :class:`~.SensitivityPlot` from a name or a
     class."""
 
@@ -34,6 +34,7 @@ from vimseo.config.global_configuration import _configuration as config
 from vimseo.tools.base_settings import BaseInputs
 from vimseo.tools.base_settings import BaseSettings
 from vimseo.tools.base_tool import BaseTool
+from vimseo.tools.doe.doe_dataset_store import LazyDOEDataset
 from vimseo.tools.statistics.statistics_result import StatisticsResult
 from vimseo.utilities.datasets import dataset_to_dataframe
 from vimseo.utilities.datasets import get_scalar_names
@@ -46,7 +47,12 @@ if TYPE_CHECKING:
 
 
 class StatisticsInputs(BaseInputs):
-    dataset: Dataset | None = None
+    dataset: Dataset | LazyDOEDataset | None = Field(
+        default=None,
+        description="The dataset. "
+        "From a lazy view of an on-disk DOE dataset, "
+        "only the scalar variables are loaded.",
+    )
 
 
 class StatisticsSettings(BaseSettings):
@@ -152,6 +158,14 @@ class StatisticsTool(BaseTool):
         default values given in the statistics_tool_defaults dictionary
         """
         dataset = options["dataset"]
+        if isinstance(dataset, LazyDOEDataset):
+            dataset = dataset.to_dataset(
+                variable_names=[
+                    name
+                    for name, size in dataset.variable_names_to_n_components.items()
+                    if size == 1
+                ]
+            )
         self._dataset = dataset
 
         # Perturb constant samples to avoid error in OpenTurns
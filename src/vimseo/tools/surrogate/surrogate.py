@@ -23,6 +23,7 @@ from typing import Any
 from gemseo import BaseRegressor
 from gemseo import create_surrogate
 from gemseo.datasets.dataset import Dataset
+from gemseo.datasets.io_dataset import IODataset
 from gemseo.disciplines.surrogate import SurrogateDiscipline
 from gemseo.mlearning.core.quality.base_ml_algo_quality import BaseMLAlgoQuality
 from gemseo.mlearning.core.quality.factory import MLAlgoQualityFactory
@@ -37,6 +38,7 @@ from vimseo.tools.base_analysis_tool import BaseAnalysisTool
 from vimseo.tools.base_composite_tool import BaseCompositeTool
 from vimseo.tools.base_settings import BaseInputs
 from vimseo.tools.base_settings import BaseSettings
+from vimseo.tools.doe.doe_dataset_store import LazyDOEDataset
 from vimseo.tools.surrogate.surrogate_result import SurrogateResult
 
 if TYPE_CHECKING:
@@ -66,7 +68,12 @@ MEASURE_EVALUTATION_METHOD_NAMES = {
 
 class SurrogateInputs(BaseInputs):
     model: IntegratedModel | None = None
-    dataset: Dataset | None = None
+    dataset: Dataset | LazyDOEDataset | None = Field(
+        default=None,
+        description="The dataset. "
+        "From a lazy view of an on-disk DOE dataset, "
+        "only the inputs and the approximated outputs are loaded.",
+    )
 
 
 class SurrogateSettings(BaseSettings):
@@ -191,6 +198,17 @@ class SurrogateTool(BaseAnalysisTool):
         algo = options["algo"]
         model = options["model"]
         self.__load_case = model.load_case.name
+        dataset = options["dataset"]
+        if isinstance(dataset, LazyDOEDataset):
+            output_names = options["output_names"]
+            dataset = dataset.to_dataset(
+                variable_names=[
+                    *dataset.get_variable_names(IODataset.INPUT_GROUP),
+                    *output_names,
+                ]
+                if output_names
+                else ()
+            )
 
         if algo:  # no selection
             self.result.model_name = f"{model.name}.{self.__load_case}.{algo}"
@@ -198,7 +216,7 @@ class SurrogateTool(BaseAnalysisTool):
 
             self.result.model = create_surrogate(
                 surrogate=algo,
-                data=options["dataset"],
+                data=dataset,
                 disc_name=self.result.model_name,
                 output_names=options["output_names"],
                 **options["algo_options"],
@@ -211,7 +229,7 @@ class SurrogateTool(BaseAnalysisTool):
             )
             eval_method = options["quality_for_selection"][1]
             self._selector = MLAlgoSelection(
-                options["dataset"],
+                dataset,
                 measure=options["quality_for_selection"][0],
                 measure_evaluation_method_name=eval_method,
                 **options["evaluation_options"][eval_method],
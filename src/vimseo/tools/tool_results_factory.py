@@ -17,14 +17,13 @@ from __future__ import annotations
 
 import logging
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.tools.base_result import BaseResult
 
 LOGGER = logging.getLogger(__name__)
 
 
-class ToolResultsFactory(BaseFactory):
+class ToolResultsFactory(BaseCachedFactory):
     """A factory to create tool results."""
 
     _CLASS = BaseResult
@@ -17,15 +17,14 @@ from __future__ import annotations
 
 import logging
 
-from gemseo.core.base_factory import BaseFactory
-
+from vimseo.core.base_cached_factory import BaseCachedFactory
 from vimseo.tools.base_analysis_tool import BaseAnalysisTool
 from vimseo.tools.base_tool import BaseTool
 
 LOGGER = logging.getLogger(__name__)
 
 
-class ToolsFactory(BaseFactory):
+class ToolsFactory(BaseCachedFactory):
     """A factory to create a tools from a name or a class."""
 
     _CLASS = BaseTool
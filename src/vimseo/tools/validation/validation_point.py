@@ -46,6 +46,7 @@ from vimseo.tools.base_composite_tool import BaseCompositeTool
 from vimseo.tools.base_settings import BaseInputs
 from vimseo.tools.doe.doe import DOESettings
 from vimseo.tools.doe.doe import DOETool
+from vimseo.tools.doe.doe_dataset_store import LazyDOEDataset
 from vimseo.tools.post_tools.distribution_comparison_plot import DistributionComparison
 from vimseo.tools.space.space_tool import update_space_from_statistics
 from vimseo.tools.statistics.statistics_tool import StatisticsInputs
@@ -67,7 +68,12 @@ LOGGER = logging.getLogger(__name__)
 class StochasticValidationPointInputs(BaseInputs):
     model: IntegratedModel | None = None
 
-    measured_data: Dataset | None = None
+    measured_data: Dataset | LazyDOEDataset | None = Field(
+        default=None,
+        description="The measured data. "
+        "From a lazy view of an on-disk DOE dataset, "
+        "only the inputs and the validated outputs are loaded.",
+    )
     """The dataset containing the validation test samples."""
 
     uncertain_input_space: ParameterSpace = Field(
@@ -218,6 +224,11 @@ class StochasticValidationPoint(BaseAnalysisTool):
             else options["output_names"]
         )
 
+        if isinstance(measured_data, LazyDOEDataset):
+            measured_data = measured_data.to_dataset(
+                variable_names=[*self._measured_input_names, *measured_output_names]
+            )
+
         self.result.measured_data = measured_data
         self.result.nominal_data = nominal_data
 
@@ -38,6 +38,7 @@ from vimseo.tools.base_analysis_tool import BaseAnalysisTool
 from vimseo.tools.base_composite_tool import BaseCompositeTool
 from vimseo.tools.base_settings import BaseInputs
 from vimseo.tools.doe.custom_doe import CustomDOETool
+from vimseo.tools.doe.doe_dataset_store import LazyDOEDataset
 from vimseo.tools.post_tools.error_scatter_matrix_plot import ErrorScatterMatrix
 from vimseo.tools.post_tools.metric_bar_plot import IntegratedMetricBars
 from vimseo.tools.post_tools.parallel_coordinates_plot import ParallelCoordinates
@@ -68,7 +69,12 @@ class DeterministicValidationCaseSettings(BaseCodeVerificationSettings):
 
 class DeterministicValidationCaseInputs(BaseInputs):
     model: IntegratedModel | None = None
-    reference_data: IODataset | None = None
+    reference_data: IODataset | LazyDOEDataset | None = Field(
+        default=None,
+        description="The reference dataset. "
+        "From a lazy view of an on-disk DOE dataset, "
+        "only the compared inputs and outputs are loaded.",
+    )
     """The dataset containing the validation test samples."""
 
 
@@ -133,10 +139,6 @@ class DeterministicValidationCase(BaseAnalysisTool):
             else options["input_names"]
         )
 
-        all_input_data = reference_data.to_dict_of_arrays(by_group=True)[
-            IODataset.INPUT_GROUP
-        ]
-
         output_names = (
             [
                 name
@@ -146,6 +148,14 @@ class DeterministicValidationCase(BaseAnalysisTool):
             if not options["output_names"]
             else options["output_names"]
         )
+        if isinstance(reference_data, LazyDOEDataset):
+            reference_data = reference_data.to_dataset(
+                variable_names=[*input_names, *output_names]
+            )
+
+        all_input_data = reference_data.to_dict_of_arrays(by_group=True)[
+            IODataset.INPUT_GROUP
+        ]
 
         self.__orig_cache_path = Path(model._cache_file_path)
 
@@ -21,12 +21,14 @@ from typing import TYPE_CHECKING
 
 from gemseo.datasets.io_dataset import IODataset
 from gemseo.utils.directory_creator import DirectoryNamingMethod
+from pydantic import Field
 
 from vimseo.config.global_configuration import _configuration as config
 from vimseo.core.base_integrated_model import IntegratedModel
 from vimseo.tools.base_composite_tool import BaseCompositeTool
 from vimseo.tools.base_settings import BaseInputs
 from vimseo.tools.doe.custom_doe import CustomDOETool
+from vimseo.tools.doe.doe_dataset_store import LazyDOEDataset
 from vimseo.tools.verification.base_verification import BaseCodeVerificationSettings
 from vimseo.tools.verification.base_verification import BaseVerification
 from vimseo.tools.verification.base_verification import check_output_names
@@ -39,7 +41,12 @@ if TYPE_CHECKING:
 
 class CodeVerificationAgainstDataInputs(BaseInputs):
     model: IntegratedModel | None = None
-    reference_data: IODataset | None = None
+    reference_data: IODataset | LazyDOEDataset | None = Field(
+        default=None,
+        description="The reference dataset. "
+        "From a lazy view of an on-disk DOE dataset, "
+        "only the compared inputs and outputs are loaded.",
+    )
 
 
 class CodeVerificationAgainstData(BaseVerification):
@@ -78,9 +85,7 @@ class CodeVerificationAgainstData(BaseVerification):
         self.result._fill_metadata(options["description"], model.description)
 
         input_names = (
-            options["reference_data"].get_variable_names(
-                group_name=IODataset.INPUT_GROUP
-            )
+            reference_data.get_variable_names(group_name=IODataset.INPUT_GROUP)
             if len(options["input_names"]) == 0
             else options["input_names"]
         )
@@ -91,6 +96,10 @@ class CodeVerificationAgainstData(BaseVerification):
             else options["output_names"]
         )
         check_output_names(self._output_names, model)
+        if isinstance(reference_data, LazyDOEDataset):
+            reference_data = reference_data.to_dataset(
+                variable_names=[*input_names, *self._output_names]
+            )
 
         doe_dataset = (
             self
@@ -26,12 +26,14 @@ from typing import TYPE_CHECKING
 from gemseo.datasets.dataset import Dataset
 from gemseo.datasets.io_dataset import IODataset
 from gemseo.utils.directory_creator import DirectoryNamingMethod
+from pydantic import Field
 
 from vimseo.config.global_configuration import _configuration as config
 from vimseo.core.base_integrated_model import IntegratedModel
 from vimseo.tools.base_composite_tool import BaseCompositeTool
 from vimseo.tools.base_settings import BaseInputs
 from vimseo.tools.doe.custom_doe import CustomDOETool
+from vimseo.tools.doe.doe_dataset_store import LazyDOEDataset
 from vimseo.tools.verification.base_verification import BaseCodeVerificationSettings
 from vimseo.tools.verification.base_verification import BaseVerification
 
@@ -44,7 +46,12 @@ if TYPE_CHECKING:
 class CodeVerificationAgainstModelInputs(BaseInputs):
     model: IntegratedModel | None = None
     reference_model: IntegratedModel | None = None
-    input_dataset: Dataset | None = None
+    input_dataset: Dataset | LazyDOEDataset | None = Field(
+        default=None,
+        description="The dataset of the input samples. "
+        "From a lazy view of an on-disk DOE dataset, "
+        "only the inputs are loaded.",
+    )
 
 
 # TODO add observed output names.
@@ -80,6 +87,10 @@ class CodeVerificationAgainstModel(BaseVerification):
         model = options["model"]
         reference_model = options["reference_model"]
         input_dataset = options["input_dataset"]
+        if isinstance(input_dataset, LazyDOEDataset):
+            input_dataset = input_dataset.to_dataset(
+                variable_names=input_dataset.get_variable_names(IODataset.INPUT_GROUP)
+            )
 
         self.result._fill_metadata(options["description"], model.description)
         self.result.metadata.misc["reference_model"] = reference_model.description
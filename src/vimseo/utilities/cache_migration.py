@@ -0,0 +1,89 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import logging
+from argparse import ArgumentParser
+from typing import TYPE_CHECKING
+
+from gemseo.caches.hdf5_cache import HDF5Cache
+
+from vimseo.core.caches.sharded_cache import ShardedCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+parser = ArgumentParser(
+    prog="cache_migrate_to_sharded",
+    description="Copy the entries of an HDF5 cache file to a sharded cache directory.",
+)
+parser.add_argument("hdf_file_path", type=str)
+parser.add_argument("directory_path", type=str)
+parser.add_argument(
+    "-n",
+    "--node_path",
+    type=str,
+    default="node",
+    help="The path to the node of the HDF5 file containing the cache entries.",
+)
+
+
+def cache_migrate_to_sharded(
+    hdf_file_path: Path | str,
+    directory_path: Path | str,
+    node_path: str = "node",
+) -> ShardedCache:
+    """Copy the entries of an HDF5 cache to a sharded cache.
+
+    The entries already in the sharded cache are kept.
+
+    Args:
+        hdf_file_path: The path to the HDF5 cache file.
+        directory_path: The path to the root directory of the sharded cache.
+        node_path: The path to the node of the HDF5 file containing the cache entries.
+
+    Returns:
+        The sharded cache.
+    """
+    hdf5_cache = HDF5Cache(hdf_file_path=hdf_file_path, hdf_node_path=node_path)
+    sharded_cache = ShardedCache(directory_path=directory_path)
+    n_entries = 0
+    for entry in hdf5_cache.get_all_entries():
+        if entry.outputs:
+            sharded_cache.cache_outputs(entry.inputs, entry.outputs)
+        if entry.jacobian:
+            sharded_cache.cache_jacobian(entry.inputs, entry.jacobian)
+        n_entries += 1
+    LOGGER.info(
+        f"{n_entries} entries of {hdf_file_path} copied to the sharded cache "
+        f"{directory_path}."
+    )
+    return sharded_cache
+
+
+def main():
+    arguments = vars(parser.parse_args())
+    cache_migrate_to_sharded(
+        arguments["hdf_file_path"],
+        arguments["directory_path"],
+        arguments["node_path"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,14 +17,135 @@ from __future__ import annotations
 
 import glob
 import logging
+import os
 import re
+import shutil
+import sys
 import time
 from pathlib import Path
 
+from strenum import StrEnum
+
 LOGGER = logging.getLogger(__name__)
 
 WAIT_FILE_TIMEOUT = 10
 
+_FICLONE = 0x40049409
+"""The request code of the Linux ioctl cloning a file."""
+
+
+class FileTransferMethod(StrEnum):
+    """The method to transfer a file to a directory."""
+
+    AUTO = "auto"
+    """Move the file if it is deleted afterwards, otherwise reflink it."""
+
+    COPY = "copy"
+    """Copy the file."""
+
+    MOVE = "move"
+    """Move the file."""
+
+    HARDLINK = "hardlink"
+    """Create a hard link to the file, or copy it if not supported."""
+
+    REFLINK = "reflink"
+    """Clone the file with copy-on-write, or copy it if not supported."""
+
+
+def reflink_file(source: Path, target: Path) -> None:
+    """Clone a file with copy-on-write.
+
+    Args:
+        source: The path to the file.
+        target: The path to the clone.
+
+    Raises:
+        OSError: When the platform or the filesystem does not support cloning.
+    """
+    try:
+        import fcntl
+    except ImportError as err:
+        msg = "File cloning is not supported on this platform."
+        raise OSError(msg) from err
+
+    with source.open("rb") as source_file, target.open("wb") as target_file:
+        try:
+            fcntl.ioctl(target_file.fileno(), _FICLONE, source_file.fileno())
+        except OSError:
+            target_file.close()
+            target.unlink()
+            raise
+    shutil.copymode(source, target)
+
+
+def transfer_file(
+    source: Path,
+    target_directory: Path,
+    method: FileTransferMethod = FileTransferMethod.COPY,
+    delete_source: bool = False,
+) -> FileTransferMethod:
+    """Transfer a file to a directory.
+
+    A file existing in the directory with the same name is replaced.
+    The hard link and the reflink fall back to a copy when they are not supported,
+    e.g. between two filesystems.
+
+    Args:
+        source: The path to the file.
+        target_directory: The path to the directory.
+        method: The transfer method.
+        delete_source: Whether the file is deleted after the transfer,
+            used by the automatic method.
+
+    Returns:
+        The transfer method actually used.
+    """
+    target = Path(target_directory) / source.name
+    if method == FileTransferMethod.AUTO:
+        method = (
+            FileTransferMethod.MOVE if delete_source else FileTransferMethod.REFLINK
+        )
+
+    if method == FileTransferMethod.MOVE:
+        shutil.move(source, target)
+        return method
+
+    if method in {FileTransferMethod.HARDLINK, FileTransferMethod.REFLINK}:
+        target.unlink(missing_ok=True)
+        try:
+            if method == FileTransferMethod.HARDLINK:
+                os.link(source, target)
+            else:
+                reflink_file(source, target)
+        except OSError as err:
+            LOGGER.debug(f"Falling back to a copy of {source} ({method}): {err!s}")
+        else:
+            return method
+
+    shutil.copy(source, target)
+    return FileTransferMethod.COPY
+
+
+def get_cache_directory() -> Path:
+    """Return the directory of the files cached by VIMSEO between processes.
+
+    Returns:
+        The ``cache_directory`` of the configuration if set,
+        otherwise the cache directory of the user.
+    """
+    # Import locally to avoid a cyclic import with the configuration factories.
+    from vimseo.config.global_configuration import _configuration as configuration
+
+    if configuration.cache_directory:
+        return Path(configuration.cache_directory)
+
+    if sys.platform.startswith("win"):
+        root_directory = os.environ.get("LOCALAPPDATA", Path.home() / "AppData/Local")
+    else:
+        root_directory = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(root_directory) / "vimseo"
+
 
 def wait_for_file(file_path: Path, timeout: float | None = None) -> None:
     """Wait for a file to appear.
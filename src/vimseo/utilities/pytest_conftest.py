@@ -115,9 +115,9 @@ def pyplot_close_all():
 @pytest.fixture
 def reset_factory():
     """Reset the factory cache."""
-    BaseFactory.cache_clear()
+    BaseFactory.clear_cache()
     yield
-    BaseFactory.cache_clear()
+    BaseFactory.clear_cache()
 
 
 # Backup before we monkey patch.
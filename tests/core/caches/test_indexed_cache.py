@@ -0,0 +1,155 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import pytest
+from gemseo.caches.base_cache import DATA_COMPARATOR
+from gemseo.caches.hdf5_cache import HDF5Cache
+from gemseo.caches.memory_full_cache import MemoryFullCache
+from numpy import array
+from numpy.random import default_rng
+from numpy.testing import assert_array_equal
+
+from vimseo.api import create_model
+from vimseo.core.caches.indexed_cache import IndexedCache
+from vimseo.core.caches.indexed_cache import InputIndex
+from vimseo.core.caches.lru_cache import LRUCache
+
+
+@pytest.fixture
+def cache() -> IndexedCache:
+    """An indexed cache with two entries."""
+    cache = IndexedCache(MemoryFullCache(), tolerance=1.0e-3)
+    cache.cache_outputs({"x": array([1.0, 0.0])}, {"y": array([2.0])})
+    cache.cache_outputs({"x": array([2.0, 0.0])}, {"y": array([4.0])})
+    return cache
+
+
+def test_tolerance(cache):
+    """Check that the entries are found within the tolerance and that the hits and
+    misses are counted."""
+    assert cache.wrapped_cache.tolerance == 0.0
+    assert len(cache) == 2
+    entry = cache[{"x": array([2.0 + 1.0e-4, 0.0])}]
+    assert_array_equal(entry.inputs["x"], array([2.0 + 1.0e-4, 0.0]))
+    assert_array_equal(entry.outputs["y"], array([4.0]))
+    assert not cache[{"x": array([2.1, 0.0])}].outputs
+    # The index is updated with the new entries.
+    cache.cache_outputs({"x": array([3.0, 0.0])}, {"y": array([6.0])})
+    assert_array_equal(cache[{"x": array([3.0, 1.0e-4])}].outputs["y"], array([6.0]))
+    assert cache.statistics == {"n_hits": 2, "n_misses": 1, "hit_rate": 2 / 3}
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.statistics["n_hits"] == 0
+
+
+def test_exact_lookup(cache):
+    """Check that the lookups are delegated to the wrapped cache without
+    tolerance."""
+    cache.tolerance = 0.0
+    assert_array_equal(cache[{"x": array([1.0, 0.0])}].outputs["y"], array([2.0]))
+    assert not cache[{"x": array([1.0 + 1.0e-4, 0.0])}].outputs
+    assert (cache.n_hits, cache.n_misses) == (1, 1)
+
+
+@pytest.mark.parametrize("tolerance", [1.0e-10, 1.0e-2, 1.0e-1])
+def test_input_index(tolerance):
+    """Check that the index finds the same input data as a linear scan."""
+    rng = default_rng(1)
+    index = InputIndex()
+    indexed_data = []
+    # Enough entries to rebuild the KD-tree with entries added afterwards.
+    for value in rng.normal(scale=10.0, size=(500, 3)):
+        input_data = {"a": value[:2], "b": value[2:]}
+        index.add(input_data)
+        indexed_data.append(input_data)
+
+    for value in [
+        *(data["a"].tolist() + data["b"].tolist() for data in indexed_data[::25]),
+        *rng.normal(scale=10.0, size=(20, 3)),
+    ]:
+        value = array(value) * (1.0 + tolerance / 2)
+        input_data = {"a": value[:2], "b": value[2:]}
+        expected = next(
+            (
+                data
+                for data in indexed_data
+                if DATA_COMPARATOR(input_data, data, tolerance)
+            ),
+            None,
+        )
+        assert index.find(input_data, tolerance) is expected
+
+
+def test_input_index_other_layout():
+    """Check that input data with another layout are searched exhaustively."""
+    index = InputIndex()
+    index.add({"x": array([1.0])})
+    index.add({"x": array([1.0, 2.0])})
+    index.add({"y": array([1.0])})
+    assert len(index) == 3
+    assert index.find({"x": array([1.0, 2.0 + 1.0e-6])}, 1.0e-3) is not None
+    assert index.find({"y": array([1.0 + 1.0e-6])}, 1.0e-3) is not None
+    assert index.find({"x": array([3.0, 2.0])}, 1.0e-3) is None
+
+
+def test_input_index_larger_norm():
+    """Check that input data with a larger norm than the indexed ones are found within
+    the tolerance relative to their norm."""
+    index = InputIndex()
+    index.add({"x": array([1.0])})
+    input_data = {"x": array([3.0])}
+    assert DATA_COMPARATOR(input_data, {"x": array([1.0])}, 0.5)
+    assert index.find(input_data, 0.5) is not None
+
+
+def test_lru_eviction():
+    """Check that the entries evicted from a wrapped LRU cache are removed from the
+    index."""
+    cache = IndexedCache(LRUCache(max_size=2), tolerance=1.0e-3)
+    cache.cache_outputs({"x": array([1.0])}, {"y": array([1.0])})
+    cache.cache_outputs({"x": array([2.0])}, {"y": array([2.0])})
+    assert cache[{"x": array([1.0 + 1.0e-6])}].outputs
+    cache.cache_outputs({"x": array([3.0])}, {"y": array([3.0])})
+    # The entry x=2 is the least recently used one.
+    assert not cache[{"x": array([2.0 + 1.0e-6])}].outputs
+    assert cache._get_index().find({"x": array([2.0])}, 1.0e-3) is None
+    assert len(cache._get_index()) == 2
+    assert_array_equal(cache[{"x": array([1.0 + 1.0e-6])}].outputs["y"], [1.0])
+
+
+def test_model_cache_without_tolerance(tmp_wd):
+    """Check that a model cache without tolerance is not wrapped."""
+    model = create_model("MockModel", "LC1")
+    assert isinstance(model.cache, HDF5Cache)
+
+
+def test_model_cache(tmp_wd):
+    """Check that a model cache created from an archive finds the results within the
+    tolerance."""
+    model = create_model("MockModel", "LC1")
+    model.execute({"x1": array([0.5])})
+    model.create_cache_from_archive()
+    assert isinstance(model.cache, IndexedCache)
+    assert model.cache.tolerance == 1.0e-10
+    # The public attributes of the wrapped cache are forwarded.
+    assert isinstance(model.cache.wrapped_cache, HDF5Cache)
+    assert model.cache.hdf_file is model.cache.wrapped_cache.hdf_file
+    with pytest.raises(AttributeError, match="has no attribute '_foo'"):
+        model.cache._foo  # noqa: B018
+    model.cache.reset_statistics()
+    model.execute({"x1": array([0.5])})
+    assert model.cache.n_hits == 1
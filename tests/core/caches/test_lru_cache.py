@@ -0,0 +1,106 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import pytest
+from numpy import array
+from numpy.testing import assert_array_equal
+
+from vimseo.api import create_model
+from vimseo.core.caches import ModelCacheType
+from vimseo.core.caches.lru_cache import LRUCache
+from vimseo.core.model_metadata import MetaDataNames
+
+
+@pytest.fixture
+def cache() -> LRUCache:
+    """An LRU cache of size 2 with two entries."""
+    cache = LRUCache(max_size=2)
+    cache.cache_outputs({"x": array([1.0])}, {"y": array([2.0])})
+    cache.cache_outputs({"x": array([2.0])}, {"y": array([4.0])})
+    return cache
+
+
+def test_eviction(cache):
+    """Check that the least recently used entry is discarded when the cache is
+    full."""
+    assert_array_equal(cache[{"x": array([1.0])}].outputs["y"], array([2.0]))
+    cache.cache_outputs({"x": array([3.0])}, {"y": array([6.0])})
+    assert len(cache) == 2
+    assert not cache[{"x": array([2.0])}].outputs
+    assert [entry.inputs["x"][0] for entry in cache.get_all_entries()] == [1.0, 3.0]
+    assert_array_equal(cache.last_entry.inputs["x"], array([3.0]))
+
+
+def test_copy(cache):
+    """Check that the cached data are not modified with the original data."""
+    input_data = {"x": array([3.0])}
+    output_data = {"y": array([6.0])}
+    cache.cache_outputs(input_data, output_data)
+    output_data["y"][0] = 0.0
+    assert_array_equal(cache[{"x": array([3.0])}].outputs["y"], array([6.0]))
+
+
+def test_tolerance(cache):
+    """Check that an entry is found within the tolerance."""
+    assert not cache[{"x": array([2.0 + 1e-3])}].outputs
+    cache.tolerance = 1e-2
+    assert_array_equal(cache[{"x": array([2.0 + 1e-3])}].outputs["y"], array([4.0]))
+
+
+def test_jacobian(cache):
+    """Check that caching the Jacobian keeps the outputs."""
+    cache.cache_jacobian({"x": array([2.0])}, {"y": {"x": array([[2.0]])}})
+    entry = cache[{"x": array([2.0])}]
+    assert_array_equal(entry.outputs["y"], array([4.0]))
+    assert_array_equal(entry.jacobian["y"]["x"], array([[2.0]]))
+
+
+def test_ephemeral_model(tmp_wd):
+    """Check that an ephemeral model writes nothing to the disk."""
+    model = create_model("MockModel", "LC1", ephemeral=True, memory_cache_size=2)
+    assert isinstance(model.cache, LRUCache)
+    assert model.cache.max_size == 2
+    assert model.archive_manager is None
+    assert model.scratch_manager is None
+    output_data = model.execute({"x1": array([1.0])})
+    assert output_data["error_code"][0] == 0
+    for name in (
+        MetaDataNames.directory_archive_root,
+        MetaDataNames.directory_archive_job,
+        MetaDataNames.directory_scratch_root,
+        MetaDataNames.directory_scratch_job,
+    ):
+        assert output_data[name][0] == ""
+    model.execute({"x1": array([1.0])})
+    assert len(model.cache) == 1
+    assert model.scratch_job_directory == ""
+    assert len(model.execute_batch([{"x1": array([0.5])}], n_processes=2)) == 1
+    assert not list(tmp_wd.iterdir())
+    with pytest.raises(ValueError, match="has no archive"):
+        model.create_cache_from_archive()
+
+
+def test_ephemeral_model_with_job_directory(tmp_wd):
+    """Check that a model whose components use a job directory cannot be
+    ephemeral."""
+    with pytest.raises(ValueError, match="cannot be ephemeral"):
+        create_model(
+            "MockModelPersistent",
+            "LC1",
+            cache_type=ModelCacheType.SHARDED,
+            ephemeral=True,
+        )
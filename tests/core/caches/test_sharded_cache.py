@@ -0,0 +1,96 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import pytest
+from numpy import array
+from numpy import atleast_1d
+from numpy.testing import assert_array_equal
+
+from vimseo.api import create_model
+from vimseo.core.caches import ModelCacheType
+from vimseo.core.caches.sharded_cache import ShardedCache
+
+
+@pytest.fixture
+def cache(tmp_wd) -> ShardedCache:
+    """A sharded cache with two entries."""
+    cache = ShardedCache(directory_path="cache")
+    cache.cache_outputs({"x": array([1.0])}, {"y": array([2.0]), "s": array(["a"])})
+    cache.cache_outputs({"x": array([2.0])}, {"y": array([4.0]), "s": array(["b"])})
+    return cache
+
+
+def test_cache_outputs(cache):
+    """Check that the cached outputs are retrieved from the input data."""
+    assert len(cache) == 2
+    entry = cache[{"x": array([2.0])}]
+    assert_array_equal(entry.outputs["y"], array([4.0]))
+    assert_array_equal(entry.outputs["s"], array(["b"]))
+    assert not cache[{"x": array([3.0])}].outputs
+    assert_array_equal(cache.last_entry.inputs["x"], array([2.0]))
+    assert [entry.inputs["x"][0] for entry in cache.get_all_entries()] == [1.0, 2.0]
+    # No temporary file is left by the atomic writes.
+    assert not list(cache.directory_path.glob("*/*.tmp"))
+
+
+def test_shared_directory(cache):
+    """Check that an entry written by a cache is seen by another cache sharing its
+    directory."""
+    other_cache = ShardedCache(directory_path=cache.directory_path)
+    other_cache.cache_outputs({"x": array([3.0])}, {"y": array([6.0])})
+    assert len(cache) == 3
+    assert_array_equal(cache[{"x": array([3.0])}].outputs["y"], array([6.0]))
+
+
+def test_tolerance(cache):
+    """Check that an entry is found within the tolerance."""
+    cache.tolerance = 1e-6
+    assert_array_equal(cache[{"x": array([1.0 + 1e-8])}].outputs["y"], array([2.0]))
+
+
+def test_cache_jacobian(cache):
+    """Check that the Jacobian data are cached without losing the output data."""
+    input_data = {"x": array([1.0])}
+    cache.cache_jacobian(input_data, {"y": {"x": array([[2.0]])}})
+    entry = cache[input_data]
+    assert_array_equal(entry.jacobian["y"]["x"], array([[2.0]]))
+    assert_array_equal(entry.outputs["y"], array([2.0]))
+
+
+def test_clear(cache):
+    """Check that the cache can be cleared."""
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.last_entry.inputs == {}
+
+
+def test_model_with_sharded_cache(tmp_wd):
+    """Check that a model can use a sharded cache, including with batch execution."""
+    model = create_model("MockModel", "LC1", cache_type=ModelCacheType.SHARDED)
+    assert isinstance(model.cache, ShardedCache)
+    assert model.cache.directory_path.name == "MockModel_LC1_cache"
+
+    model.execute({"x1": atleast_1d(0.5)})
+    job_directory = model.archive_manager.job_directory
+    model.execute({"x1": atleast_1d(0.5)})
+    assert model.archive_manager.job_directory == job_directory
+    assert len(model.cache) == 1
+
+    model.execute_batch(
+        [{"x1": atleast_1d(0.25)}, {"x1": atleast_1d(0.5)}], n_processes=2
+    )
+    assert len(model.cache) == 2
@@ -15,8 +15,29 @@
 
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
+
+import pytest
+
+from vimseo import api
 from vimseo.api import get_available_load_cases
 from vimseo.api import get_available_models
+from vimseo.config.global_configuration import _configuration as configuration
+from vimseo.core import base_cached_factory
+from vimseo.core import model_registry
+from vimseo.core.load_case_factory import LoadCaseFactory
+from vimseo.core.model_factory import ModelFactory
+from vimseo.core.model_registry import COMPATIBILITY_FILE_NAME
+from vimseo.core.model_registry import clear_registry
+from vimseo.core.model_registry import get_registry
+
+IMPORT_TIME_BUDGET = 1.0
+"""The maximum time to import the API once GEMSEO is imported, in seconds."""
+
+N_IMPORTS = 3
+"""The number of imports whose fastest one is used to estimate an import time."""
 
 
 def test_available_load_cases(tmp_wd):
@@ -36,3 +57,84 @@ def test_available_models(tmp_wd):
         "MockModelPersistent",
         "MockModelWithMaterial",
     ]
+
+
+@pytest.fixture
+def registry_cache(tmp_wd, monkeypatch):
+    """A cache directory of the model registry specific to the test."""
+    monkeypatch.setattr(configuration, "cache_directory", str(tmp_wd))
+    clear_registry()
+    yield tmp_wd / COMPATIBILITY_FILE_NAME
+    clear_registry()
+
+
+def test_registry_without_instantiation(registry_cache, monkeypatch):
+    """Check that the registry is computed without instantiating the models."""
+
+    def create(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(ModelFactory, "create", create)
+    assert get_available_load_cases("MockModelFields") == ["LC1"]
+    assert get_available_load_cases("MockCurves") == ["Dummy"]
+    assert get_available_load_cases("BendingTestWithPost") == []
+    assert registry_cache.is_file()
+
+
+def test_registry_cache(registry_cache, monkeypatch):
+    """Check that the registry is read from the disk and invalidated by the
+    factories."""
+    get_registry()
+    data = json.loads(registry_cache.read_text())
+    data["registry"]["MockModel"] = ["LC2"]
+    registry_cache.write_text(json.dumps(data))
+    model_registry._load_registry.cache_clear()
+    assert get_available_load_cases("MockModel") == ["LC2"]
+
+    monkeypatch.setattr(base_cached_factory, "__version__", "0.0.0")
+    model_registry._load_registry.cache_clear()
+    assert get_available_load_cases("MockModel") == ["LC1", "LC2"]
+    key = json.loads(registry_cache.read_text())["key"]
+    assert key["factories"][0]["versions"]["vimseo"] == "0.0.0"
+
+
+@pytest.mark.parametrize("domain", ["", "Beam"])
+def test_registry_load_case_names(domain):
+    """Check that the names of the load cases of the registry are those of the load
+    cases."""
+    factory = LoadCaseFactory()
+    load_case_names = model_registry._get_load_case_names(domain, factory.class_names)
+    assert load_case_names
+    assert [
+        factory.create(load_case_name, domain=domain).name
+        for load_case_name in load_case_names
+    ] == load_case_names
+
+
+def test_lazy_attributes():
+    """Check that the factories are imported at first access."""
+    assert api.ModelFactory is ModelFactory
+    assert "ToolsFactory" in dir(api)
+    with pytest.raises(AttributeError, match="has no attribute 'Foo'"):
+        api.Foo  # noqa: B018
+
+
+def test_import_time():
+    """Check that importing the API, logger configuration included, takes little time
+    once GEMSEO is imported.
+
+    The fastest of several imports is used to be robust to the load of the machine.
+    """
+    code = (
+        "import time; import gemseo; start = time.perf_counter(); import vimseo.api; "
+        "print(time.perf_counter() - start)"
+    )
+    import_times = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout.split()[-1]
+        )
+        for _ in range(N_IMPORTS)
+    ]
+    assert min(import_times) < IMPORT_TIME_BUDGET
@@ -0,0 +1,72 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from gemseo.core.base_factory import BaseFactory
+
+from vimseo.config.global_configuration import _configuration as configuration
+from vimseo.core import base_cached_factory
+from vimseo.core.load_case_factory import LoadCaseFactory
+from vimseo.problems.load_cases.mock import LC1
+
+
+@pytest.fixture
+def factory_cache(tmp_wd, monkeypatch, reset_factory):
+    """A cache directory of the factories specific to the test."""
+    monkeypatch.setattr(configuration, "cache_directory", str(tmp_wd))
+    return tmp_wd / base_cached_factory.DIRECTORY_NAME
+
+
+def test_discovery_cache(factory_cache, monkeypatch):
+    """Check that the discovered classes are read from the cache file."""
+    class_names = LoadCaseFactory().class_names
+    file_path = LoadCaseFactory().cache_file_path
+    assert file_path.parent == factory_cache
+    assert set(json.loads(file_path.read_text())["classes"]) == set(class_names)
+
+    def update(self):
+        raise AssertionError
+
+    BaseFactory.clear_cache()
+    monkeypatch.setattr(BaseFactory, "update", update)
+    factory = LoadCaseFactory()
+    assert factory.class_names == class_names
+    assert factory.get_class("LC1") is LC1
+    assert factory.is_available("LC2")
+    with pytest.raises(ImportError, match="The class Foo is not available"):
+        factory.get_class("Foo")
+
+
+def test_discovery_cache_invalidation(factory_cache, monkeypatch):
+    """Check that the cache is invalidated when the version changes."""
+    LoadCaseFactory()
+    file_path = LoadCaseFactory().cache_file_path
+    data = json.loads(file_path.read_text())
+    data["classes"]["LC1"] = ["vimseo.problems.load_cases.mock", "vimseo"]
+    data["classes"]["Foo"] = ["vimseo.problems.load_cases.mock", "vimseo"]
+    file_path.write_text(json.dumps(data))
+
+    BaseFactory.clear_cache()
+    with pytest.raises(ImportError, match="The class Foo cannot be found"):
+        LoadCaseFactory().get_class("Foo")
+
+    BaseFactory.clear_cache()
+    monkeypatch.setattr(base_cached_factory, "__version__", "0.0.0")
+    assert "Foo" not in LoadCaseFactory().class_names
+    assert json.loads(file_path.read_text())["key"]["versions"]["vimseo"] == "0.0.0"
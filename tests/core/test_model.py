@@ -18,6 +18,7 @@ from __future__ import annotations
 import re
 from math import inf
 from pathlib import Path
+from time import sleep
 
 import numpy as np
 import pytest
@@ -28,6 +29,7 @@ from numpy.testing import assert_allclose
 from numpy.testing import assert_array_equal
 
 from vimseo.api import create_model
+from vimseo.core import batch_execution
 from vimseo.core.model_metadata import DEFAULT_METADATA
 from vimseo.core.model_metadata import MetaDataNames
 from vimseo.core.pre_run_post_model import PreRunPostModel
@@ -338,3 +340,55 @@ def test_input_grammar_extras(tmp_wd):
     with pytest.raises(KeyError, match=re.escape(msg)):
         model.execute({"foo": atleast_1d(0.0)})
     model.EXTRA_INPUT_GRAMMAR_CHECK = False
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_execute_batch(tmp_wd, backend):
+    """Check that a batch of samples executed by several workers gives the same results
+    as sequential executions, and that the results are cached in submission order."""
+    model = create_model("MockModel", "LC1")
+    samples = [{"x1": atleast_1d(0.25 * i)} for i in range(4)]
+
+    results = model.execute_batch(samples, n_processes=2, backend=backend)
+
+    assert len(model.cache) == len(samples)
+    for sample, result, entry in zip(
+        samples, results, model.cache.get_all_entries(), strict=True
+    ):
+        assert_array_equal(result["x1"], sample["x1"])
+        assert_array_equal(
+            result["y1"], array([mock_model_lc1_overall_function(sample["x1"][0])])
+        )
+        assert_array_equal(entry.inputs["x1"], sample["x1"])
+        assert_array_equal(entry.outputs["y1"], result["y1"])
+
+    archive_job_directories = {
+        result[MetaDataNames.directory_archive_job][0] for result in results
+    }
+    assert len(archive_job_directories) == len(samples)
+
+    # All the samples are now in the cache.
+    model.execute_batch(samples, n_processes=2, backend=backend)
+    assert len(model.cache) == len(samples)
+
+
+def test_execute_batch_failure(tmp_wd, monkeypatch):
+    """Check that the samples not started yet are not executed after a failure."""
+    executed_samples = []
+
+    def execute_sample(input_data):
+        executed_samples.append(input_data)
+        if input_data["x1"][0] == 0.0:
+            msg = "The execution failed."
+            raise RuntimeError(msg)
+        sleep(0.1)
+        return dict(input_data)
+
+    monkeypatch.setattr(batch_execution, "_execute_sample", execute_sample)
+    model = create_model("MockModel", "LC1")
+    samples = [{"x1": atleast_1d(0.05 * i)} for i in range(20)]
+
+    with pytest.raises(RuntimeError, match="The execution failed"):
+        model.execute_batch(samples, n_processes=2, backend="thread")
+
+    assert len(executed_samples) < len(samples)
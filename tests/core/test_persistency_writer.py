@@ -0,0 +1,115 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import gc
+import threading
+from time import sleep
+
+import pytest
+from numpy import array
+
+from vimseo.api import create_model
+from vimseo.core.persistency_writer import PersistencyWriter
+from vimseo.storage_management.base_storage_manager import PersistencyPolicy
+
+
+def test_tasks_order():
+    """Check that the tasks are executed in submission order by a single thread."""
+    executed = []
+    with PersistencyWriter(max_size=2) as writer:
+        for i in range(10):
+            writer.submit(lambda i=i: executed.append((i, threading.current_thread())))
+    assert [i for i, _ in executed] == list(range(10))
+    assert {thread for _, thread in executed} != {threading.current_thread()}
+    assert len({thread for _, thread in executed}) == 1
+    writer.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.submit(lambda: None)
+
+
+def test_error():
+    """Check that the first error of a task is raised by flush."""
+    executed = []
+
+    def fail(message):
+        raise ValueError(message)
+
+    writer = PersistencyWriter()
+    writer.submit(lambda: fail("first"))
+    writer.submit(lambda: fail("second"))
+    writer.submit(lambda: executed.append(1))
+    with pytest.raises(ValueError, match="first"):
+        writer.flush()
+    assert executed == [1]
+    writer.flush()
+    writer.close()
+
+
+def test_model(tmp_wd):
+    """Check that a model with an asynchronous persistency archives its results."""
+    model = create_model("MockModel", "LC1", async_persistency=True)
+    model.cache = None
+    with model.persistency_writer:
+        for i in range(3):
+            model.execute({"x1": array([0.25 * i])})
+            assert model.archive_manager.job_directory.name == str(i + 1)
+    results = model.archive_manager.get_archived_results()
+    assert sorted(result["inputs"]["x1"][0] for result in results) == [0.0, 0.25, 0.5]
+    model.flush_persistency()
+
+
+def test_model_with_job_name(tmp_wd, monkeypatch):
+    """Check that a model with an asynchronous persistency and a job name writes the
+    results of an execution before reusing the job directories."""
+    model = create_model(
+        "MockModel",
+        "LC1",
+        async_persistency=True,
+        job_name="job",
+        directory_archive_persistency=PersistencyPolicy.DELETE_ALWAYS,
+    )
+    model.cache = None
+    enforce_persistency = model._enforce_persistency
+
+    def slowly_enforce_persistency(*args):
+        sleep(0.2)
+        enforce_persistency(*args)
+
+    monkeypatch.setattr(model, "_enforce_persistency", slowly_enforce_persistency)
+    for i in range(2):
+        model.execute({"x1": array([0.25 * i])})
+        assert model.archive_manager.job_directory.name == "job"
+    model.flush_persistency()
+    assert not model.archive_manager.job_directory.exists()
+
+
+def test_garbage_collection(tmp_wd):
+    """Check that the writer of a model is closed with the model, after executing its
+    tasks."""
+    model = create_model("MockModel", "LC1", async_persistency=True)
+    model.cache = None
+    model.execute({"x1": array([0.5])})
+    archive_manager = model.archive_manager
+    threads = set(threading.enumerate())
+    del model
+    gc.collect()
+    assert not [
+        thread
+        for thread in threads
+        if thread.name == "PersistencyWriter" and thread.is_alive()
+    ]
+    assert len(archive_manager.get_archived_results()) == 1
@@ -0,0 +1,118 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import json
+import subprocess
+
+import pytest
+
+from vimseo.core import provenance
+from vimseo.core.provenance import get_provenance
+from vimseo.core.provenance import write_provenance_file
+
+
+@pytest.fixture
+def clear_provenance(tmp_wd, monkeypatch):
+    """Clear the provenance of the process and use a provenance file of the working
+    directory."""
+    monkeypatch.setattr(provenance, "PROVENANCE_FILE_PATH", tmp_wd / "provenance.json")
+    get_provenance.cache_clear()
+    yield
+    get_provenance.cache_clear()
+
+
+def test_resolved_once(clear_provenance, monkeypatch):
+    """Check that git is called once per process."""
+    calls = []
+
+    def check_output(*args, **kwargs):
+        calls.append(args)
+        return b"abc\n"
+
+    monkeypatch.setattr(subprocess, "check_output", check_output)
+    monkeypatch.setattr(provenance, "_is_git_checkout", lambda: True)
+    assert get_provenance().vims_git_version == "abc"
+    assert get_provenance() is get_provenance()
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("version", "expected_git_version"),
+    [("0.1.dev1+g51cfd093d", "51cfd093d"), ("1.0.0", "")],
+)
+def test_without_git(clear_provenance, monkeypatch, version, expected_git_version):
+    """Check the git version when git is not available."""
+
+    def check_output(*args, **kwargs):
+        raise FileNotFoundError
+
+    monkeypatch.setattr(subprocess, "check_output", check_output)
+    monkeypatch.setattr(provenance, "_is_git_checkout", lambda: True)
+    monkeypatch.setattr(provenance, "__version__", version)
+    assert get_provenance().vims_git_version == expected_git_version
+    assert get_provenance().package_version == version
+
+
+def test_provenance_file(clear_provenance, monkeypatch):
+    """Check that the provenance file is used instead of git outside a git checkout
+    of VIMSEO."""
+    monkeypatch.setattr(provenance, "_is_git_checkout", lambda: True)
+    monkeypatch.setattr(subprocess, "check_output", lambda *args, **kwargs: b"abc")
+    file_path = write_provenance_file()
+    assert json.loads(file_path.read_text()) == {
+        "vims_git_version": "abc",
+        "package_version": provenance.__version__,
+    }
+
+    get_provenance.cache_clear()
+    monkeypatch.setattr(provenance, "_is_git_checkout", lambda: False)
+    file_path.write_text(json.dumps({"vims_git_version": "def"}))
+    assert get_provenance().vims_git_version == "def"
+
+    # The git repository containing an installed VIMSEO is not used.
+    get_provenance.cache_clear()
+    file_path.unlink()
+    monkeypatch.setattr(provenance, "__version__", "1.0.0")
+    assert get_provenance().vims_git_version == ""
+
+
+def test_provenance_file_in_git_checkout(clear_provenance, monkeypatch):
+    """Check that git takes precedence over the provenance file in a git checkout."""
+    monkeypatch.setattr(provenance, "_is_git_checkout", lambda: True)
+    monkeypatch.setattr(subprocess, "check_output", lambda *args, **kwargs: b"abc")
+    provenance.PROVENANCE_FILE_PATH.write_text(
+        json.dumps({"vims_git_version": "def", "package_version": "0.0.0"})
+    )
+    assert get_provenance().vims_git_version == "abc"
+    assert get_provenance().package_version == provenance.__version__
+
+
+def test_is_git_checkout(tmp_wd, monkeypatch):
+    """Check that only the root directory of the sources is searched for a git
+    checkout of VIMSEO."""
+    source_root_path = tmp_wd / "project" / ".venv" / "lib"
+    source_root_path.mkdir(parents=True)
+    monkeypatch.setattr(provenance, "_SOURCE_ROOT_PATH", source_root_path)
+    (tmp_wd / "project" / ".git").mkdir()
+    (tmp_wd / "project" / "pyproject.toml").touch()
+    assert not provenance._is_git_checkout()
+
+    (source_root_path / ".git").mkdir()
+    assert not provenance._is_git_checkout()
+
+    (source_root_path / "pyproject.toml").touch()
+    assert provenance._is_git_checkout()
@@ -0,0 +1,92 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+from time import monotonic
+
+import pytest
+
+from vimseo.job_executor.base_executor import BaseJobExecutor
+
+
+class ConvergenceExecutor(BaseJobExecutor):
+    """An executor counting the fetchings of the convergence log."""
+
+    def __init__(self):
+        super().__init__("")
+        self.n_fetchings = 0
+
+    def _fetch_convergence(self):
+        self.n_fetchings += 1
+
+
+@pytest.mark.skip_under_windows
+def test_execute_external_software(tmp_wd, caplog):
+    """Check that the outputs of a short subprocess are logged and that its exit is
+    detected without waiting for the supervision periods."""
+    executor = ConvergenceExecutor()
+    executor._job_directory = tmp_wd
+    # A periodic fetching or detection would occur only after the end of the
+    # subprocess.
+    executor.convergence_fetching_period = 60.0
+    executor.termination_detection_period = 60.0
+    cmd = [
+        sys.executable,
+        "-c",
+        "import sys; print('line 1'); print('line 2'); print('error', file=sys.stderr)",
+    ]
+    with caplog.at_level(logging.INFO):
+        start = monotonic()
+        return_code = executor._execute_external_software(cmd, False)
+        elapsed_time = monotonic() - start
+
+    assert return_code == 0
+    # The margin covers the start of the interpreter on a loaded machine.
+    assert elapsed_time < 10.0
+    # The convergence log is fetched once at the end of the subprocess.
+    assert executor.n_fetchings == 1
+    messages = [(record.levelname, record.message) for record in caplog.records]
+    assert ("INFO", "line 1") in messages
+    assert ("INFO", "line 2") in messages
+    assert ("ERROR", "error") in messages
+
+
+@pytest.mark.skip_under_windows
+def test_convergence_fetching_period(tmp_wd):
+    """Check that the convergence log is fetched with the prescribed period."""
+    executor = ConvergenceExecutor()
+    executor._job_directory = tmp_wd
+    executor.convergence_fetching_period = 0.05
+    executor._execute_external_software(
+        [sys.executable, "-c", "import time; time.sleep(0.5)"], False
+    )
+    assert executor.n_fetchings > 3
+
+
+@pytest.mark.skip_under_windows
+def test_check_subprocess(tmp_wd):
+    """Check that an error is raised if the subprocess fails and it is checked."""
+    executor = BaseJobExecutor("")
+    executor._job_directory = tmp_wd
+    # A periodic fetching would occur only after the end of the subprocess.
+    executor.convergence_fetching_period = 60.0
+    cmd = [sys.executable, "-c", "raise SystemExit(3)"]
+    assert executor._execute_external_software(cmd, False) == 3
+    with pytest.raises(subprocess.CalledProcessError):
+        executor._execute_external_software(cmd, True)
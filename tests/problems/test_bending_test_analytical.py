@@ -15,11 +15,17 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 import numpy as np
 import pytest
+import scipy.integrate
+from gemseo.core.discipline.discipline import Discipline
+from numpy.testing import assert_array_equal
 from scipy.interpolate import interp1d
 
 from vimseo.api import create_model
+from vimseo.core.batch_execution import BatchBackend
 
 
 @pytest.mark.fast
@@ -243,3 +249,76 @@ def test_displacement_profile(tmp_wd, load_case, height):
     y_second = np.diff(y_prime) / np.diff(x[:-1])
     y_second_expected = -model.run.m_func(x[1:-1]) / (young_modulus * quadratic_moment)
     assert y_second == pytest.approx(y_second_expected, rel=1e-5)
+
+
+@pytest.mark.parametrize(
+    ("load_case", "relative_location_name"),
+    [
+        ("Cantilever", "relative_dplt_location"),
+        ("ThreePoints", "relative_support_location"),
+    ],
+)
+def test_vectorized_batch(tmp_wd, monkeypatch, load_case, relative_location_name):
+    """Check that the vectorized batch execution matches the solvers.
+
+    The vectorized batch execution integrates the piecewise-linear curvature exactly,
+    so the solvers are used with tight tolerances to compute the expected results.
+    """
+    monkeypatch.setattr(
+        scipy.integrate,
+        "solve_ivp",
+        partial(scipy.integrate.solve_ivp, rtol=1e-13, atol=1e-15),
+    )
+    monkeypatch.setattr(
+        scipy.integrate,
+        "solve_bvp",
+        partial(scipy.integrate.solve_bvp, tol=1e-12, bc_tol=1e-14, max_nodes=100000),
+    )
+    model = create_model("BendingTestAnalytical", load_case)
+    model.set_cache(Discipline.CacheType.NONE)
+    samples = [
+        {
+            "height": np.array([height]),
+            relative_location_name: np.array([relative_location]),
+        }
+        for height in (20.0, 40.0)
+        for relative_location in (0.3, 0.4)
+    ]
+    samples.append({})
+    expected_results = [dict(model.execute(sample)) for sample in samples]
+
+    def solve(*args):
+        raise AssertionError
+
+    monkeypatch.setattr(model.run, "solver_equations", solve)
+    results = model.execute_batch(samples, backend=BatchBackend.VECTORIZED)
+    assert model.run.cache is None
+    assert model.persistency_writer is None
+    assert len(model.archive_manager.get_archived_results()) == 2 * len(samples)
+    for result, expected_result in zip(results, expected_results, strict=True):
+        assert_array_equal(result["dplt_grid"], expected_result["dplt_grid"])
+        assert result["dplt"] == pytest.approx(
+            expected_result["dplt"], abs=1e-10 * abs(expected_result["dplt"]).max()
+        )
+        assert result["maximum_dplt"] == pytest.approx(
+            expected_result["maximum_dplt"], rel=1e-10
+        )
+
+
+def test_vectorized_batch_upstream_once(tmp_wd, monkeypatch):
+    """Check that the vectorized batch execution runs the upstream components once."""
+    model = create_model("BendingTestAnalytical", "Cantilever")
+    model.set_cache(Discipline.CacheType.NONE)
+    pre_processor = model._chain.disciplines[0]
+    run = pre_processor._run
+    executed_input_data = []
+
+    def count_run(input_data):
+        executed_input_data.append(input_data)
+        return run(input_data=input_data)
+
+    monkeypatch.setattr(pre_processor, "_run", count_run)
+    samples = [{"height": np.array([height])} for height in (20.0, 30.0, 40.0)]
+    model.execute_batch(samples, backend=BatchBackend.VECTORIZED)
+    assert len(executed_input_data) == len(samples)
+    assert pre_processor.cache is None
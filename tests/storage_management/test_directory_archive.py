@@ -0,0 +1,234 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import GeneratorType
+
+import pytest
+from numpy import arange
+from numpy import array
+from numpy import linspace
+from numpy import memmap
+from numpy.testing import assert_array_equal
+
+from vimseo.api import create_model
+from vimseo.core.model_metadata import MetaDataNames
+from vimseo.storage_management.archive_index import ArchiveIndex
+from vimseo.storage_management.base_storage_manager import JobDirectoryLayout
+from vimseo.storage_management.base_storage_manager import PersistencyPolicy
+from vimseo.storage_management.base_storage_manager import get_experiment_directory
+from vimseo.storage_management.directory_storage import DirectoryArchive
+
+
+@pytest.fixture
+def model(tmp_wd):
+    """A model whose archive contains five results."""
+    model = create_model("MockModel", "LC1")
+    for i in range(5):
+        model.execute({"x1": array([0.25 * i])})
+    return model
+
+
+def test_iter_archived_results(model):
+    """Check that the archived results are iterated in the order of
+    get_archived_results."""
+    results = model.archive_manager.iter_archived_results(batch_size=2, n_threads=2)
+    assert isinstance(results, GeneratorType)
+    results = list(results)
+    expected_results = model.archive_manager.get_archived_results()
+    assert len(results) == len(expected_results) == 5
+    for result, expected_result in zip(results, expected_results, strict=True):
+        assert result["ID"] == expected_result["ID"]
+        assert result["dir_archive_job"] == expected_result["dir_archive_job"]
+        assert_array_equal(result["inputs"]["x1"], expected_result["inputs"]["x1"])
+    assert sorted(result["inputs"]["x1"][0] for result in results) == [
+        0.0,
+        0.25,
+        0.5,
+        0.75,
+        1.0,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("metadata_filter", "n_results"),
+    [
+        ({MetaDataNames.error_code: 0, MetaDataNames.model: "MockModel"}, 5),
+        ({MetaDataNames.error_code: 1}, 0),
+        (lambda metadata: metadata[MetaDataNames.date] > "2000", 5),
+        (lambda metadata: metadata[MetaDataNames.model] == "OtherModel", 0),
+    ],
+)
+def test_iter_archived_results_filter(model, metadata_filter, n_results):
+    """Check that the archived results can be filtered by their metadata."""
+    results = list(
+        model.archive_manager.iter_archived_results(metadata_filter=metadata_filter)
+    )
+    assert len(results) == n_results
+    assert [result["ID"] for result in results] == list(range(1, n_results + 1))
+
+
+def test_query(model):
+    """Check that the runs can be found from conditions on their data."""
+    archive = model.archive_manager
+    result_files = archive.query(inputs={"x1": (0.3, 0.8)})
+    assert len(result_files) == 2
+    results = archive.get_archived_results(run_ids=result_files)
+    assert sorted(result["inputs"]["x1"][0] for result in results) == [0.5, 0.75]
+    assert len(archive.query(inputs={"x1": (None, 0.3)})) == 2
+    assert len(archive.query(inputs={"x1": 1.0})) == 1
+    assert len(archive.query(metadata={MetaDataNames.error_code: 0})) == 5
+    assert not archive.query(
+        inputs={"x1": (0.3, None)}, metadata={MetaDataNames.model: "OtherModel"}
+    )
+    with pytest.raises(ValueError, match="must be a scalar or a range"):
+        archive.query(inputs={"x1": [1.0]})
+
+
+def test_index_rebuild(model):
+    """Check that the index can be rebuilt from the result files."""
+    archive = model.archive_manager
+    expected_result_files = archive.query(inputs={"x1": (0.3, None)})
+    archive.index.file_path.unlink()
+    assert ArchiveIndex(archive.root_directory).rebuild() == 5
+    assert archive.query(inputs={"x1": (0.3, None)}) == expected_result_files
+
+
+def test_index_results(tmp_wd):
+    """Check that the results are indexed at publication by default."""
+    model = create_model("MockModel", "LC1", archive_index_results=False)
+    model.execute({"x1": array([0.5])})
+    assert not model.archive_manager.index.file_path.exists()
+    # The archive is queried by reading its result files.
+    assert len(model.archive_manager.query(inputs={"x1": 0.5})) == 1
+    assert not model.archive_manager.query(inputs={"x1": (None, 0.3)})
+    assert not model.archive_manager.index.file_path.exists()
+    with pytest.raises(ValueError, match="must be a scalar or a range"):
+        model.archive_manager.query(inputs={"x1": [1.0]})
+
+    model = create_model("MockModel", "LC1")
+    model.execute({"x1": array([0.25])})
+    # The missing index is built from the result files, then updated.
+    index = model.archive_manager.index
+    assert len(index.query(inputs={"x1": (None, None)})) == 2
+    model.execute({"x1": array([0.75])})
+    assert len(model.archive_manager.query(inputs={"x1": (0.3, None)})) == 2
+
+
+def test_query_without_index(model):
+    """Check that querying the result files gives the same runs as the index."""
+    archive = model.archive_manager
+    conditions = [
+        {"inputs": {"x1": (0.3, 0.8)}},
+        {"inputs": {"x1": 1.0}, "metadata": {MetaDataNames.error_code: 0}},
+        {"metadata": {MetaDataNames.model: "OtherModel"}},
+        {"outputs": {"y1": (None, None)}},
+        {},
+    ]
+    expected_result_files = [
+        [path.absolute() for path in archive.query(**condition)]
+        for condition in conditions
+    ]
+    archive = DirectoryArchive(
+        PersistencyPolicy.DELETE_NEVER,
+        "MockModel",
+        "LC1",
+        root_directory=Path(archive.root_directory),
+        index_results=False,
+    )
+    assert [
+        archive.query(**condition) for condition in conditions
+    ] == expected_result_files
+
+
+def test_sharded_job_directory_layout(tmp_wd):
+    """Check the sharded layout of the job directories."""
+    model = create_model(
+        "MockModelPersistent",
+        "LC1",
+        job_directory_layout=JobDirectoryLayout.SHARDED,
+        directory_scratch_persistency=PersistencyPolicy.DELETE_NEVER,
+    )
+    job_directories = set()
+    for i in range(3):
+        model.execute({"x1": array([0.25 * i])})
+        for storage_manager in (model.archive_manager, model.scratch_manager):
+            job_directory = storage_manager.job_directory
+            assert job_directory.parent.name == job_directory.name[:2]
+            assert get_experiment_directory(job_directory) == (
+                job_directory.parent.parent
+            )
+            job_directories.add(job_directory)
+    assert len(job_directories) == 6
+
+    archive_manager = model.archive_manager
+    results = archive_manager.get_archived_results()
+    assert sorted(result["inputs"]["x1"][0] for result in results) == [0.0, 0.25, 0.5]
+    assert len(archive_manager.query()) == 3
+    archive_manager.index.rebuild()
+    assert len(archive_manager.query()) == 3
+
+
+def test_binary_arrays(tmp_wd):
+    """Check that the large arrays are stored in a binary file and memory-mapped."""
+    archive = DirectoryArchive(
+        PersistencyPolicy.DELETE_NEVER,
+        "MyModel",
+        "MyLoadCase",
+        root_directory=Path("archive"),
+        array_size_threshold=10,
+    )
+    archive.create_job_directory()
+    curve = linspace(0.0, 1.0, 100_000)
+    archive.publish({
+        "inputs": {"x": 1.0, "y": array([1.0, 2.0])},
+        "outputs": {"curve": curve, "n": arange(10).reshape((2, 5)), "s": "a"},
+        "metadata": {MetaDataNames.error_code: 0},
+    })
+    # No temporary file is left in the job directory.
+    assert sorted(path.name for path in archive.job_directory.iterdir()) == [
+        "results.json",
+        "results_arrays.bin",
+    ]
+    assert (archive.job_directory / "results.json").stat().st_size < 1000
+
+    result = archive.get_result()
+    assert isinstance(result["outputs"]["curve"], memmap)
+    assert_array_equal(result["outputs"]["curve"], curve)
+    assert_array_equal(result["outputs"]["n"], arange(10).reshape((2, 5)))
+    assert not isinstance(result["inputs"]["y"], memmap)
+    assert_array_equal(result["inputs"]["y"], array([1.0, 2.0]))
+    assert_array_equal(result["outputs"]["s"], array(["a"]))
+    assert_array_equal(result["outputs"][MetaDataNames.error_code], array([0]))
+
+
+def test_binary_arrays_without_large_array(tmp_wd):
+    """Check that no binary file is written when no array is large."""
+    archive = DirectoryArchive(
+        PersistencyPolicy.DELETE_NEVER,
+        "MyModel",
+        "MyLoadCase",
+        root_directory=Path("archive"),
+        array_size_threshold=10,
+    )
+    archive.create_job_directory()
+    archive.publish({
+        "inputs": {"x": 1.0},
+        "outputs": {"y": array([1.0, 2.0])},
+        "metadata": {MetaDataNames.error_code: 0},
+    })
+    assert [path.name for path in archive.job_directory.iterdir()] == ["results.json"]
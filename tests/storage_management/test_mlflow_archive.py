@@ -16,13 +16,22 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from pathlib import Path
+from time import time
+from unittest import mock
 
+import pytest
+from numpy import linspace
 from numpy.core.shape_base import atleast_1d
 from numpy.testing import assert_array_equal
 
 from vimseo.api import create_model
+from vimseo.core.model_metadata import DEFAULT_METADATA
 from vimseo.core.model_metadata import MetaDataNames
 from vimseo.core.model_settings import IntegratedModelSettings
+from vimseo.storage_management.base_storage_manager import PersistencyPolicy
+from vimseo.storage_management.mlflow_storage import MlflowArchive
+from vimseo.utilities.model_data import decapsulate_length_one_array
 
 
 def test_result_decoding(tmp_wd):
@@ -51,6 +60,20 @@ def test_result_decoding(tmp_wd):
         assert_array_equal(model.get_output_data()[name], model_result["outputs"][name])
 
 
+def test_run_versions_start_time(tmp_wd):
+    """Check that only the runs started after a time are fetched."""
+    model = create_model(
+        "MockModelPersistent",
+        "LC1",
+        model_options=IntegratedModelSettings(archive_manager="MlflowArchive"),
+    )
+    model.execute()
+    run_id = model.archive_manager._current_run_id
+    assert list(model.archive_manager.get_run_versions()) == [run_id]
+    assert list(model.archive_manager.get_run_versions(start_time=1.0)) == [run_id]
+    assert model.archive_manager.get_run_versions(start_time=time() + 3600) == {}
+
+
 def test_cache_from_archive(tmp_wd):
     """Check that the model cache can be set from an archive.
 
@@ -110,3 +133,143 @@ def test_copy_persistent_files(tmp_wd):
     assert result["outputs"][MetaDataNames.directory_archive_job] == str(
         model.archive_manager.job_directory
     )
+
+
+def test_query(tmp_wd):
+    """Check that the runs can be found from conditions on their data."""
+    model = create_model(
+        "MockModel",
+        "LC1",
+        model_options=IntegratedModelSettings(archive_manager="MlflowArchive"),
+    )
+    model.cache = None
+    run_ids = []
+    for x1 in [0.25, 0.5, 1.0]:
+        model.execute({"x1": atleast_1d(x1)})
+        run_ids.append(model.archive_manager._current_run_id)
+
+    archive = model.archive_manager
+    assert sorted(archive.query(inputs={"x1": (0.3, None)})) == sorted(run_ids[1:])
+    assert archive.query(inputs={"x1": 0.25}) == run_ids[:1]
+    assert len(archive.query(metadata={MetaDataNames.error_code: 0})) == 3
+    assert not archive.query(metadata={MetaDataNames.model: "OtherModel"})
+    with pytest.raises(ValueError, match="cannot contain a quote"):
+        archive.query(metadata={MetaDataNames.model: "Other' or '1'='1"})
+
+
+def create_archive(array_size_threshold: int = 0) -> MlflowArchive:
+    """Create an MLflow archive in the current directory."""
+    return MlflowArchive(
+        PersistencyPolicy.DELETE_NEVER,
+        root_directory=Path.cwd(),
+        model_name="MyModel",
+        load_case_name="MyLoadCase",
+        array_size_threshold=array_size_threshold,
+    )
+
+
+@pytest.mark.parametrize(
+    ("array_size_threshold", "curve_size"), [(0, 2000), (100, 100)]
+)
+def test_publish_array_artifact(tmp_wd, array_size_threshold, curve_size):
+    """Check that the large arrays are stored as artifacts.
+
+    The arrays exceeding the length of a parameter value are also stored as artifacts.
+    """
+    archive = create_archive(array_size_threshold)
+    curve = linspace(0.0, 1.0, curve_size)
+    with mock.patch.object(
+        archive._mlflow_client, "log_batch", wraps=archive._mlflow_client.log_batch
+    ) as log_batch:
+        archive.publish({
+            "inputs": {"x": 1.0, "s": "a"},
+            "outputs": {"y": 2.0, "curve": curve},
+            "metadata": decapsulate_length_one_array(DEFAULT_METADATA),
+        })
+
+    # A single request for all the parameters, tags and metrics.
+    assert log_batch.call_count == 1
+    assert not [
+        metric
+        for metric in log_batch.call_args.kwargs["metrics"]
+        if metric.key == "curve"
+    ]
+    result = archive.get_result()
+    assert_array_equal(result["outputs"]["curve"], curve)
+    assert_array_equal(result["inputs"]["x"], atleast_1d(1.0))
+    assert_array_equal(result["inputs"]["s"], atleast_1d("a"))
+    assert_array_equal(result["outputs"]["y"], atleast_1d(2.0))
+    assert_array_equal(result["outputs"][MetaDataNames.error_code], atleast_1d(-666))
+
+
+def test_publish_batches(tmp_wd):
+    """Check that the data of a result are split into batches complying with the
+    limits of the tracking backend."""
+    archive = create_archive()
+    inputs = {f"s{i}": f"{i}" for i in range(150)}
+    curve = linspace(0.0, 1.0, 100)
+    with mock.patch.object(
+        archive._mlflow_client, "log_batch", wraps=archive._mlflow_client.log_batch
+    ) as log_batch:
+        archive.publish({
+            "inputs": inputs,
+            "outputs": {"curve": curve},
+            "metadata": decapsulate_length_one_array(DEFAULT_METADATA),
+        })
+
+    # 151 parameters, including the curve, while a batch has at most 100 parameters
+    # and tags.
+    assert log_batch.call_count == 2
+    n_step_metrics = sum(
+        metric.key == "curve"
+        for call in log_batch.call_args_list
+        for metric in call.kwargs["metrics"]
+    )
+    assert n_step_metrics == 100
+    result = archive.get_result()
+    assert_array_equal(result["inputs"]["s149"], atleast_1d("149"))
+    assert_array_equal(result["outputs"]["curve"], curve)
+
+
+def test_get_archived_results(tmp_wd, monkeypatch):
+    """Check that the archived results are retrieved by pages of a search request,
+    without a request per run."""
+    model = create_model(
+        "MockModel",
+        "LC1",
+        model_options=IntegratedModelSettings(archive_manager="MlflowArchive"),
+    )
+    model.cache = None
+    archive = model.archive_manager
+    run_ids = []
+    for x1 in [0.25, 0.5, 0.75, 1.0, 1.25]:
+        model.execute({"x1": atleast_1d(x1)})
+        run_ids.append(archive._current_run_id)
+
+    monkeypatch.setattr(MlflowArchive, "_SEARCH_PAGE_SIZE", 2)
+    monkeypatch.setattr(MlflowArchive, "_N_RUN_IDS_PER_SEARCH", 2)
+    with mock.patch.object(archive._mlflow_client, "get_run") as get_run:
+        results = archive.get_archived_results()
+        selected_results = archive.get_archived_results(
+            run_ids=[run_ids[3], run_ids[0], run_ids[4]]
+        )
+
+    assert not get_run.called
+    assert len(results) == 5
+    assert sorted(result["inputs"]["x1"][0] for result in results) == [
+        0.25,
+        0.5,
+        0.75,
+        1.0,
+        1.25,
+    ]
+    assert [result["inputs"]["x1"][0] for result in selected_results] == [
+        1.0,
+        0.25,
+        1.25,
+    ]
+    assert [result["ID"] for result in selected_results] == [1, 2, 3]
+    expected_result = archive.get_result(run_ids[3])
+    for group in ["inputs", "outputs"]:
+        for name, value in expected_result[group].items():
+            assert_array_equal(selected_results[0][group][name], value)
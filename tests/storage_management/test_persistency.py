@@ -15,19 +15,28 @@
 
 from __future__ import annotations
 
+import json
+import logging
+import os
+import shutil
 from copy import deepcopy
 from pathlib import Path
 
 import pytest
 from gemseo.core.discipline.discipline import Discipline
+from numpy import array
 from numpy.testing import assert_array_equal
 
 from vimseo.api import create_model
+from vimseo.core.caches.archive_sync import SYNC_TIME_MARGIN
+from vimseo.core.caches.archive_sync import ArchiveSyncManifest
 from vimseo.core.model_metadata import MetaDataNames
 from vimseo.problems.mock.mock_model_persistent.mock_model_persistent import (
     MockComponentStandalonePersistent_LC1,
 )
 from vimseo.storage_management.base_storage_manager import PersistencyPolicy
+from vimseo.storage_management.blob_store import BlobStore
+from vimseo.utilities.file_utils import FileTransferMethod
 
 
 @pytest.mark.parametrize("persistency_policy", list(PersistencyPolicy))
@@ -250,6 +259,86 @@ def test_cache_from_archive(tmp_wd):
     assert len(model.archive_manager.get_archived_results()) == 1
 
 
+def test_cache_from_archive_incremental(tmp_wd, caplog):
+    """Check that a cache from archive only imports the runs added to the archive
+    since the last synchronization, unless a run has been modified."""
+    model = create_model("MockModel", "LC1")
+    other_model = create_model("MockModel", "LC1")
+    model.execute({"x1": array([0.5])})
+    other_model.create_cache_from_archive()
+    assert len(other_model.cache) == 1
+    manifest = ArchiveSyncManifest.from_file("MockModel_LC1_from_archive_sync.json")
+    assert len(manifest.runs) == 1
+
+    model.execute({"x1": array([1.0])})
+    caplog.set_level(logging.INFO)
+    other_model.create_cache_from_archive()
+    assert "Importing 1 new runs" in caplog.text
+    assert len(other_model.cache) == 2
+
+    caplog.clear()
+    result_file = Path(next(iter(manifest.runs)))
+    mtime_ns = result_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(result_file, ns=(mtime_ns, mtime_ns))
+    other_model.create_cache_from_archive()
+    assert "Importing" not in caplog.text
+    assert len(other_model.cache) == 2
+
+    other_model.create_cache_from_archive(full_rebuild=True)
+    assert "Importing" not in caplog.text
+    assert len(other_model.cache) == 2
+
+
+def test_cache_from_archive_sync_time_margin(tmp_wd, caplog):
+    """Check the runs imported by an incremental synchronization of a cache from
+    archive, from the modification times of their result files."""
+    model = create_model("MockModel", "LC1")
+    other_model = create_model("MockModel", "LC1")
+    manifest_path = "MockModel_LC1_from_archive_sync.json"
+    result_files = set()
+
+    def execute(x1: float, seconds_before_last_sync: float) -> Path:
+        """Execute the model and set the modification time of the new result file."""
+        model.execute({"x1": array([x1])})
+        (result_file,) = set(model.archive_manager.get_run_versions()) - result_files
+        result_files.add(result_file)
+        mtime = (
+            ArchiveSyncManifest.from_file(manifest_path).last_sync_time
+            - seconds_before_last_sync
+        )
+        os.utime(result_file, (mtime, mtime))
+        return Path(result_file)
+
+    model.execute({"x1": array([0.5])})
+    result_files.update(model.archive_manager.get_run_versions())
+    first_result_file = Path(next(iter(result_files)))
+    other_model.create_cache_from_archive()
+    caplog.set_level(logging.INFO)
+
+    # A run written shortly before the last synchronization is imported.
+    execute(1.0, SYNC_TIME_MARGIN / 2)
+    other_model.create_cache_from_archive()
+    assert "Importing 1 new runs" in caplog.text
+    assert len(other_model.cache) == 2
+
+    # A run written long before the last synchronization is not listed.
+    caplog.clear()
+    execute(1.5, 2 * SYNC_TIME_MARGIN)
+    other_model.create_cache_from_archive()
+    assert "Importing 0 new runs" in caplog.text
+    assert len(other_model.cache) == 2
+
+    # An imported run modified since the last synchronization rebuilds the cache.
+    caplog.clear()
+    result = json.loads(first_result_file.read_text())
+    result["outputs"]["y1"] = 10.0
+    first_result_file.write_text(json.dumps(result))
+    other_model.create_cache_from_archive()
+    assert "Importing" not in caplog.text
+    assert len(other_model.cache) == 3
+    assert other_model.execute({"x1": array([0.5])})["y1"][0] == 10.0
+
+
 def test_persistent_file_names(tmp_wd):
     """Check that storage archive correctly stores the filenames to be persisted."""
 
@@ -282,3 +371,75 @@ def test_copy_of_fields(tmp_wd):
         / output_data["pyramid"][0]
         == model.archive_manager.job_directory / "Pyramid.vtk"
     )
+
+
+@pytest.mark.parametrize("transfer_method", list(FileTransferMethod))
+@pytest.mark.parametrize(
+    "scratch_persistency",
+    [PersistencyPolicy.DELETE_NEVER, PersistencyPolicy.DELETE_ALWAYS],
+)
+def test_persistent_file_transfer(tmp_wd, transfer_method, scratch_persistency):
+    """Check the transfer of the persistent files from the scratch to the archive."""
+    model = create_model(
+        "MockModelPersistent",
+        "LC1",
+        directory_scratch_persistency=scratch_persistency,
+        persistent_file_transfer_method=transfer_method,
+    )
+    model.set_cache(Discipline.CacheType.NONE)
+    model.execute()
+
+    assert model.archive_manager.file_transfer_method == transfer_method
+    scratch_directory = model._scratch_manager.job_directory
+    archive_directory = model.archive_manager.job_directory
+    assert scratch_directory.is_dir() == (
+        scratch_persistency == PersistencyPolicy.DELETE_NEVER
+    )
+    for file_name in model.archive_manager.persistent_file_names:
+        archive_file = archive_directory / file_name
+        assert archive_file.is_file()
+        if scratch_persistency == PersistencyPolicy.DELETE_ALWAYS:
+            continue
+
+        scratch_file = scratch_directory / file_name
+        if transfer_method == FileTransferMethod.MOVE:
+            assert not scratch_file.exists()
+        elif transfer_method == FileTransferMethod.HARDLINK:
+            assert scratch_file.samefile(archive_file)
+        else:
+            assert not scratch_file.samefile(archive_file)
+            assert scratch_file.read_bytes() == archive_file.read_bytes()
+
+
+def test_persistent_file_deduplication(tmp_wd):
+    """Check that the identical persistent files of several jobs are stored once."""
+    archive_directories = []
+    for _ in range(2):
+        model = create_model(
+            "MockModelPersistent",
+            "LC1",
+            archive_deduplicate_files=True,
+            directory_scratch_persistency=PersistencyPolicy.DELETE_ALWAYS,
+        )
+        model.set_cache(Discipline.CacheType.NONE)
+        model.execute()
+        archive_directories.append(model.archive_manager.job_directory)
+
+    blob_store = model.archive_manager.blob_store
+    file_names = model.archive_manager.persistent_file_names
+    blob_paths = list(blob_store.directory_path.glob("*/*"))
+    assert len(blob_paths) == len(file_names)
+    for file_name in file_names:
+        first_file, second_file = (
+            directory / file_name for directory in archive_directories
+        )
+        assert first_file.samefile(second_file)
+        assert blob_store.get_blob_path(BlobStore.hash_file(first_file)).samefile(
+            first_file
+        )
+
+    shutil.rmtree(archive_directories[0])
+    assert blob_store.collect_garbage() == 0
+    shutil.rmtree(archive_directories[1])
+    assert blob_store.collect_garbage() == len(file_names)
+    assert not any(blob_store.directory_path.glob("*/*"))
@@ -0,0 +1,99 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from __future__ import annotations
+
+import pytest
+from gemseo.algos.parameter_space import ParameterSpace
+from numpy import array
+from pandas.testing import assert_frame_equal
+
+from vimseo.core.batch_execution import BatchBackend
+from vimseo.problems.mock.mock_main.mock_model import MockModel
+from vimseo.tools.doe.adaptive_doe import AcquisitionCriterion
+from vimseo.tools.doe.adaptive_doe import AdaptiveDOETool
+
+
+@pytest.fixture
+def parameter_space():
+    """Create a space of parameters with scalar variable ``x1`` uniformly distributed
+    over [-1, 1]."""
+    parameter_space = ParameterSpace()
+    parameter_space.add_random_variable(
+        "x1", "OTUniformDistribution", size=1, lower=-1.0, upper=1.0
+    )
+    return parameter_space
+
+
+def test_adaptive_doe(tmp_wd, parameter_space):
+    """Check that an adaptive DOE stops as soon as its surrogate model is accurate
+    enough."""
+    result = AdaptiveDOETool().execute(
+        model=MockModel("LC1"),
+        parameter_space=parameter_space,
+        output_names=["y1"],
+        n_initial_samples=4,
+        batch_size=2,
+    )
+    assert result.is_converged
+    assert len(result.dataset) == 2 + 2 * len(result.quality_history)
+    assert len(result.dataset) < 50
+    assert result.quality_history[-1] >= 0.95
+    assert result.surrogate.execute({"x1": array([0.5])})["y1"][0] == pytest.approx(
+        6.0, rel=1e-2
+    )
+
+
+@pytest.mark.parametrize("criterion", AcquisitionCriterion)
+def test_adaptive_doe_budget(tmp_wd, parameter_space, criterion):
+    """Check that an adaptive DOE stops when its budget of samples is exhausted."""
+    result = AdaptiveDOETool().execute(
+        model=MockModel("LC1"),
+        parameter_space=parameter_space,
+        output_names=["y1"],
+        n_initial_samples=4,
+        max_samples=9,
+        batch_size=2,
+        quality_threshold=1.1,
+        criterion=criterion,
+    )
+    assert not result.is_converged
+    assert len(result.quality_history) == 4
+    x1 = result.dataset.get_view(variable_names="x1").to_numpy().ravel()
+    assert len(set(x1)) == 9
+    if criterion == AcquisitionCriterion.EXPECTED_IMPROVEMENT:
+        # The first batch refines the minimum of y1 = 2 * x1 + 3, at x1 = -1.
+        assert (x1[4:6] < -0.9).all()
+
+
+def test_parallel_adaptive_doe(tmp_wd, parameter_space):
+    """Check that the batches of an adaptive DOE can be executed in parallel."""
+    options = {
+        "parameter_space": parameter_space,
+        "output_names": ["y1"],
+        "n_initial_samples": 4,
+        "max_samples": 8,
+        "batch_size": 2,
+        "quality_threshold": 1.1,
+    }
+    result = AdaptiveDOETool().execute(model=MockModel("LC1"), **options)
+    parallel_result = AdaptiveDOETool().execute(
+        model=MockModel("LC1"),
+        n_processes=2,
+        backend=BatchBackend.THREAD,
+        **options,
+    )
+    assert_frame_equal(parallel_result.dataset, result.dataset)
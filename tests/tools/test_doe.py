@@ -15,19 +15,36 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+from unittest.mock import Mock
+
+import h5py
 import pytest
+from gemseo import compute_doe
 from gemseo.algos.parameter_space import ParameterSpace
 from gemseo.datasets.dataset import Dataset
 from gemseo.datasets.io_dataset import IODataset
+from numpy import array
 from numpy import full
+from numpy import isnan
 from numpy import vstack
 from numpy.testing import assert_array_equal
+from pandas.testing import assert_frame_equal
+from scipy.stats.qmc import Halton
 
+from vimseo.core.batch_execution import BatchBackend
 from vimseo.problems.mock.mock_main.mock_model import MockModel
 from vimseo.problems.mock.mock_main.mock_model import mock_model_lc2_overall_function
 from vimseo.tools.base_tool import BaseTool
+from vimseo.tools.doe import doe_generation
 from vimseo.tools.doe.custom_doe import CustomDOETool
 from vimseo.tools.doe.doe import DOETool
+from vimseo.tools.doe.doe_checkpoint import DOECheckpoint
+from vimseo.tools.doe.doe_dataset_store import DOEDatasetStore
+from vimseo.tools.doe.doe_dataset_store import LazyDOEDataset
+from vimseo.tools.doe.doe_generation import AUTO
+from vimseo.tools.doe.doe_generation import generate_samples
+from vimseo.tools.doe.doe_generation import get_doe_algo_name
 from vimseo.utilities.datasets import Variable
 from vimseo.utilities.datasets import generate_dataset
 
@@ -163,3 +180,381 @@ def test_save_and_load_pickle(tmp_wd, mock_model_doe):
     dataset_y1 = dataset.get_view(group_names="outputs", variable_names="y1")
     assert len(dataset_x1) == N_SAMPLES
     assert len(dataset_y1) == N_SAMPLES
+
+
+@pytest.mark.parametrize("backend", [BatchBackend.PROCESS, BatchBackend.THREAD])
+def test_parallel_doe(tmp_wd, parameter_space, mock_model_doe, backend):
+    """Check that a DOE executed by several workers matches the sequential one."""
+    doe_tool = DOETool()
+    result = doe_tool.execute(
+        model=MockModel("LC1"),
+        parameter_space=parameter_space,
+        output_names=["y1"],
+        algo="OT_OPT_LHS",
+        n_samples=N_SAMPLES,
+        n_processes=2,
+        backend=backend,
+    )
+    assert result.failed_sample_indices == []
+    assert_frame_equal(result.dataset, mock_model_doe.result.dataset)
+
+
+def test_parallel_custom_doe_with_failures(tmp_wd, monkeypatch):
+    """Check that the failed samples of a parallel custom DOE are reported."""
+    run = MockModel._run
+
+    def _run(self, input_data):
+        if input_data["x1"][0] < 0:
+            msg = "Negative x1."
+            raise ValueError(msg)
+        return run(self, input_data)
+
+    monkeypatch.setattr(MockModel, "_run", _run)
+    input_dataset = IODataset.from_array(
+        [[1.0], [-1.0], [0.5]],
+        variable_names=["x1"],
+        variable_names_to_group_names={"x1": IODataset.INPUT_GROUP},
+    )
+    result = CustomDOETool().execute(
+        model=MockModel("LC2"),
+        input_dataset=input_dataset,
+        output_names=["y1"],
+        n_processes=2,
+        backend=BatchBackend.THREAD,
+        skip_failed=True,
+    )
+    assert result.failed_sample_indices == [1]
+    y1 = result.dataset.get_view(variable_names="y1").to_numpy().ravel()
+    assert_array_equal(isnan(y1), [False, True, False])
+    assert_array_equal(
+        result.dataset.get_view(variable_names="x1").to_numpy().ravel(),
+        [1.0, -1.0, 0.5],
+    )
+
+
+@pytest.mark.parametrize("n_processes", [1, 2])
+def test_custom_doe_with_failures(tmp_wd, monkeypatch, n_processes):
+    """Check that a custom DOE raises an error at the first failed sample by
+    default."""
+    run = MockModel._run
+
+    def _run(self, input_data):
+        if input_data["x1"][0] < 0:
+            msg = "Negative x1."
+            raise RuntimeError(msg)
+        return run(self, input_data)
+
+    monkeypatch.setattr(MockModel, "_run", _run)
+    input_dataset = IODataset.from_array(
+        [[1.0], [-1.0], [0.5]],
+        variable_names=["x1"],
+        variable_names_to_group_names={"x1": IODataset.INPUT_GROUP},
+    )
+    with pytest.raises(RuntimeError, match="Negative x1"):
+        CustomDOETool().execute(
+            model=MockModel("LC2"),
+            input_dataset=input_dataset,
+            output_names=["y1"],
+            n_processes=n_processes,
+            backend=BatchBackend.THREAD,
+        )
+
+
+def test_large_doe_with_failures(tmp_wd, monkeypatch, parameter_space):
+    """Check that a DOE with more samples than a chunk raises an error at the first
+    failed sample by default."""
+    monkeypatch.setattr(MockModel, "_run", Mock(side_effect=RuntimeError("Failure.")))
+    with pytest.raises(RuntimeError, match="Failure"):
+        DOETool().execute(
+            model=MockModel("LC1"),
+            parameter_space=parameter_space,
+            algo="Halton",
+            n_samples=N_SAMPLES,
+            chunk_size=2,
+        )
+
+
+class _Interruption(BaseException):
+    """An interruption of the process executing a DOE."""
+
+
+@pytest.fixture
+def checkpoint_input_dataset():
+    """Create a dataset with a group named ``IODataset.INPUT_GROUP`` containing four
+    samples of the variable ``x1``."""
+    return IODataset.from_array(
+        [[0.1], [0.2], [0.3], [0.4]],
+        variable_names=["x1"],
+        variable_names_to_group_names={"x1": IODataset.INPUT_GROUP},
+    )
+
+
+def test_resume_custom_doe(tmp_wd, monkeypatch, checkpoint_input_dataset):
+    """Check that an interrupted custom DOE executes only the missing samples when
+    resumed."""
+    run = MockModel._run
+    executed_x1 = []
+
+    def _run(self, input_data):
+        if input_data["x1"][0] == 0.3 and not executed_x1:
+            raise _Interruption
+        return run(self, input_data)
+
+    monkeypatch.setattr(MockModel, "_run", _run)
+    options = {
+        "input_dataset": checkpoint_input_dataset,
+        "output_names": ["y1"],
+        "checkpoint": True,
+    }
+    with pytest.raises(_Interruption):
+        CustomDOETool(working_directory="doe").execute(
+            model=MockModel("LC2"), **options
+        )
+
+    checkpoint = DOECheckpoint(Path("doe") / DOECheckpoint.FILE_NAME, resume=True)
+    assert [index for index, _ in checkpoint] == [0, 1]
+
+    def _run(self, input_data):
+        executed_x1.append(input_data["x1"][0])
+        return run(self, input_data)
+
+    monkeypatch.setattr(MockModel, "_run", _run)
+    result = CustomDOETool(working_directory="doe").execute(
+        model=MockModel("LC2"), resume=True, **options
+    )
+    assert executed_x1 == [0.3, 0.4]
+    assert result.failed_sample_indices == []
+
+    reference = CustomDOETool(working_directory="reference").execute(
+        model=MockModel("LC2"), **options
+    )
+    assert_frame_equal(result.dataset, reference.dataset)
+
+
+def test_resume_custom_doe_with_other_samples(tmp_wd, checkpoint_input_dataset):
+    """Check that resuming a custom DOE from the checkpoint of another DOE raises an
+    error."""
+    options = {"output_names": ["y1"], "checkpoint": True}
+    CustomDOETool(working_directory="doe").execute(
+        model=MockModel("LC2"), input_dataset=checkpoint_input_dataset, **options
+    )
+    checkpoint_input_dataset.loc[1, (IODataset.INPUT_GROUP, "x1", 0)] = 0.5
+    with pytest.raises(ValueError, match=r"The sample 1 of the checkpoint file"):
+        CustomDOETool(working_directory="doe").execute(
+            model=MockModel("LC2"),
+            input_dataset=checkpoint_input_dataset,
+            resume=True,
+            **options,
+        )
+
+
+def test_resume_doe(tmp_wd, monkeypatch, mock_model_doe, parameter_space):
+    """Check that a resumed DOE reloads the samples of its checkpoint."""
+    options = {
+        "parameter_space": parameter_space,
+        "output_names": ["y1"],
+        "n_samples": N_SAMPLES,
+    }
+    DOETool(working_directory="doe").execute(
+        model=MockModel("LC1"), checkpoint=True, **options
+    )
+    monkeypatch.setattr(MockModel, "_run", None)
+    result = DOETool(working_directory="doe").execute(
+        model=MockModel("LC1"), resume=True, **options
+    )
+    assert result.failed_sample_indices == []
+    assert_frame_equal(result.dataset, mock_model_doe.result.dataset)
+
+
+def test_doe_checkpoint_incomplete_record(tmp_wd):
+    """Check that the incomplete last record of a checkpoint file is discarded."""
+    checkpoint = DOECheckpoint("doe_checkpoint.pickle")
+    checkpoint.append(0, {"x": array([0.0])})
+    checkpoint.append(1, {"x": array([1.0])})
+    size = checkpoint.file_path.stat().st_size
+    with checkpoint.file_path.open("ab") as f:
+        f.write(b"\x80\x04\x95")
+
+    checkpoint = DOECheckpoint("doe_checkpoint.pickle", resume=True)
+    assert checkpoint.file_path.stat().st_size == size
+    checkpoint.append(2, {"x": array([2.0])})
+    assert [index for index, _ in checkpoint] == [0, 1, 2]
+    assert_array_equal(list(checkpoint)[2][1]["x"], [2.0])
+
+
+def test_doe_checkpoint_truncated_record(tmp_wd):
+    """Check that the truncated last record of a checkpoint file is discarded."""
+    checkpoint = DOECheckpoint("doe_checkpoint.pickle")
+    checkpoint.append(0, {"x": array([0.0])})
+    size = checkpoint.file_path.stat().st_size
+    checkpoint.append(1, {"x": array([1.0])})
+    with checkpoint.file_path.open("r+b") as f:
+        f.truncate(checkpoint.file_path.stat().st_size - 10)
+
+    checkpoint = DOECheckpoint("doe_checkpoint.pickle", resume=True)
+    assert checkpoint.file_path.stat().st_size == size
+    assert [index for index, _ in checkpoint] == [0]
+
+
+def test_doe_checkpoint_corrupted_record(tmp_wd):
+    """Check that a corrupted record before the last one raises an error."""
+    checkpoint = DOECheckpoint("doe_checkpoint.pickle")
+    checkpoint.append(0, {"x": array([0.0])})
+    size = checkpoint.file_path.stat().st_size
+    checkpoint.append(1, {"x": array([1.0])})
+    checkpoint.append(2, {"x": array([2.0])})
+    with checkpoint.file_path.open("r+b") as f:
+        f.seek(size)
+        f.write(b"\xff")
+
+    with pytest.raises(
+        ValueError,
+        match=rf"The record starting at byte {size} of the checkpoint file .* "
+        "is corrupted",
+    ):
+        DOECheckpoint("doe_checkpoint.pickle", resume=True)
+
+    with pytest.raises(ValueError, match=r"is corrupted"):
+        list(checkpoint)
+
+
+def test_store_doe(tmp_wd, mock_model_doe, parameter_space):
+    """Check that a DOE stored on disk chunk by chunk is the DOE held in memory, and
+    that its result is pickled without the dataset."""
+    doe_tool = DOETool(working_directory="doe")
+    result = doe_tool.execute(
+        model=MockModel("LC1"),
+        parameter_space=parameter_space,
+        output_names=["y1"],
+        algo="OT_OPT_LHS",
+        n_samples=N_SAMPLES,
+        chunk_size=2,
+        store_dataset=True,
+    )
+    assert isinstance(result.dataset, LazyDOEDataset)
+    assert (
+        result.dataset.file_path == (Path("doe") / DOEDatasetStore.FILE_NAME).absolute()
+    )
+    assert result.failed_sample_indices == []
+    reference = mock_model_doe.result.dataset
+    assert_frame_equal(result.dataset.to_dataset(), reference)
+    assert_array_equal(
+        result.dataset.get_variable("y1", [0, 2]),
+        reference.get_view(variable_names="y1").to_numpy()[[0, 2]],
+    )
+    assert [
+        len(chunk) for chunk in result.dataset.iter_chunks(2, variable_names=["y1"])
+    ] == [2, 2, 1]
+
+    doe_tool.save_results()
+    result_path = doe_tool.working_directory / "DOETool_result.pickle"
+    assert result_path.stat().st_size < 4096
+    dataset = BaseTool.load_results(result_path).dataset
+    assert isinstance(dataset, LazyDOEDataset)
+    assert_frame_equal(
+        dataset.get_view(variable_names="y1"), reference.get_view(variable_names="y1")
+    )
+
+
+def test_store_doe_opened_once(tmp_wd, monkeypatch, parameter_space):
+    """Check that the file of a DOE stored on disk is opened once for writing."""
+    file = h5py.File
+    modes = []
+
+    def open_file(file_path, mode="r", **kwargs):
+        if Path(file_path).name == DOEDatasetStore.FILE_NAME:
+            modes.append(mode)
+        return file(file_path, mode, **kwargs)
+
+    monkeypatch.setattr(h5py, "File", open_file)
+    DOETool(working_directory="doe").execute(
+        model=MockModel("LC1"),
+        parameter_space=parameter_space,
+        output_names=["y1"],
+        algo="OT_OPT_LHS",
+        n_samples=N_SAMPLES,
+        chunk_size=2,
+        store_dataset=True,
+    )
+    assert modes.count("a") == 1
+
+
+def test_store_custom_doe_with_failures(tmp_wd, monkeypatch, checkpoint_input_dataset):
+    """Check that the failed samples of a custom DOE stored on disk are NaN."""
+    run = MockModel._run
+
+    def _run(self, input_data):
+        if input_data["x1"][0] == 0.2:
+            msg = "Failed sample."
+            raise ValueError(msg)
+        return run(self, input_data)
+
+    monkeypatch.setattr(MockModel, "_run", _run)
+    result = CustomDOETool().execute(
+        model=MockModel("LC2"),
+        input_dataset=checkpoint_input_dataset,
+        output_names=["y1"],
+        chunk_size=3,
+        checkpoint=True,
+        store_dataset=True,
+        skip_failed=True,
+    )
+    assert result.failed_sample_indices == [1]
+    assert result.dataset.failed_sample_indices == [1]
+    assert len(result.dataset) == 4
+    assert_array_equal(
+        isnan(result.dataset.get_variable("y1").ravel()), [False, True, False, False]
+    )
+    assert_array_equal(result.dataset.get_variable("x1").ravel(), [0.1, 0.2, 0.3, 0.4])
+
+
+@pytest.mark.parametrize(
+    ("n_samples", "dimension", "algo_name"),
+    [(100, 2, "OT_OPT_LHS"), (20000, 10, "Halton"), (20000, 50, "LHS")],
+)
+def test_get_doe_algo_name(n_samples, dimension, algo_name):
+    """Check the DOE algorithm selected from the size of the DOE."""
+    assert get_doe_algo_name(n_samples, dimension) == algo_name
+
+
+def test_generate_samples_in_chunks(parameter_space):
+    """Check that the chunks of a Halton sequence form the DOE generated at once."""
+    chunks = list(generate_samples(parameter_space, "Halton", 10, 4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert_array_equal(
+        vstack(chunks), compute_doe(parameter_space, algo_name="Halton", n_samples=10)
+    )
+
+
+def test_doe_in_chunks(tmp_wd, parameter_space):
+    """Check that a DOE executed chunk by chunk is the DOE executed at once."""
+    options = {
+        "parameter_space": parameter_space,
+        "output_names": ["y1"],
+        "algo": "Halton",
+        "n_samples": N_SAMPLES,
+    }
+    result = DOETool().execute(
+        model=MockModel("LC1"), chunk_size=2, skip_failed=True, **options
+    )
+    reference = DOETool().execute(model=MockModel("LC1"), **options)
+    assert_frame_equal(result.dataset, reference.dataset)
+
+
+def test_generate_samples_lazily(monkeypatch):
+    """Check that the chunks of a large DOE are generated only when requested."""
+    chunk_sizes = []
+
+    class Engine(Halton):
+        def random(self, n=1, **kwargs):
+            chunk_sizes.append(n)
+            return super().random(n, **kwargs)
+
+    monkeypatch.setitem(doe_generation._NAMES_TO_ENGINES, "Halton", Engine)
+    parameter_space = ParameterSpace()
+    parameter_space.add_random_variable(
+        "x", "OTUniformDistribution", size=2, lower=0.0, upper=1.0
+    )
+    chunks = generate_samples(parameter_space, AUTO, 10_000, 4)
+    assert next(chunks).shape == (4, 2)
+    assert chunk_sizes == [4]
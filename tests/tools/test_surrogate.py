@@ -29,6 +29,7 @@ from vimseo.problems.beam_analytic.reference_dataset_builder import (
 )
 from vimseo.problems.mock.mock_main.mock_model import MockModel
 from vimseo.tools.base_tool import BaseTool
+from vimseo.tools.doe.doe_dataset_store import DOEDatasetStore
 from vimseo.tools.surrogate.surrogate import LEARN
 from vimseo.tools.surrogate.surrogate import LOO
 from vimseo.tools.surrogate.surrogate import SurrogateTool
@@ -125,6 +126,25 @@ def test_mockmodel_surrogate(tmp_wd, mock_dataset, eval_methods):
         assert results.qualities["MSEMeasure"][m] == pytest.approx(0, abs=1e-20)
 
 
+def test_surrogate_from_lazy_dataset(tmp_wd, mock_dataset):
+    """Check that a surrogate model can be built from a DOE dataset stored on disk."""
+    store = DOEDatasetStore(DOEDatasetStore.FILE_NAME)
+    data = mock_dataset.to_dict_of_arrays(by_group=False)
+    store.write_inputs(0, [{"x1": x1} for x1 in data["x1"]])
+    for index, y1 in enumerate(data["y1"]):
+        store.write_outputs(index, {"y1": y1, "y2": -y1}, ["y1", "y2"])
+
+    results = SurrogateTool().execute(
+        model=MockModel("LC1"),
+        dataset=store.dataset,
+        algo="LinearRegressor",
+        output_names=["y1"],
+        evaluation_methods=[LOO, LEARN],
+    )
+    assert results.model.output_grammar.names == {"y1"}
+    assert results.qualities["MSEMeasure"][LEARN] == pytest.approx(0, abs=1e-20)
+
+
 def test_mock_model_surrogate_selection(tmp_wd, mock_dataset):
     """Use default candidate algorithms for selection of the best surrogate model
     according to specific quality measure and evaluation method for selection."""
@@ -17,9 +17,12 @@ from __future__ import annotations
 
 import pytest
 from numpy import atleast_1d
+from numpy.testing import assert_array_equal
 
 from vimseo.api import create_model
+from vimseo.core.caches import ModelCacheType
 from vimseo.utilities.cache_manipulator import cache_delete_entry
+from vimseo.utilities.cache_migration import cache_migrate_to_sharded
 from vimseo.utilities.cache_viewer import cache_viewer
 
 
@@ -59,3 +62,26 @@ def test_cache_entry_delete(tmp_wd, prepare_model_with_two_cache_entries):
     model.EXTRA_INPUT_GRAMMAR_CHECK = True
     df = cache_viewer(model._cache_file_path)
     assert df.shape == (1, 5 + nb_metadata_vars)
+
+
+def test_cache_migrate_to_sharded(tmp_wd, prepare_model_with_two_cache_entries):
+    """Check that the entries of an HDF5 cache are copied to a sharded cache, which can
+    then be used by a model."""
+    model = prepare_model_with_two_cache_entries
+
+    cache = cache_migrate_to_sharded(model._cache_file_path, "sharded_cache")
+    assert len(cache) == 2
+    for entry, expected_entry in zip(
+        cache.get_all_entries(), model.cache.get_all_entries(), strict=True
+    ):
+        for name, value in expected_entry.outputs.items():
+            assert_array_equal(entry.outputs[name], value)
+
+    model = create_model(
+        "MockModel",
+        "LC1",
+        cache_type=ModelCacheType.SHARDED,
+        cache_file_path="sharded_cache",
+    )
+    model.execute({"x1": atleast_1d(-0.5)})
+    assert len(model.cache) == 2